@@ -21,8 +21,12 @@
 
 from collections import OrderedDict
 from accelergy.utils.utils import *
-from accelergy.parsing_utils import count_num_identical_comps
-from accelergy.plug_in_interface.query_plug_ins import get_best_estimate
+from accelergy.utils.component_name import ComponentName
+from accelergy.plug_in_interface.query_plug_ins import (
+    estimate_unique_queries,
+    get_best_estimates,
+)
+from accelergy.utils.parallel import parallel_map_batches
 
 
 class AreaReferenceTableGenerator:
@@ -31,21 +35,35 @@ class AreaReferenceTableGenerator:
         cc_components = info["ccs"]
         self.precision = info["precision"]
         self.estimation_plug_ins = info["plug_ins"]
+        self.estimation_cache = info.get("estimation_cache", None)
+        self.jobs = info.get("jobs", 1)
+        self.process_pool = info.get("process_pool", None)
         self.parser_version = info["parser_version"]
         self.ART = ART(self.parser_version)
 
+        # Collect the queries of all components, estimate them (possibly in parallel), then
+        # generate the entries in component order
+        queries = []
         for pc_name, pc in pc_components.items():
-            self.generate_pc_ART(pc)
+            queries.append(self.get_area_query(pc))
         for cc_name, cc in cc_components.items():
-            self.generate_cc_ART(cc)
+            for subcomp_name, subcomp_obj in cc.get_subcomponents().items():
+                queries.append(self.get_area_query(subcomp_obj))
+        estimations = iter(self.eval_primitive_areas(queries))
+        for pc_name, pc in pc_components.items():
+            self.generate_pc_ART(pc, estimations)
+        for cc_name, cc in cc_components.items():
+            self.generate_cc_ART(cc, estimations)
 
-    def generate_pc_ART(self, pc):
-        pc_name = pc.get_name()
-        estimation_plug_in_interface = {
-            "class_name": pc.get_class_name(),
-            "attributes": pc.get_attributes(),
+    def get_area_query(self, component):
+        return {
+            "class_name": component.get_class_name(),
+            "attributes": component.get_attributes(),
         }
-        estimation = self.eval_primitive_area(estimation_plug_in_interface)
+
+    def generate_pc_ART(self, pc, estimations):
+        pc_name = pc.get_name()
+        estimation = next(estimations)
         estimated_area, estimator_name = (
             estimation.get_value() * 1e12,
             estimation.estimator_name,
@@ -60,22 +78,19 @@ class AreaReferenceTableGenerator:
             }
         )
 
-    def generate_cc_ART(self, cc):
+    def generate_cc_ART(self, cc, estimations):
         cc_name = cc.get_name()
         cc_area = 0
         estimators = []
         for subcomp_name, subcomp_obj in cc.get_subcomponents().items():
-            estimation_plug_in_interface = {
-                "class_name": subcomp_obj.get_class_name(),
-                "attributes": subcomp_obj.get_attributes(),
-            }
-            estimation = self.eval_primitive_area(estimation_plug_in_interface)
+            estimation = next(estimations)
             estimated_area, estimator_name = (
                 estimation.get_value() * 1e12,
                 estimation.estimator_name,
             )
             factored_estimated_area = estimated_area * subcomp_obj.get_area_scale()
-            pc_area = factored_estimated_area * count_num_identical_comps(subcomp_name)
+            n_identical = ComponentName.get(subcomp_name).n_identical
+            pc_area = factored_estimated_area * n_identical
             cc_area += pc_area
             estimators.append(
                 OrderedDict(
@@ -99,9 +114,29 @@ class AreaReferenceTableGenerator:
     def get_ART(self):
         return self.ART
 
-    def eval_primitive_area(self, estimator_plug_in_interface):
-        return get_best_estimate(
-            self.estimation_plug_ins, estimator_plug_in_interface, False
+    def eval_primitive_areas(self, estimator_plug_in_interfaces):
+        # Identical components are estimated once
+        return estimate_unique_queries(
+            self.eval_unique_primitive_areas,
+            estimator_plug_in_interfaces,
+            "primitive areas",
+        )
+
+    def eval_unique_primitive_areas(self, estimator_plug_in_interfaces):
+        if self.process_pool is not None:
+            return self.process_pool.get_best_estimates(
+                self.estimation_plug_ins,
+                estimator_plug_in_interfaces,
+                False,
+                self.estimation_cache,
+            )
+        # Queries waiting on the same plug-in are sent to it in batches
+        return parallel_map_batches(
+            lambda q: get_best_estimates(
+                self.estimation_plug_ins, q, False, self.estimation_cache
+            ),
+            estimator_plug_in_interfaces,
+            self.jobs,
         )
 
 
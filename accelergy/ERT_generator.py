@@ -18,15 +18,24 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import itertools
 import math
 from collections import OrderedDict
 from accelergy.utils.utils import *
-from accelergy.parsing_utils import (
-    count_num_identical_comps,
-    comp_name_within_range,
-    propagate_required_keys,
+from accelergy.utils.component_name import ComponentName
+from accelergy.action import ArgumentSpace
+from accelergy.parsing_utils import comp_name_within_range, propagate_required_keys
+from accelergy.plug_in_interface.plug_in_index import (
+    PlugInIndex,
+    resolve_lazy_plug_ins,
 )
-from accelergy.plug_in_interface.query_plug_ins import get_best_estimate
+from accelergy.primitive_action_plan import PrimitiveActionPlan
+from accelergy.plug_in_interface.query_plug_ins import (
+    estimate_unique_queries,
+    get_best_estimates,
+    plugin2name,
+)
+from accelergy.utils.parallel import parallel_map_batches
 
 
 def ERT_dict_to_obj(ERT_info):
@@ -37,19 +46,43 @@ def ERT_dict_to_obj(ERT_info):
     for component_name, actions_dict in ERT_dict.items():
         for action_name, action_info_list in actions_dict.items():
             for action_info in action_info_list:
-                arg_combo = action_info["arguments"]
-                energy = action_info["energy"]
-                action_dict = {
-                    "name": component_name,
-                    "action_name": action_name,
-                    "arguments": arg_combo,
-                    "energy": energy,
-                    "estimator": "N/A",
-                }
-                ert_obj.add_action_entry(action_dict)
+                if "argument_energies" in action_info:
+                    entries = expand_separable_action_table(action_info, precision)
+                else:
+                    entries = [(action_info["arguments"], action_info["energy"])]
+                for arg_combo, energy in entries:
+                    action_dict = {
+                        "name": component_name,
+                        "action_name": action_name,
+                        "arguments": arg_combo,
+                        "energy": energy,
+                        "estimator": "N/A",
+                    }
+                    ert_obj.add_action_entry(action_dict)
     return ert_obj
 
 
+def expand_separable_action_table(table, precision):
+    """
+    Returns the (arguments, energy) of every combination of argument values of a separable
+    action table. The table has the arguments and energy of a base combination, and for each
+    separable argument, the energy added by each value of the argument.
+    """
+    argument_energies = table["argument_energies"]
+    names = list(argument_energies)
+    entries = []
+    # The first argument varies fastest
+    for values in itertools.product(
+        *(argument_energies[name].items() for name in reversed(names))
+    ):
+        arguments, energy = dict(table["arguments"]), table["energy"]
+        for name, (value, added_energy) in zip(reversed(names), values):
+            arguments[name] = value
+            energy += added_energy
+        entries.append((arguments, round_sigfig(energy, precision)))
+    return entries
+
+
 class EnergyReferenceTableGenerator:
     def __init__(self, info):
         pc_components = info["pcs"]
@@ -57,96 +90,252 @@ class EnergyReferenceTableGenerator:
         self.parser_version = info["parser_version"]
         self.precision = info["precision"]
         self.estimation_plug_ins = info["plug_ins"]
+        self.estimation_cache = info.get("estimation_cache", None)
+        self.jobs = info.get("jobs", 1)
+        self.process_pool = info.get("process_pool", None)
+        self.compact_ERT = info.get("compact_ERT", False)
         self.ERT = ERT(self.parser_version, self.precision)
-
-        for pc_name, pc in pc_components.items():
-            self.generate_pc_ERT(pc)
+        self.primitive_action_plan = PrimitiveActionPlan()
+
+        # Collect the queries of all components, estimate them (possibly in parallel), then
+        # generate the entries in component order
+        pc_actions = {
+            pc_name: [
+                PrimitiveActionEstimations(pc, action, argument_space)
+                for action, argument_space in pc.get_argument_spaces()
+            ]
+            for pc_name, pc in pc_components.items()
+        }
+        queries = [
+            query
+            for actions in pc_actions.values()
+            for action in actions
+            for query in action.take_queries()
+        ]
         for cc_name, cc in cc_components.items():
-            self.generat_cc_ERT(cc)
+            queries += self.compile_cc_actions(cc)
+        estimations = iter(self.eval_primitive_action_energies(queries))
+        for actions in pc_actions.values():
+            for action in actions:
+                action.add_estimations(estimations)
+        self.estimate_separable_actions(
+            [a for actions in pc_actions.values() for a in actions if a.deferred]
+        )
+        for pc_name, pc in pc_components.items():
+            self.generate_pc_ERT(pc, pc_actions[pc_name])
+        self.generate_cc_ERTs(cc_components, estimations)
 
     def get_ERT(self):
         return self.ERT
 
-    def generate_pc_ERT(self, pc):
+    def get_primitive_action_plan(self):
+        return self.primitive_action_plan
+
+    def estimate_separable_actions(self, actions):
+        """
+        Estimates the rest of the argument combinations of actions with several varying
+        arguments. The plug-in that estimated the first combination decides which arguments
+        are separable. If the other estimations are not all from that plug-in, every
+        combination is estimated.
+        """
+        for action in actions:
+            action.set_separable_arguments(
+                self.get_separable_arguments(action.queries[0], action.estimations[0])
+            )
+        self.estimate_pending_queries(actions)
+        for action in actions:
+            if action.separable_arguments and not action.estimated_by_one_plug_in():
+                action.set_separable_arguments(())
+        self.estimate_pending_queries(actions)
+
+    def estimate_pending_queries(self, actions):
+        queries = [query for action in actions for query in action.take_queries()]
+        if queries:
+            estimations = iter(self.eval_primitive_action_energies(queries))
+            for action in actions:
+                action.add_estimations(estimations)
+
+    def get_separable_arguments(self, query, estimation):
+        """The arguments that the plug-in that made the estimation declares separable"""
+        plug_ins = self.estimation_plug_ins
+        if isinstance(plug_ins, PlugInIndex):
+            plug_ins = plug_ins.get_candidates(
+                query["class_name"], query["action_name"]
+            )
+        else:
+            plug_ins = resolve_lazy_plug_ins(
+                plug_ins, query["class_name"], query["action_name"]
+            )
+        for plug_in in plug_ins:
+            if plugin2name(plug_in) == estimation.estimator_name:
+                get_separable_arguments = getattr(
+                    plug_in, "get_separable_arguments", None
+                )
+                if get_separable_arguments is not None:
+                    return tuple(get_separable_arguments(query["action_name"]))
+        return ()
+
+    def generate_pc_ERT(self, pc, pc_actions):
         pc_name = pc.get_name()
-        for pc_action_obj in pc.get_actions():
-            action_name = pc_action_obj.get_name()
-            arguments = pc_action_obj.get_arguments()
-            estimation_plug_in_interface = {
-                "class_name": pc.get_class_name(),
-                "attributes": pc.get_attributes(),
-                "action_name": action_name,
-                "arguments": arguments,
-            }
-            estimation = self.eval_primitive_action_energy(estimation_plug_in_interface)
-            estimation.value *= pc.get_energy_scale()
+        for pc_action in pc_actions:
+            if pc_action.separable_arguments:
+                self.generate_separable_pc_ERT(pc, pc_action)
+                continue
+            for combination in pc_action.argument_space:
+                i = pc_action.indices[pc_action.get_key(combination)]
+                query, estimation = pc_action.queries[i], pc_action.estimations[i]
+                estimation.value *= pc.get_energy_scale()
+                self.ERT.add_action_entry(
+                    {
+                        "name": pc_name,
+                        "action_name": query["action_name"],
+                        "arguments": query["arguments"],
+                        "energy": round_sigfig(
+                            estimation.get_value() * 1e12, self.precision
+                        ),
+                        "estimator": estimation.estimator_name,
+                    }
+                )
+
+    def generate_separable_pc_ERT(self, pc, pc_action):
+        """Generates an entry for every combination from the energies along each axis"""
+        pc_name, action_name = pc.get_name(), pc_action.action.get_name()
+        estimator_name = pc_action.estimations[0].estimator_name
+        scale = pc.get_energy_scale() * 1e12
+        location = f"attributes for {pc.get_class_name()}.{action_name}"
+        for combination in pc_action.argument_space:
+            energy = sum(pc_action.get_energy_terms(combination)) * scale
+            propagate_required_keys(
+                pc.get_attributes(), combination, location, action_keys=True
+            )
             self.ERT.add_action_entry(
                 {
                     "name": pc_name,
                     "action_name": action_name,
-                    "arguments": arguments,
-                    "energy": round_sigfig(estimation.get_value() * 1e12, self.precision),
-                    "estimator": estimation.estimator_name,
+                    "arguments": combination,
+                    "energy": round_sigfig(energy, self.precision),
+                    "estimator": estimator_name,
                 }
             )
+        if not self.compact_ERT:
+            return
+        for combination in pc_action.get_base_combinations():
+            base_energy, *_ = pc_action.get_energy_terms(combination)
+            argument_energies = OrderedDict()
+            for i, name in enumerate(pc_action.separable_arguments):
+                argument_energies[name] = OrderedDict()
+                for value in pc_action.argument_space.axes[name]:
+                    terms = pc_action.get_energy_terms({**combination, name: value})
+                    argument_energies[name][value] = round_sigfig(
+                        terms[i + 1] * scale, self.precision
+                    )
+            propagate_required_keys(
+                pc.get_attributes(), combination, location, action_keys=True
+            )
+            self.ERT.add_separable_action_table(
+                pc_name,
+                OrderedDict(
+                    {
+                        "name": action_name,
+                        "arguments": combination,
+                        "energy": round_sigfig(base_energy * scale, self.precision),
+                        "argument_energies": argument_energies,
+                    }
+                ),
+            )
 
-    def generat_cc_ERT(self, cc):
+    def compile_cc_actions(self, cc):
+        """
+        Adds a row to the primitive action plan for each action of a compound component and
+        returns the query of each primitive action, in order.
+        """
         cc_name = cc.get_name()
         primitive_type = cc.get_primitive_type()
         sub_base_name_map = self.construct_sub_base_name_map(cc)
-
+        queries = []
         for cc_action_obj in cc.get_actions():
-            primitive_action_estimations = []
             cc_action_name = cc_action_obj.get_name()
-            cc_arguments = cc_action_obj.get_arguments()
             if primitive_type is not None:
-                estimation_plug_in_interface = {
+                query = {
                     "class_name": primitive_type,
                     "attributes": cc.get_attributes(),
                     "action_name": cc_action_name,
-                    "arguments": cc_arguments,
+                    "arguments": cc_action_obj.get_arguments(),
                 }
-                estimation = self.eval_primitive_action_energy(
-                    estimation_plug_in_interface
+                self.primitive_action_plan.add_row(
+                    (cc_name, cc_action_obj), [(query, 1, None)]
                 )
-                energy = estimation.get_value() * 1e12
-                primitive_action_estimations = estimation.estimator_name
-            else:
-                energy = 0
-                primitive_action_tuples = cc_action_obj.get_primitive_list()
-                for primitive_action_tuple in primitive_action_tuples:
-                    subcomp_name = primitive_action_tuple[0]
-                    subaction_obj = primitive_action_tuple[1]
-                    subcomp_obj = sub_base_name_map[remove_brackets(subcomp_name)]
-                    estimation_plug_in_interface = {
-                        "class_name": subcomp_obj.get_class_name(),
-                        "attributes": subcomp_obj.get_attributes(),
-                        "action_name": subaction_obj.get_name(),
-                        "arguments": subaction_obj.get_arguments(),
-                    }
-                    propagate_required_keys(
-                        estimation_plug_in_interface["attributes"],
-                        estimation_plug_in_interface["arguments"],
-                        f"attributes for {cc_name}.{cc_action_name}",
-                        action_keys=True,
-                    )
-                    estimation = self.eval_primitive_action_energy(
-                        estimation_plug_in_interface
-                    )
-                    # check if the subcomponent name is a list, if so, take it into account using list length
-                    estimated_energy = estimation.get_value() * 1e12
-                    estimator_name = estimation.estimator_name
-                    total_identical_comps = count_num_identical_comps(subcomp_name)
-                    # accumulate energy (consider energy_scale and # of identical subactions)
-                    energy += (
-                        estimated_energy
-                        * subaction_obj.get_energy_scale()
-                        * total_identical_comps
-                        * subcomp_obj.get_energy_scale()
+                queries.append(query)
+                continue
+            entries = []
+            for subcomp_name, subaction_obj in cc_action_obj.get_primitive_list():
+                subcomp_name_obj = ComponentName.get(subcomp_name)
+                subcomp_obj = sub_base_name_map[subcomp_name_obj.base_name]
+                estimation_plug_in_interface = {
+                    "class_name": subcomp_obj.get_class_name(),
+                    "attributes": subcomp_obj.get_attributes(),
+                    "action_name": subaction_obj.get_name(),
+                    "arguments": subaction_obj.get_arguments(),
+                }
+                propagate_required_keys(
+                    estimation_plug_in_interface["attributes"],
+                    estimation_plug_in_interface["arguments"],
+                    f"attributes for {cc_name}.{cc_action_name}",
+                    action_keys=True,
+                )
+                # energy_scale and # of identical subactions
+                multiplier = (
+                    subaction_obj.get_energy_scale()
+                    * subcomp_name_obj.n_identical
+                    * subcomp_obj.get_energy_scale()
+                )
+                entries.append(
+                    (
+                        estimation_plug_in_interface,
+                        multiplier,
+                        (subcomp_name, subaction_obj),
                     )
-                    primitive_action_estimations.append(
-                        (subcomp_name, subaction_obj, estimator_name, estimated_energy)
+                )
+                queries.append(estimation_plug_in_interface)
+            self.primitive_action_plan.add_row((cc_name, cc_action_obj), entries)
+        return queries
+
+    def generate_cc_ERTs(self, ccs, estimations):
+        """
+        Generates the entries of the compound components from the estimations of the queries
+        of compile_cc_actions: the energies of all actions are one product of the primitive
+        action plan with the energies of the distinct queries.
+        """
+        plan = self.primitive_action_plan
+        query_estimations = plan.get_column_values(list(estimations))
+        energies = [estimation.get_value() * 1e12 for estimation in query_estimations]
+        action_energies = iter(plan.multiply(energies))
+        rows = iter(range(plan.shape[0]))
+        for cc in ccs.values():
+            self.generat_cc_ERT(cc, action_energies, rows, query_estimations, energies)
+
+    def generat_cc_ERT(self, cc, action_energies, rows, query_estimations, energies):
+        cc_name = cc.get_name()
+        primitive_type = cc.get_primitive_type()
+
+        for cc_action_obj in cc.get_actions():
+            cc_action_name = cc_action_obj.get_name()
+            cc_arguments = cc_action_obj.get_arguments()
+            energy = next(action_energies)
+            row = self.primitive_action_plan.get_row(next(rows))
+            if primitive_type is not None:
+                ((column, _, _),) = row
+                primitive_action_estimations = query_estimations[column].estimator_name
+            else:
+                primitive_action_estimations = [
+                    (
+                        subcomp_name,
+                        subaction_obj,
+                        query_estimations[column].estimator_name,
+                        energies[column],
                     )
+                    for column, _, (subcomp_name, subaction_obj) in row
+                ]
 
             self.ERT.add_action_entry(
                 {
@@ -166,22 +355,152 @@ class EnergyReferenceTableGenerator:
     def construct_sub_base_name_map(self, cc):
         sub_base_name_map = {}
         for subcomp_name, subcomp_obj in cc.get_subcomponents().items():
-            subcomp_base_name = remove_brackets(subcomp_name)
+            subcomp_base_name = ComponentName.get(subcomp_name).base_name
             sub_base_name_map[subcomp_base_name] = subcomp_obj
         return sub_base_name_map
 
-    def eval_primitive_action_energy(self, estimator_plug_in_interface):
-        name = estimator_plug_in_interface["class_name"]
-        action_name = estimator_plug_in_interface["action_name"]
-        propagate_required_keys(
-            estimator_plug_in_interface["attributes"],
-            estimator_plug_in_interface["arguments"],
-            f"attributes for {name}.{action_name}",
-            action_keys=True,
+    def eval_primitive_action_energies(self, estimator_plug_in_interfaces):
+        for estimator_plug_in_interface in estimator_plug_in_interfaces:
+            name = estimator_plug_in_interface["class_name"]
+            action_name = estimator_plug_in_interface["action_name"]
+            propagate_required_keys(
+                estimator_plug_in_interface["attributes"],
+                estimator_plug_in_interface["arguments"],
+                f"attributes for {name}.{action_name}",
+                action_keys=True,
+            )
+        # The same primitive action often appears in many components, so each distinct
+        # query is estimated once
+        return estimate_unique_queries(
+            self.eval_unique_primitive_action_energies,
+            estimator_plug_in_interfaces,
+            "primitive actions",
         )
-        return get_best_estimate(
-            self.estimation_plug_ins, estimator_plug_in_interface, True
+
+    def eval_unique_primitive_action_energies(self, estimator_plug_in_interfaces):
+        if self.process_pool is not None:
+            return self.process_pool.get_best_estimates(
+                self.estimation_plug_ins,
+                estimator_plug_in_interfaces,
+                True,
+                self.estimation_cache,
+            )
+        # Queries waiting on the same plug-in are sent to it in batches
+        return parallel_map_batches(
+            lambda q: get_best_estimates(
+                self.estimation_plug_ins, q, True, self.estimation_cache
+            ),
+            estimator_plug_in_interfaces,
+            self.jobs,
+        )
+
+
+class PrimitiveActionEstimations:
+    """
+    The queries and estimations of the argument combinations of one action of a primitive
+    component. If the arguments are separable, only the combinations that vary at most one
+    separable argument from its first value are estimated. The energy of any other
+    combination is the energy with the separable arguments at their first values (the base
+    combination) plus the change from each separable argument taking its value.
+
+    Actions with several varying arguments are deferred: only their first combination is
+    estimated until set_separable_arguments is called with the separable arguments.
+    """
+
+    def __init__(self, pc, action, argument_space):
+        self.pc = pc
+        self.action = action
+        self.argument_space = argument_space
+        self.separable_arguments = ()
+        self.queries, self.estimations, self.indices = [], [], {}
+        varying = [n for n, v in argument_space.axes.items() if len(v) > 1]
+        self.deferred = len(varying) > 1
+        if self.deferred:
+            self.pending = [argument_space[0]]
+        else:
+            self.pending = argument_space
+
+    def get_key(self, combination):
+        return tuple(combination[name] for name in self.argument_space.axes)
+
+    def take_queries(self):
+        """Returns the queries of the combinations that are waiting to be estimated"""
+        queries = []
+        for combination in self.pending:
+            key = self.get_key(combination)
+            if key in self.indices:
+                continue
+            self.indices[key] = len(self.queries) + len(queries)
+            queries.append(
+                {
+                    "class_name": self.pc.get_class_name(),
+                    "attributes": self.pc.get_attributes(),
+                    "action_name": self.action.get_name(),
+                    "arguments": combination,
+                }
+            )
+        self.pending = []
+        self.queries += queries
+        return queries
+
+    def add_estimations(self, estimations):
+        """Takes an estimation for each query returned by take_queries"""
+        while len(self.estimations) < len(self.queries):
+            self.estimations.append(next(estimations))
+
+    def set_separable_arguments(self, separable_arguments):
+        """Estimates every combination unless at least two varying arguments are separable"""
+        axes = self.argument_space.axes
+        separable_arguments = tuple(
+            n for n in axes if n in separable_arguments and len(axes[n]) > 1
+        )
+        if len(separable_arguments) < 2:
+            self.separable_arguments = ()
+            self.pending = self.argument_space
+            return
+        self.separable_arguments = separable_arguments
+        self.pending = []
+        for combination in self.get_base_combinations():
+            self.pending.append(combination)
+            for name in separable_arguments:
+                for value in axes[name][1:]:
+                    self.pending.append({**combination, name: value})
+
+    def get_base_combinations(self):
+        """Yields the combinations with the separable arguments at their first values"""
+        axes = self.argument_space.axes
+        others = ArgumentSpace(
+            {n: v for n, v in axes.items() if n not in self.separable_arguments}
         )
+        for combination in others:
+            yield {
+                n: combination[n] if n in combination else v[0] for n, v in axes.items()
+            }
+
+    def estimated_by_one_plug_in(self):
+        estimator_name = self.estimations[0].estimator_name
+        return all(e.estimator_name == estimator_name for e in self.estimations)
+
+    def get_energy_terms(self, combination):
+        """
+        The energy of the base combination of a combination, then the change from each
+        separable argument, in Joules
+        """
+        base = {
+            n: self.argument_space.axes[n][0] if n in self.separable_arguments else v
+            for n, v in combination.items()
+            if n in self.argument_space.axes
+        }
+        base_energy = self.get_energy(base)
+        terms = [base_energy]
+        for name in self.separable_arguments:
+            terms.append(
+                self.get_energy({**base, name: combination[name]}) - base_energy
+            )
+        return terms
+
+    def get_energy(self, combination):
+        return self.estimations[self.indices[self.get_key(combination)]].get_value()
 
 
 class ERT:
@@ -197,6 +516,13 @@ class ERT:
             self.entries[comp_name] = ComponentERTEntry(comp_name, self.precision)
         self.entries[comp_name].add_action_energy(entry_dict)
 
+    def add_separable_action_table(self, comp_name, table):
+        """
+        Adds the per-argument energies of a separable action. The action is written as these
+        tables instead of its entries. See expand_separable_action_table.
+        """
+        self.entries[comp_name].add_separable_action_table(table)
+
     def get_ERT(self):
         from collections import OrderedDict
 
@@ -206,7 +532,7 @@ class ERT:
         return ERT
 
     def get_ERT_entry(self, component_name):
-        component_base_name = remove_brackets(component_name)
+        component_base_name = ComponentName.get(component_name).base_name
         ERT_entry = self.get_ERT_entry_w_base_name(component_base_name)
         ASSERT_MSG(
             ERT_entry is not None,
@@ -230,7 +556,7 @@ class ERT:
     def get_base_name_map(self):
         if self.base_name_map == {}:
             for complete_name in self.entries:
-                base_name = remove_brackets(complete_name)
+                base_name = ComponentName.get(complete_name).base_name
                 self.base_name_map[base_name] = complete_name
         return self.base_name_map
 
@@ -263,9 +589,14 @@ class ComponentERTEntry:
         self.action_entries = {}
         self.estimator_s = {}
         self.precision = precision
+        self.separable_action_tables = {}
+        # (action name, argument names) -> {argument values: energy}, or None if the entries
+        # of the action can not be indexed by the arguments
+        self.action_indexes = {}
 
     def add_action_energy(self, action_dict):
         action_name = action_dict["action_name"]
+        self.action_indexes.clear()
         if action_name not in self.action_entries:
             self.action_entries[action_name] = []
 
@@ -285,7 +616,7 @@ class ComponentERTEntry:
                 interpreted_energy = (
                     estimated_energy
                     * subaction_obj.get_energy_scale()
-                    * count_num_identical_comps(subcomponent_name)
+                    * ComponentName.get(subcomponent_name).n_identical
                 )
                 percentage = (
                     0 if energy == 0 else round_sigfig(100 * interpreted_energy / energy, 2)
@@ -320,16 +651,50 @@ class ComponentERTEntry:
                 {"arguments": arguments, "energy": energy}
             )
 
+    def add_separable_action_table(self, table):
+        self.separable_action_tables.setdefault(table["name"], []).append(table)
+
     def get_component_name(self):
         return self.component_name
 
+    def get_action_index(self, action_name, arg_names):
+        """
+        Returns a dict from the values of the arguments arg_names to the energy of the first
+        entry of the action with these values. The index is built on first use. Returns None
+        if an entry does not have the arguments or their values can not be hashed.
+        """
+        key = (action_name, arg_names)
+        if key not in self.action_indexes:
+            index = {}
+            try:
+                for arg_combo in self.action_entries[action_name]:
+                    arguments = arg_combo["arguments"]
+                    arg_vals = tuple(arguments[arg_name] for arg_name in arg_names)
+                    index.setdefault(arg_vals, arg_combo["energy"])
+            except (KeyError, TypeError):
+                index = None
+            self.action_indexes[key] = index
+        return self.action_indexes[key]
+
     def get_action_energy(self, action_entry_obj):
         action_name = action_entry_obj.get_action_name()
         action_args = action_entry_obj.get_action_args()
         action_list = self.action_entries[action_name]
+        if not action_args:
+            return action_list[0]["energy"]
+
+        arg_names = tuple(action_args)
+        index = self.get_action_index(action_name, arg_names)
+        if index is not None:
+            try:
+                energy = index.get(tuple(action_args[n] for n in arg_names))
+            except TypeError:
+                energy = None
+            if energy is not None:
+                return energy
+
+        matched = False
         for arg_combo in action_list:
-            if action_args is None:
-                return arg_combo["energy"]
             for arg_name, arg_val in action_args.items():
                 matched = True
                 if not arg_combo["arguments"][arg_name] == arg_val:
@@ -348,6 +713,9 @@ class ComponentERTEntry:
         ERT_entry_dict_rep = OrderedDict({"name": self.component_name, "actions": {}})
         action_list = []
         for action_name, action_info_list in self.action_entries.items():
+            if action_name in self.separable_action_tables:
+                action_list += self.separable_action_tables[action_name]
+                continue
             for argument_combo in action_info_list:
                 action_item = OrderedDict({"name": action_name})
                 for key, val in argument_combo.items():
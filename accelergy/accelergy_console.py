@@ -26,12 +26,15 @@ from accelergy.component_class import ComponentClass
 from accelergy.arch_dict_2_obj import arch_dict_2_obj
 from accelergy.plug_in_path_to_obj import plug_in_path_to_obj
 from accelergy.action_counts_dict_2_obj import action_counts_dict_2_obj
-from accelergy.primitive_component import PrimitiveComponent
-from accelergy.compound_component import CompoundComponent
 from accelergy.ERT_generator import EnergyReferenceTableGenerator, ERT_dict_to_obj
 from accelergy.ART_generator import AreaReferenceTableGenerator
 from accelergy.energy_calculator import EnergyCalculator
+from accelergy.plug_in_interface.estimation_cache import PersistentEstimationCache
+from accelergy.plug_in_interface.estimation_pool import EstimationProcessPool
+from accelergy.plug_in_interface.lazy_plug_in import LazyPlugIn
+from accelergy.plug_in_interface.plug_in_manifest import PlugInManifest
 from accelergy.input_output import parse_commandline_args, generate_output_files
+from accelergy.sweep import Sweep, get_sweep_points, parse_sweep_values, write_sweep_csv
 from accelergy.utils.utils import *
 import accelergy.version as version
 import accelergy.parsing_utils
@@ -52,6 +55,9 @@ def run():
     version.SUPPRESS_VERSION_ERRORS = args.suppress_version_errors
     verbose = args.verbose
     logging.getLogger().setLevel(logging.INFO if not args.verbose else logging.DEBUG)
+    if args.sweep:
+        run_sweep(args)
+        return
     # interpret desired output files
     oflags = {
         "ERT": 0,
@@ -101,13 +107,7 @@ def run():
     if len(available_inputs) == 0:
         if args.list_components or args.verbose:
             # ----- Add all available plug-ins
-            system_state.add_plug_ins(
-                plug_in_path_to_obj(
-                    raw_dicts.get_estimation_plug_in_paths(),
-                    raw_dicts.get_python_plug_in_paths() + extra_plugins,
-                    output_prefix,
-                ),
-            )
+            set_up_estimation(args, system_state, raw_dicts, estimate=False)
             list_components(system_state)
         else:
             INFO("no input is provided, exiting...")
@@ -146,49 +146,28 @@ def run():
         )
         system_state.set_arch_spec(arch_obj)
 
-    # ----- Add all available plug-ins
-    system_state.add_plug_ins(
-        plug_in_path_to_obj(
-            raw_dicts.get_estimation_plug_in_paths(),
-            raw_dicts.get_python_plug_in_paths() + extra_plugins,
-            output_prefix,
-        ),
+    # ----- Add all available plug-ins, and the persistent cache and worker processes to
+    # estimate with them if the ERT/ART is generated
+    process_pool = set_up_estimation(
+        args,
+        system_state,
+        raw_dicts,
+        estimate=((compute_ERT and "ERT" not in available_inputs) or compute_ART)
+        and not args.list_components,
     )
 
     if args.list_components:
         list_components(system_state)
         sys.exit(0)
     if verbose:
-        list_components(system_state, INFO)
+        list_components(system_state, INFO, load_lazy_plug_ins=False)
 
     if (compute_ERT and "ERT" not in available_inputs) or compute_ART:
         # ERT/ERT_summary/energy estimates/ART/ART summary need to be generated without provided ERT
         #        ----> all components need to be defined
         # ----- Add the Fully Defined Components (all flattened out)
 
-        for arch_component in system_state.arch_spec:
-            if arch_component.get_class_name() in system_state.cc_classes:
-                cc = CompoundComponent(
-                    {
-                        "component": arch_component,
-                        "pc_classes": system_state.pc_classes,
-                        "cc_classes": system_state.cc_classes,
-                    }
-                )
-                system_state.add_cc(cc)
-            else:
-                class_name = arch_component.get_class_name()
-                if class_name not in system_state.pc_classes:
-                    system_state.pc_classes[class_name] = ComponentClass(
-                        {"name": class_name, "attributes": {}, "actions": []}
-                    )
-                pc = PrimitiveComponent(
-                    {
-                        "component": arch_component,
-                        "pc_class": system_state.pc_classes[class_name],
-                    }
-                )
-                system_state.add_pc(pc)
+        system_state.define_components()
 
     if compute_ERT and "ERT" in available_inputs:
         # ERT/ ERT_summary/ energy estimates need to be generated with provided ERT
@@ -212,8 +191,12 @@ def run():
                 "parser_version": accelergy_version,
                 "pcs": system_state.pcs,
                 "ccs": system_state.ccs,
-                "plug_ins": system_state.plug_ins,
+                "plug_ins": system_state.plug_in_index,
+                "estimation_cache": system_state.estimation_cache,
+                "jobs": args.jobs,
+                "process_pool": process_pool,
                 "precision": precision,
+                "compact_ERT": args.compact_ert,
             }
         )
         system_state.set_ERT(ert_gen.get_ERT())
@@ -238,17 +221,123 @@ def run():
                 "parser_version": accelergy_version,
                 "pcs": system_state.pcs,
                 "ccs": system_state.ccs,
-                "plug_ins": system_state.plug_ins,
+                "plug_ins": system_state.plug_in_index,
+                "estimation_cache": system_state.estimation_cache,
+                "jobs": args.jobs,
+                "process_pool": process_pool,
                 "precision": precision,
             }
         )
         system_state.set_ART(art_gen.get_ART())
 
+    if (compute_ERT and "ERT" not in available_inputs) or compute_ART:
+        close_estimation(system_state, process_pool)
+
     # ----- Generate All Necessary Output Files
     generate_output_files(system_state)
 
 
-def list_components(system_state, printfunc=print):
+def run_sweep(args):
+    """Evaluates the inputs at each point of the --vary values and writes sweep.csv"""
+    accelergy_version = version.__version__
+    values = dict(parse_sweep_values(v) for v in args.vary)
+    points = get_sweep_points(values)
+    INFO(
+        f"Sweeping {len(points)} points of "
+        + ", ".join(f"{name} ({len(v)} values)" for name, v in values.items())
+    )
+
+    # ----- Load the inputs, classes and plug-ins once for all points
+    system_state = SystemState()
+    system_state.set_accelergy_version(accelergy_version)
+    raw_input_info = {
+        "path_arglist": args.files,
+        "parser_version": accelergy_version,
+        "keep_architecture_inputs": True,
+    }
+    raw_dicts = RawInputs2Dicts(raw_input_info, args.update_config_version)
+    ASSERT_MSG(
+        "architecture_spec" in raw_dicts.get_available_inputs(),
+        "accelergy sweep requires an architecture",
+    )
+    for pc_name, pc_info in raw_dicts.get_pc_classses().items():
+        system_state.add_pc_class(ComponentClass(pc_info))
+    for cc_name, cc_info in raw_dicts.get_cc_classses().items():
+        system_state.add_cc_class(ComponentClass(cc_info))
+    process_pool = set_up_estimation(args, system_state, raw_dicts)
+
+    # ----- Evaluate the points, estimating in worker processes if there is a pool
+    sweep = Sweep(
+        {
+            "raw_dicts": raw_dicts,
+            "system_state": system_state,
+            "parser_version": accelergy_version,
+            "precision": args.precision,
+            "jobs": args.jobs,
+            "process_pool": process_pool,
+        }
+    )
+    rows = sweep.run(points)
+    close_estimation(system_state, process_pool)
+
+    path = os.path.join(args.outdir, args.oprefix + "sweep.csv")
+    write_sweep_csv(path, rows)
+    INFO("sweep results are saved to:", path)
+
+
+def set_up_estimation(args, system_state, raw_dicts, estimate=True):
+    """
+    Adds the plug-ins of the inputs and --extra-plugins to the system state, remembering
+    discovered plug-ins across runs unless --no-cache is given. If estimate is True, also
+    shares estimations with other runs if --cache is given and returns a pool of worker
+    processes if --processes is given with several --jobs, or None. Close them with
+    close_estimation.
+    """
+    plug_in_manifest = None if args.no_cache else PlugInManifest(args.cache_dir)
+    system_state.add_plug_ins(
+        plug_in_path_to_obj(
+            raw_dicts.get_estimation_plug_in_paths(),
+            raw_dicts.get_python_plug_in_paths() + args.extra_plugins,
+            args.oprefix,
+            plug_in_manifest,
+        ),
+    )
+    if plug_in_manifest is not None:
+        plug_in_manifest.save()
+    if not estimate:
+        return None
+
+    # ----- Share estimations with other Accelergy runs
+    if args.cache:
+        system_state.estimation_cache.persistent = PersistentEstimationCache(
+            args.cache_dir
+        )
+
+    # ----- Estimate in worker processes
+    if not (args.processes and args.jobs > 1):
+        return None
+    persistent = system_state.estimation_cache.persistent
+    return EstimationProcessPool(
+        args.jobs,
+        raw_dicts.get_estimation_plug_in_paths(),
+        raw_dicts.get_python_plug_in_paths() + args.extra_plugins,
+        args.oprefix,
+        persistent.cache_dir if persistent is not None else None,
+        plug_in_manifest.cache_dir if plug_in_manifest is not None else None,
+    )
+
+
+def close_estimation(system_state, process_pool):
+    """Logs the estimation cache statistics and closes what set_up_estimation opened."""
+    INFO(f"Estimation cache: {system_state.estimation_cache}")
+    # Workers record the persistent cache entries they used before the parent evicts
+    if process_pool is not None:
+        process_pool.close()
+    if system_state.estimation_cache.persistent is not None:
+        system_state.estimation_cache.persistent.close()
+
+
+def list_components(system_state, printfunc=print, load_lazy_plug_ins=True):
     printfunc("\n")
     printfunc("Components in the architecture:")
     printfunc("\tPrimitive Components:")
@@ -282,9 +371,16 @@ def list_components(system_state, printfunc=print):
                 + "\n".join(f"\t\t{self.class_name}.{a}" for a in self.actions)
             )
 
+    plug_ins = []
+    for plug_in in system_state.plug_ins:
+        if isinstance(plug_in, LazyPlugIn) and (load_lazy_plug_ins or plug_in.loaded):
+            plug_ins += plug_in.load()
+        else:
+            plug_ins.append(plug_in)
+
     entries = []
     plug_ins_without_entries = []
-    for plug_in in system_state.plug_ins:
+    for plug_in in plug_ins:
 
         def add_entry(name, class_names, init_func, actions):
             class_names = [class_names] if isinstance(class_names, str) else class_names
@@ -301,6 +397,9 @@ def list_components(system_state, printfunc=print):
                 str(plug_in.init_function),
                 plug_in.actions,
             )
+        elif isinstance(plug_in, LazyPlugIn):
+            for c in plug_in.get_class_names():
+                entries.append((c, f"\t{c} <{plug_in.get_name()} plug-in, not loaded>"))
         elif hasattr(plug_in, "get_supported_components"):
             for c in plug_in.get_supported_components():
                 add_entry(
@@ -1,9 +1,57 @@
-from copy import deepcopy
+import copy
+import itertools
+import math
+from typing import Dict, Iterator
 
 from accelergy.utils.utils import *
 from accelergy.parsing_utils import *
 
 
+class ArgumentSpace:
+    """
+    The combinations of values of an action's arguments, where each argument (axis)
+    ranges over consecutive integers. Combinations are generated as they are used, so
+    the space takes memory for its axes only. Combinations are ordered with the first
+    argument varying fastest, and each is a dictionary from argument names to values.
+    """
+
+    def __init__(self, axes: Dict[str, range]):
+        self._axes = dict(axes)
+
+    @property
+    def axes(self) -> Dict[str, range]:
+        """The values of each argument, independent of the other arguments"""
+        return dict(self._axes)
+
+    def __len__(self):
+        return math.prod(len(values) for values in self._axes.values())
+
+    def __getitem__(self, index: int) -> dict:
+        n_combinations = len(self)
+        if index < 0:
+            index += n_combinations
+        if not 0 <= index < n_combinations:
+            raise IndexError(f"argument combination index {index} out of range")
+        combination = {}
+        for name, values in self._axes.items():
+            index, value_index = divmod(index, len(values))
+            combination[name] = values[value_index]
+        return combination
+
+    def __iter__(self) -> Iterator[dict]:
+        names = list(self._axes)
+        # product varies its last iterable fastest
+        for values in itertools.product(*reversed(self._axes.values())):
+            yield dict(zip(names, reversed(values)))
+
+    def __repr__(self):
+        axes = ", ".join(
+            f"{name}: {values.start}..{values.stop - 1}"
+            for name, values in self._axes.items()
+        )
+        return f"ArgumentSpace({axes})"
+
+
 class Action(object):
     """Action class"""
 
@@ -52,7 +100,8 @@ class Action(object):
 
     def set_argument(self, new_arg_dict):
         """update one or more argument name-val pairs"""
-        self._arguments.update(new_arg_dict)
+        # copy on write: the arguments may be shared with copies of this action
+        self._arguments = {**self._arguments, **new_arg_dict}
 
     def set_subcomps(self, defined_subcomps):
         self._subcomponents = defined_subcomps
@@ -103,19 +152,26 @@ class Action(object):
         return self._arguments[argName]
 
     def set_arg(self, arg_dict):
-        self._arguments.update(arg_dict)
-
-    def flatten_action_args_into_list(self, mappingDict):
-        """flatten an action into a list representing all possible argument value combinations"""
-
-        args = self.get_arguments()
-        if args is None:
-            return [self]  # no arguments, no need to flatten
+        self.set_argument(arg_dict)
 
-        # an action needs to be flattened into a list of actions with the same action name but different arg vals
-        total_entries = 1
-        argument_range_record = {}
-        for arg_name, arg_range in args.items():
+    def copy(self):
+        """
+        returns a copy of this action that can be given its own arguments, energy scale,
+        subcomponent actions and primitive list. The copy shares the values with this
+        action until they are set, so the values must not be changed in place.
+        """
+        return copy.copy(self)
+
+    def with_arguments(self, arguments):
+        """returns a copy of this action with the given argument values"""
+        action = self.copy()
+        action._arguments = arguments
+        return action
+
+    def get_argument_space(self, mappingDict):
+        """the combinations of argument values, with ranges bound by mappingDict"""
+        axes = {}
+        for arg_name, arg_range in self.get_arguments().items():
             ASSERT_MSG(
                 isinstance(arg_range, str),
                 "%s: argument value for action %s is not string, cannot parse range"
@@ -128,22 +184,21 @@ class Action(object):
             )
             new_arg_range = Action.map_arg_range_bounds(arg_range, mappingDict)[0]
             startIdx, endIdx = Action.parse_arg_range(new_arg_range)
-            total_entries *= endIdx - startIdx + 1
-            argument_range_record[arg_name] = (startIdx, endIdx)
+            axes[arg_name] = range(startIdx, endIdx + 1)
+        return ArgumentSpace(axes)
 
-        action_list = []
-        for entry_idx in range(total_entries):
-            offset = 1
-            arg_def = {}
-            for arg_name, range_record in argument_range_record.items():
-                arg_range = range_record[1] - range_record[0] + 1
-                arg_def[arg_name] = (entry_idx // offset) % arg_range + range_record[0]
-                offset *= arg_range
-            subcomp_list = []
-            new_action = deepcopy(self)
-            new_action._arguments = arg_def
-            action_list.append(new_action)
-        return action_list
+    def flatten_action_args_into_list(self, mappingDict):
+        """flatten an action into a list representing all possible argument value combinations"""
+
+        args = self.get_arguments()
+        if args is None:
+            return [self]  # no arguments, no need to flatten
+
+        # an action needs to be flattened into a list of actions with the same action name but different arg vals
+        return [
+            self.with_arguments(arguments)
+            for arguments in self.get_argument_space(mappingDict)
+        ]
 
     @staticmethod
     def parse_arg_range(arg_range):
@@ -1,5 +1,6 @@
 from accelergy.parsing_utils import *
 from accelergy.component_class import ComponentClass
+from accelergy.utils.component_name import ComponentName
 
 
 def arch_dict_2_obj(arch_dict, cc_classes, pc_classes):
@@ -99,14 +100,7 @@ class Architecture(object):
     @staticmethod
     def remove_brackets(name):
         """Removes the brackets from a component name in a list"""
-        if "[" not in name and "]" not in name:
-            return name
-        if "[" in name and "]" in name:
-            start_idx = name.find("[")
-            end_idx = name.find("]")
-            name = name[:start_idx] + name[end_idx + 1 :]
-            name = Architecture.remove_brackets(name)
-            return name
+        return ComponentName.get(name).base_name
 
 
 class ArchComp:
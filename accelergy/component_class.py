@@ -12,6 +12,7 @@ class ComponentClass:
         # resolve_optional_required_attributes(class_dict)
 
         self._default_attributes = deepcopy(class_dict["attributes"])
+        self._default_attr_template = None
 
         self._actions = {}
         self.set_actions(class_dict["actions"])
@@ -52,7 +53,7 @@ class ComponentClass:
 
     def get_default_attr_to_apply(self, obj_attr_name_list):
         attr_to_be_applied = OrderedDict()
-        for attr_name, attr_val in self._get_default_attrs().items():
+        for attr_name, attr_val in self._get_default_attr_template().items():
             # print(f'Checking for {attr_name=} {attr_val=} in {obj_attr_name_list}')
             found_val = obj_attr_name_list.get(attr_name, None)
             if attr_val == "must_specify" and found_val is None:
@@ -70,6 +71,28 @@ class ComponentClass:
     def _get_default_attrs(self):
         return self._default_attributes
 
+    def _get_default_attr_template(self):
+        """
+        Returns the default attributes with the constant defaults (e.g. "1e-9" or
+        "2 ** 10") parsed once for all instances of the class. Defaults that reference
+        other attributes are left as expressions to be parsed for each instance.
+        """
+        if self._default_attr_template is None:
+            template = OrderedDict()
+            for attr_name, attr_val in self._default_attributes.items():
+                if is_constant_expression(attr_val):
+                    parsed = parse_expression_for_arithmetic(
+                        attr_val,
+                        {},
+                        f'{self.get_name()} default attribute "{attr_name}"',
+                    )
+                    # Mutable values are parsed for each instance so they are not shared
+                    if isinstance(parsed, (bool, int, float, str)):
+                        attr_val = parsed
+                template[attr_name] = attr_val
+            self._default_attr_template = template
+        return self._default_attr_template
+
     def _get_attr_name_list(self):
         return list(self._default_attributes.keys())
 
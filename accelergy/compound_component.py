@@ -18,8 +18,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from copy import deepcopy
+import copy
+from collections import ChainMap
 from accelergy.parsing_utils import *
+from accelergy.utils.component_name import ComponentName
 from accelergy.component_class import ComponentClass
 
 
@@ -39,8 +41,76 @@ class CompoundComponent:
         self.all_possible_subcomponents = {}
         self.subcomponent_base_name_map = {}
         self._actions = []
+
+        # Instances with the same class and resolved attributes expand to the same
+        # subcomponents and actions, whose names do not include the instance name. The first
+        # instance is expanded and the others reuse its expansion.
+        expansions = def_info.get("expansions", None)
+        key = self.get_expansion_key() if expansions is not None else None
+        if key is not None and key in expansions:
+            self.reuse_expansion(expansions[key])
+            return
         self.set_subcomponents(cc_classes, pc_classes)
         self.flatten_action_list(cc_classes)
+        if key is not None:
+            expansions[key] = self
+
+    def get_expansion_key(self):
+        """Returns the key of the expansion of this instance, or None if it can't be hashed."""
+        try:
+            return (
+                self.class_name,
+                tuple(self.attributes),
+                freeze(self.attributes),
+                freeze(self.area_scale),
+                freeze(self.energy_scale),
+            )
+        except TypeError:
+            return None
+
+    def reuse_expansion(self, expanded):
+        """Takes the subcomponents and actions of an instance with the same expansion key"""
+        self.area_scale = expanded.area_scale
+        self.energy_scale = expanded.energy_scale
+        self._subcomponents = dict(expanded._subcomponents)
+        self.all_possible_subcomponents[self.name] = self
+        for subname, subcomponent in expanded.all_possible_subcomponents.items():
+            if subcomponent is not expanded:
+                self.all_possible_subcomponents[subname] = subcomponent
+        self.construct_name_base_name_map()
+        self._actions = list(expanded._actions)
+
+    def copy(self):
+        """
+        Returns a copy that shares the subcomponents and has its own actions. Generating the
+        ERT adds keys to the arguments of the actions and of their primitive subactions, so
+        the actions and subactions of the copy have their own arguments.
+        """
+        component = copy.copy(self)
+        component._actions = [self.copy_action(action) for action in self._actions]
+        component.all_possible_subcomponents = {
+            subname: component if subcomponent is self else subcomponent
+            for subname, subcomponent in self.all_possible_subcomponents.items()
+        }
+        return component
+
+    @staticmethod
+    def copy_action(action):
+        """Returns a copy of a flattened action with its own arguments and subactions"""
+
+        def copy_arguments(action):
+            arguments = action.get_arguments()
+            return action.with_arguments(None if arguments is None else dict(arguments))
+
+        copied = copy_arguments(action)
+        if action.get_primitive_list() is not None:
+            copied.set_primitive_list(
+                [
+                    (subcomp_name, copy_arguments(subaction))
+                    for subcomp_name, subaction in action.get_primitive_list()
+                ]
+            )
+        return copied
 
     def get_class_name(self):
         return self.class_name
@@ -75,7 +145,10 @@ class CompoundComponent:
         list_of_primitive_components = []
         component_class = cc_classes[component.get_class_name()]
         compound_attributes = component.get_attributes()
-        subcomponents = deepcopy(component_class.get_subcomponents_as_dict())
+        subcomponents = {
+            name: subcomponent.copy()
+            for name, subcomponent in component_class.get_subcomponents_as_dict().items()
+        }
         for default_sub_name, subcomponent in subcomponents.items():
             defined_sub_name = CompoundComponent.define_subcomponent_name(
                 default_sub_name, compound_attributes
@@ -166,17 +239,16 @@ class CompoundComponent:
         # 3. define the range of the arguments of each subcomponent action
         # 4. if the action is a compound action -> go to 1
         #    if the action is a primitive action -> throw it in the list
-        action_copy = deepcopy(action)
         # subcomponent_name: list of action objects
-        subcomponent_actions = action_copy.get_subcomps()
+        subcomponent_actions = action.get_subcomps()
         compound_attributes = self.find_subcomponent_obj(
             component_name
         ).get_attributes()
         compound_arguments = action.get_arguments()
         aggregated_mappings = (
-            deepcopy(compound_attributes)
+            compound_attributes
             if compound_arguments is None
-            else merge_dicts(compound_attributes, compound_arguments)
+            else {**compound_attributes, **compound_arguments}
         )
 
         energy_scale = action.get_energy_scale()
@@ -211,7 +283,7 @@ class CompoundComponent:
                 if subcomponent_class_type == "primitive":
                     list_of_primitive_actions.append((defined_subcomp_name, subaction))
                 else:
-                    default_subcomp_actions = deepcopy(
+                    default_subcomp_actions = (
                         cc_classes[subclass_name]
                         .get_action(subaction.get_name())
                         .get_subcomps()
@@ -231,6 +303,8 @@ class CompoundComponent:
     ):
         defined_subactions = []
         for subaction in subactions:
+            # the subactions are shared with the component class
+            subaction = subaction.copy()
             parsed_energy_scale = CompoundComponent.parse_energy_scale(
                 subaction, aggregated_dict
             )
@@ -271,7 +345,7 @@ class CompoundComponent:
         actionNameList = component_class.get_action_name_list()
         flattenedActionList = []
         for actionName in actionNameList:
-            actionObj = deepcopy(component_class.get_action(actionName))
+            actionObj = component_class.get_action(actionName).copy()
             flattened = actionObj.flatten_action_args_into_list(self.attributes)
             for action in flattened:
                 flattenedActionList.append(action)
@@ -310,10 +384,25 @@ class CompoundComponent:
         attrs_to_be_applied = subclass.get_default_attr_to_apply(
             subcomponent.get_attributes()
         )
+        # The other attributes were parsed above. Defaults are parsed with the attributes
+        # before them, as if all attributes were parsed again in order. Constant defaults
+        # were parsed once by the class, so only defaults that reference attributes are
+        # evaluated here.
+        other_attrs = {
+            k: v
+            for k, v in subcomponent.get_attributes().items()
+            if k not in attrs_to_be_applied
+        }
+        attrs_to_be_applied = parse_expressions_sequentially_replacing_bindings(
+            attrs_to_be_applied,
+            ChainMap(other_attrs, compound_attributes),
+            f"{subcomponent.get_name()}.",
+            strings_allowed=True,
+            propagate_keys=False,
+        )
         subcomponent.add_new_attr(attrs_to_be_applied)
-        CompoundComponent.apply_internal_bindings(subcomponent, compound_attributes)
-        combined_attributes = merge_dicts(
-            compound_attributes, subcomponent.get_attributes()
+        combined_attributes = ChainMap(
+            subcomponent.get_attributes(), compound_attributes
         )
         subcomponent.set_area_scale(
             self.process_area_scale(
@@ -345,13 +434,13 @@ class CompoundComponent:
     def construct_name_base_name_map(self):
         self.subcomponent_base_name_map = {}
         for subname in self.all_possible_subcomponents:
-            sub_base_name = remove_brackets(subname)
+            sub_base_name = ComponentName.get(subname).base_name
             self.subcomponent_base_name_map[sub_base_name] = subname
 
     def find_subcomponent_obj(self, subcomponent_name):
         """find the corresponding subcomponent def to retrieve the action-related information"""
 
-        subcomponent_base_name = remove_brackets(subcomponent_name)
+        subcomponent_base_name = ComponentName.get(subcomponent_name).base_name
         assert subcomponent_base_name in self.subcomponent_base_name_map, (
             f"Subcomponent {subcomponent_base_name} not found in "
             f"compound component {self.get_name()}. Subcomponents are: "
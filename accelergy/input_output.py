@@ -38,6 +38,11 @@ def parse_commandline_args():
             sys.argv.pop(i + 1)
             break
 
+    # "accelergy sweep ..." evaluates the inputs at each point of the --vary values
+    sweep = len(sys.argv) > 1 and sys.argv[1] == "sweep"
+    if sweep:
+        sys.argv.pop(1)
+
     """parse command line inputs"""
     parser = argparse.ArgumentParser(
         description="Accelergy is an architecture-level energy estimator for accelerator designs. Accelergy allows "
@@ -126,7 +131,70 @@ def parse_commandline_args():
         default=False,
         help="List all supported components and actions.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=False,
+        help="Read and write the persistent estimation cache, which shares estimations "
+        "across Accelergy runs. Entries are invalidated when a plug-in's source file, "
+        "its accuracy or the Accelergy version changes, but not when other files that "
+        "plug-ins read change; delete the cache directory after changing such files.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Do not read or write the plug-in manifest.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory of the persistent estimation cache and plug-in manifest, shared "
+        "across Accelergy runs. Default is ~/.config/accelergy/cache.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of threads used to generate the ERT and ART. Outputs are identical "
+        "to a single-threaded run. Default is 1.",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        default=False,
+        help="Use --jobs worker processes instead of threads. Each worker loads the "
+        "plug-ins once. Use this for plug-ins that are limited by Python performance.",
+    )
+    parser.add_argument(
+        "--compact-ert",
+        action="store_true",
+        default=False,
+        help="For actions whose arguments plug-ins declare separable, write the energy of "
+        "each argument value in the ERT instead of an entry for every combination of values.",
+    )
+    parser.add_argument(
+        "--vary",
+        action="append",
+        default=[],
+        metavar="NAME=VALUES",
+        help="With 'accelergy sweep', a variable or architecture attribute to sweep, e.g. "
+        "depth=64:65536:x2 (a factor), n_banks=1:8:1 (an increment) or "
+        "technology=45nm,32nm. Repeat to sweep every combination of values. The inputs "
+        "and plug-ins are loaded once and the area and energies of each component at "
+        "each point are written to sweep.csv. --jobs points are evaluated in parallel.",
+    )
+    args = parser.parse_args()
+    args.sweep = sweep
+    if sweep and not args.vary:
+        parser.error("accelergy sweep requires at least one --vary NAME=VALUES")
+    if args.vary and not sweep:
+        parser.error("--vary is only used by accelergy sweep")
+    if args.cache and args.no_cache:
+        parser.error("--cache and --no-cache can not be used together")
+    return args
 
 
 def generate_output_files(system_state):
@@ -18,19 +18,23 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import functools
 from inspect import signature
 import copy
 from importlib.machinery import SourceFileLoader
 import math
 import re
 import traceback
-from typing import Any, Callable, Union
+from types import CodeType
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Union
 from accelergy.utils.utils import *
+from accelergy.utils.component_name import ComponentName
 from numbers import Number
 from accelergy.utils.yaml import load_yaml, SCRIPTS_FROM
 import accelergy.version as version
 import ruamel.yaml
 import os
+import sys
 import keyword
 
 MATH_FUNCS = {
@@ -107,8 +111,87 @@ MATH_FUNCS = {
     "getcwd": os.getcwd,
     "map": map,
 }
+# MATH_FUNCS that have NumPy equivalents, used to evaluate expressions that reference NumPy
+# arrays elementwise. NUMPY_NAMES maps the functions whose NumPy names differ. Functions in
+# ELEMENTWISE_MATH_FUNCS have no NumPy equivalent and are called for each element. The other
+# functions (e.g. len and sum) are called as they are.
+NUMPY_MATH_FUNCS = [
+    "ceil",
+    "copysign",
+    "fabs",
+    "floor",
+    "fmod",
+    "frexp",
+    "gcd",
+    "isfinite",
+    "isinf",
+    "isnan",
+    "ldexp",
+    "modf",
+    "trunc",
+    "exp",
+    "expm1",
+    "log1p",
+    "log2",
+    "log10",
+    "pow",
+    "sqrt",
+    "acos",
+    "asin",
+    "atan",
+    "atan2",
+    "cos",
+    "hypot",
+    "sin",
+    "tan",
+    "degrees",
+    "radians",
+    "acosh",
+    "asinh",
+    "atanh",
+    "cosh",
+    "sinh",
+    "tanh",
+    "abs",
+]
+NUMPY_NAMES = {
+    "pow": "power",
+    "acos": "arccos",
+    "asin": "arcsin",
+    "atan": "arctan",
+    "atan2": "arctan2",
+    "acosh": "arccosh",
+    "asinh": "arcsinh",
+    "atanh": "arctanh",
+}
+# Functions that return integers for scalars also return integer arrays
+INTEGER_MATH_FUNCS = {"ceil", "floor", "trunc"}
+ELEMENTWISE_MATH_FUNCS = [
+    "comb",
+    "factorial",
+    "isclose",
+    "isqrt",
+    "perm",
+    "remainder",
+    "erf",
+    "erfc",
+    "gamma",
+    "lgamma",
+]
 SCRIPT_FUNCS = {}
 LOADED_MATH_FUNCS_FROM = set()
+# Compiled expressions keyed by expression text. Cleared when it grows past the max size.
+COMPILED_EXPRESSIONS = {}
+COMPILED_EXPRESSIONS_MAX_SIZE = 65536
+# Names referenced by expressions keyed by expression text. Cleared with COMPILED_EXPRESSIONS.
+EXPRESSION_NAMES = {}
+NO_NAMES = frozenset()
+# Globals used to evaluate expressions. Set to None to rebuild it when functions are loaded.
+FUNCTION_BINDINGS = None
+# Globals used to evaluate expressions that reference NumPy arrays. Rebuilt with the above.
+VECTORIZED_FUNCTION_BINDINGS = None
+# ACCELERGY_MATH_FUNCTIONS and the number of SCRIPTS_FROM when functions were last loaded
+CHECKED_MATH_FUNC_SOURCES = None
 # EXPR_CACHE = {}
 # PARSED_EXPRESSIONS = set()
 
@@ -258,6 +341,152 @@ def get_callable_lambda(func, expression):
     return l
 
 
+def get_compiled_expression(expression: str) -> CodeType:
+    """Returns the compiled code of an expression. Each expression is compiled once."""
+    code = COMPILED_EXPRESSIONS.get(expression)
+    if code is None:
+        # eval() strips leading spaces and tabs from strings, so do the same
+        code = compile(expression.lstrip(" \t"), "<string>", "eval")
+        if len(COMPILED_EXPRESSIONS) >= COMPILED_EXPRESSIONS_MAX_SIZE:
+            COMPILED_EXPRESSIONS.clear()
+            EXPRESSION_NAMES.clear()
+        COMPILED_EXPRESSIONS[expression] = code
+    return code
+
+
+def get_code_names(code: CodeType) -> FrozenSet[str]:
+    """Returns the names used by compiled code, including in comprehensions and lambdas."""
+    names = frozenset(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= get_code_names(const)
+    return names
+
+
+def get_expression_names(expression: Any) -> FrozenSet[str]:
+    """
+    Returns the names that an expression may reference. Values that are not evaluated as
+    expressions (e.g. numbers and quoted strings) and expressions that do not compile
+    reference no names.
+    """
+    if not isinstance(expression, str) or is_quoted_string(expression):
+        return NO_NAMES
+    names = EXPRESSION_NAMES.get(expression)
+    if names is None:
+        try:
+            names = get_code_names(get_compiled_expression(expression))
+        except (SyntaxError, ValueError):
+            names = NO_NAMES
+        EXPRESSION_NAMES[expression] = names
+    return names
+
+
+def is_constant_expression(expression: Any) -> bool:
+    """
+    Returns True if an expression is evaluated without bindings, e.g. "2 ** 10". Numbers,
+    quoted strings, and expressions that do not compile are not constant expressions.
+    """
+    if not isinstance(expression, str) or is_quoted_string(expression):
+        return False
+    try:
+        return not get_code_names(get_compiled_expression(expression))
+    except (SyntaxError, ValueError):
+        return False
+
+
+def get_function_bindings() -> dict:
+    """
+    Returns the globals used to evaluate expressions: the script and math functions. The
+    dictionary is shared by all evaluations and rebuilt only after functions are loaded.
+    """
+    global FUNCTION_BINDINGS
+    bindings = FUNCTION_BINDINGS
+    if bindings is None:
+        bindings = {"__builtins__": None}  # Safety
+        bindings.update(SCRIPT_FUNCS)
+        bindings.update(MATH_FUNCS)
+        FUNCTION_BINDINGS = bindings
+    return bindings
+
+
+def get_elementwise_func(
+    func: Callable, array_func: Callable, integer: bool = False
+) -> Callable:
+    """Returns a function that calls array_func if an argument is a NumPy array, else func."""
+    import numpy as np
+
+    @functools.wraps(func)
+    def elementwise(*args, **kwargs):
+        if not any(isinstance(a, np.ndarray) for a in args):
+            return func(*args, **kwargs)
+        v = array_func(*args, **kwargs)
+        return v.astype(np.int64) if integer else v
+
+    return elementwise
+
+
+def get_vectorized_function_bindings() -> dict:
+    """
+    Returns the globals used to evaluate expressions that reference NumPy arrays. The math
+    functions are replaced by functions that evaluate arrays elementwise with NumPy and
+    scalars as before. NumPy may round the last digit of some results differently.
+    """
+    global VECTORIZED_FUNCTION_BINDINGS
+    bindings = VECTORIZED_FUNCTION_BINDINGS
+    if bindings is None:
+        import numpy as np
+
+        def array_min(*args, **kwargs):
+            if len(args) == 1:
+                return min(*args, **kwargs)
+            return functools.reduce(np.minimum, args)
+
+        def array_max(*args, **kwargs):
+            if len(args) == 1:
+                return max(*args, **kwargs)
+            return functools.reduce(np.maximum, args)
+
+        def array_round(x, ndigits=None):
+            if ndigits is None:
+                return np.round(x).astype(np.int64)
+            return np.round(x, ndigits)
+
+        def array_log(x, base=None):
+            return np.log(x) if base is None else np.log(x) / np.log(base)
+
+        array_funcs = {
+            "min": array_min,
+            "max": array_max,
+            "round": array_round,
+            "log": array_log,
+            "int": lambda x: np.trunc(x).astype(np.int64),
+            "float": lambda x: np.asarray(x, dtype=float),
+        }
+        for name in NUMPY_MATH_FUNCS:
+            array_funcs[name] = getattr(np, NUMPY_NAMES.get(name, name))
+        for name in ELEMENTWISE_MATH_FUNCS:
+            array_funcs[name] = np.vectorize(MATH_FUNCS[name])
+
+        bindings = dict(get_function_bindings())
+        for name, array_func in array_funcs.items():
+            bindings[name] = get_elementwise_func(
+                MATH_FUNCS[name], array_func, name in INTEGER_MATH_FUNCS
+            )
+        VECTORIZED_FUNCTION_BINDINGS = bindings
+    return bindings
+
+
+def references_array(expression: str, binding_dictionary: dict) -> bool:
+    """Returns True if an expression references a NumPy array in binding_dictionary."""
+    np = sys.modules.get("numpy")  # No arrays if NumPy has not been imported
+    if np is None or not binding_dictionary:
+        return False
+    return any(
+        isinstance(binding_dictionary.get(n), np.ndarray)
+        for n in get_expression_names(expression)
+    )
+
+
 def parse_expression_for_arithmetic(
     expression,
     binding_dictionary,
@@ -288,13 +517,16 @@ def parse_expression_for_arithmetic(
             keys = keys[:index]
             binding_dictionary = {k: binding_dictionary[k] for k in keys}
 
-    FUNCTION_BINDINGS = {}
-    FUNCTION_BINDINGS["__builtins__"] = None  # Safety
-    FUNCTION_BINDINGS.update(SCRIPT_FUNCS)
-    FUNCTION_BINDINGS.update(MATH_FUNCS)
+    # Expressions of NumPy arrays are evaluated elementwise
+    if references_array(expression, binding_dictionary):
+        function_bindings = get_vectorized_function_bindings()
+    else:
+        function_bindings = get_function_bindings()
 
     try:
-        v = eval(expression, FUNCTION_BINDINGS, binding_dictionary)
+        v = eval(
+            get_compiled_expression(expression), function_bindings, binding_dictionary
+        )
         infostr = f'Calculated {location} as "{expression}" = {v}.'
         if isinstance(v, str):
             v = ruamel.yaml.scalarstring.DoubleQuotedScalarString(v)
@@ -308,7 +540,7 @@ def parse_expression_for_arithmetic(
             isinstance(expression, str)
             and expression.isidentifier()
             and expression not in binding_dictionary
-            and expression not in FUNCTION_BINDINGS
+            and expression not in function_bindings
         ):
             e = NameError(f"Name '{expression}' is not defined.")
         errstr += f"Problem encountered: {e.__class__.__name__}: {e}\n"
@@ -329,7 +561,7 @@ def parse_expression_for_arithmetic(
             f"Please ensure that the expression used is a valid Python expression.\n"
         )
         possibly_used = {
-            k: bindings.get(k, FUNCTION_BINDINGS.get(k, "UNDEFINED"))
+            k: bindings.get(k, function_bindings.get(k, "UNDEFINED"))
             for k in re.findall(r"([a-zA-Z_][a-zA-Z0-9_]*)", expression)
             if k not in keyword.kwlist
         }
@@ -364,6 +596,48 @@ def parse_expression_for_arithmetic(
     return v
 
 
+def get_attribute_dependencies(
+    expression_dictionary: dict, binding_dictionary: dict
+) -> Dict[Any, List[Any]]:
+    """
+    Returns the keys of expression_dictionary that each expression references. An expression
+    references the keys before it that it names, and the keys after it that it names and that
+    are not bound in binding_dictionary, which are undefined when it is parsed.
+    """
+    dependencies = {}
+    for k, v in expression_dictionary.items():
+        dependencies[k] = [
+            n
+            for n in get_expression_names(v)
+            if n in dependencies
+            or (n != k and n in expression_dictionary and n not in binding_dictionary)
+        ]
+    return dependencies
+
+
+def get_reference_cycle(
+    dependencies: Dict[Any, List[Any]], start: Any
+) -> Optional[List[Any]]:
+    """
+    Returns a cycle of references that passes through start, e.g. [a, b, a], or None if
+    there is no such cycle.
+    """
+    path, visited = [start], {start}
+    branches = [iter(dependencies[start])]
+    while branches:
+        n = next(branches[-1], None)
+        if n is None:
+            branches.pop()
+            path.pop()
+        elif n == start:
+            return path + [start]
+        elif n not in visited:
+            visited.add(n)
+            path.append(n)
+            branches.append(iter(dependencies[n]))
+    return None
+
+
 def parse_expressions_sequentially_replacing_bindings(
     expression_dictionary: dict,
     binding_dictionary: dict,
@@ -371,33 +645,59 @@ def parse_expressions_sequentially_replacing_bindings(
     strings_allowed: bool = True,
     propagate_keys: bool = True,
 ):
-    parsed = {}
+    """
+    Parses each expression with the bindings in binding_dictionary and the values of the
+    expressions before it, which take precedence. Expressions are parsed in order over one
+    scope that is updated with each parsed value. An expression can not reference the
+    expressions after it; if one does, the error names the later expressions it references
+    and any cycle of references between the expressions.
+    """
+    parsed, scope = {}, dict(binding_dictionary)
     for k, v in expression_dictionary.items():
-        attrs = {k: v for k, v in binding_dictionary.items()}
-        attrs.update(parsed)
-        parsed[k] = parse_expression_for_arithmetic(
-            v, attrs, f'{location}"{k}"', strings_allowed
-        )
+        try:
+            parsed[k] = scope[k] = parse_expression_for_arithmetic(
+                v, scope, f'{location}"{k}"', strings_allowed
+            )
+        except ArithmeticError as e:
+            raise ArithmeticError(
+                f"{e}"
+                + get_reference_error(
+                    expression_dictionary, binding_dictionary, location, k
+                )
+            ) from e
     if propagate_keys:
         propagate_required_keys(binding_dictionary, parsed, location)
     return parsed
 
 
-def count_num_identical_comps(name):
-    total_num_identical_comps = 1
-    start_idx = name.find("[")
-    end_idx = name.find("]")
-    potential_range = name[start_idx + 1 : end_idx]
-    if ".." in potential_range:
-        range_start = int(potential_range.split("..")[0])
-        range_end = int(potential_range.split("..")[1])
-        range = range_end - range_start + 1
-        total_num_identical_comps = total_num_identical_comps * range
-    if "[" and "]" in name[end_idx + 1 :]:
-        total_num_identical_comps = (
-            total_num_identical_comps * count_num_identical_comps(name[end_idx + 1 :])
+def get_reference_error(
+    expression_dictionary: dict, binding_dictionary: dict, location: str, key: Any
+) -> str:
+    """
+    Returns an explanation of the later expressions that the expression of key references,
+    or an empty string if it references none.
+    """
+    dependencies = get_attribute_dependencies(expression_dictionary, binding_dictionary)
+    keys = list(expression_dictionary)
+    later = [n for n in keys[keys.index(key) + 1 :] if n in dependencies[key]]
+    if not later:
+        return ""
+    err = (
+        f'{location}"{key}" references {", ".join(str(n) for n in later)}, which '
+        f"{'is' if len(later) == 1 else 'are'} defined after it. Expressions may only "
+        f"reference the expressions before them.\n"
+    )
+    cycle = get_reference_cycle(dependencies, key)
+    if cycle is not None:
+        err += (
+            f"Expressions in {location} reference each other in a cycle: "
+            f"{' -> '.join(str(c) for c in cycle)}\n"
         )
-    return total_num_identical_comps
+    return err
+
+
+def count_num_identical_comps(name):
+    return ComponentName.get(name).n_identical
 
 
 def comp_name_within_range(comp_name, comp_name_w_reference_range):
@@ -405,8 +705,8 @@ def comp_name_within_range(comp_name, comp_name_w_reference_range):
 
     if "[" not in comp_name:
         return True
-    subname_vals_list = get_ranges_or_indices_in_name(comp_name)
-    reference_ranges_list = get_ranges_or_indices_in_name(comp_name_w_reference_range)
+    subname_vals_list = ComponentName.get(comp_name).ranges
+    reference_ranges_list = ComponentName.get(comp_name_w_reference_range).ranges
     ASSERT_MSG(
         len(reference_ranges_list) == len(subname_vals_list),
         "subcomp name %s missing index specifications (should agree with the format %s"
@@ -429,29 +729,12 @@ def comp_name_within_range(comp_name, comp_name_w_reference_range):
 
 
 def get_ranges_or_indices_in_name(name):
-    """recursive function that eventually collects all the list ranges/list indices in the specified component name"""
-
-    exisiting_ranges = []
-    start_idx = name.find("[")
-    end_idx = name.find("]")
-    range = name[start_idx + 1 : end_idx]
-    if ".." in range:
-        range_start = int(range.split("..")[0])
-        range_end = int(range.split("..")[1])
-        val = (range_start, range_end)
-    else:
-        val = int(range)
-    exisiting_ranges.append(val)
-    subname = name[end_idx + 1 :]
-    if "[" and "]" not in subname:
-        return exisiting_ranges
-    else:
-        for val in get_ranges_or_indices_in_name(subname):
-            exisiting_ranges.append(val)
-    return exisiting_ranges
+    """collects all the list ranges/list indices in the specified component name"""
+    return list(ComponentName.get(name).ranges)
 
 
 def load_functions_from_file(path: str):
+    global FUNCTION_BINDINGS, VECTORIZED_FUNCTION_BINDINGS
     path = path.strip()
     if not os.path.exists(path):
         raise FileNotFoundError(f"Could not find math function file {path}.")
@@ -465,6 +748,7 @@ def load_functions_from_file(path: str):
         funcs[func] = getattr(python_module, func)
     SCRIPT_FUNCS.update(funcs)
     LOADED_MATH_FUNCS_FROM.add(path)
+    FUNCTION_BINDINGS = VECTORIZED_FUNCTION_BINDINGS = None
 
 
 def set_script_paths():
@@ -482,13 +766,19 @@ def set_script_paths():
 
 
 def refresh_math_funcs():
-    scripts = os.environ.get("ACCELERGY_MATH_FUNCTIONS", "").split(":")
-    scripts = [s.strip() for s in scripts if s.strip()]
+    """Loads functions from new ACCELERGY_MATH_FUNCTIONS and SCRIPTS_FROM files."""
+    global CHECKED_MATH_FUNC_SOURCES
+    env_scripts = os.environ.get("ACCELERGY_MATH_FUNCTIONS", "")
+    sources = (env_scripts, len(SCRIPTS_FROM))
+    if sources == CHECKED_MATH_FUNC_SOURCES:
+        return
+    scripts = [s.strip() for s in env_scripts.split(":") if s.strip()]
     scripts += SCRIPTS_FROM
     for script in scripts:
         if script in LOADED_MATH_FUNCS_FROM:
             continue
         load_functions_from_file(script)
+    CHECKED_MATH_FUNC_SOURCES = sources
 
 
 set_script_paths()
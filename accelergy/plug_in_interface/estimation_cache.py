@@ -0,0 +1,303 @@
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+from accelergy.plug_in_interface.interface import (
+    AccelergyQuery,
+    AccuracyEstimation,
+    Estimation,
+    UnitOption,
+)
+from accelergy.utils.utils import INFO, WARN, create_folder, freeze
+import accelergy.version as version
+
+CACHE_FILE_NAME = "estimations.sqlite"
+DEFAULT_MAX_ENTRIES = 100000
+SQLITE_TIMEOUT_SECONDS = 60
+PERSISTABLE_TYPES = (str, int, float, bool, type(None), dict, list)
+SOURCE_FILE_HASHES = {}
+
+
+class EstimationCache:
+    """
+    In-run memoization of plug-in estimations. Entries are keyed by the canonical form of the
+    query (see AccelergyQuery.to_hashable) and whether the query is for energy or area. Stored
+    estimations are cloned on the way in and on the way out, so callers may freely mutate the
+    estimations they receive. Misses may be backed by a PersistentEstimationCache that is
+    shared across runs. The cache may be used from multiple threads.
+    """
+
+    def __init__(self, persistent: "PersistentEstimationCache" = None):
+        self.entries: Dict[Hashable, Estimation] = {}
+        self.hits = 0
+        self.misses = 0
+        self.persistent = persistent
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(query: AccelergyQuery, is_energy_estimation: bool) -> Optional[tuple]:
+        """Returns the cache key for a query, or None if the query can not be hashed."""
+        try:
+            return (is_energy_estimation, query.to_hashable())
+        except TypeError:
+            return None
+
+    def get(self, key: Optional[tuple]) -> Optional[Estimation]:
+        """Returns a clone of the cached estimation for the key, or None if not cached."""
+        with self._lock:
+            if key is not None and key in self.entries:
+                self.hits += 1
+                return self.entries[key].clone()
+            self.misses += 1
+            return None
+
+    def put(self, key: Optional[tuple], estimation: Estimation):
+        """Caches a clone of a successful estimation for the key."""
+        if key is not None and estimation.success:
+            with self._lock:
+                self.entries[key] = estimation.clone()
+
+    def __contains__(self, key: Optional[tuple]) -> bool:
+        with self._lock:
+            return key is not None and key in self.entries
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __str__(self):
+        s = f"{len(self)} cached estimations, {self.hits} hits, {self.misses} misses"
+        if self.persistent is not None:
+            s += f", {self.persistent}"
+        return s
+
+
+def get_default_cache_dir() -> str:
+    """Returns the default directory of the persistent estimation cache."""
+    return os.path.join(os.path.expanduser("~"), ".config", "accelergy", "cache")
+
+
+def get_plug_in_source_hash(plug_in: Any) -> Optional[str]:
+    """
+    Returns a hash of the source file that defines a plug-in, or None if the source file can not
+    be found. Python plug-ins are hashed by the file defining the wrapped Estimator class.
+    Plug-ins that have not been imported yet (LazyEstimatorWrapper) provide the hash of their
+    source file as source_hash.
+    """
+    if getattr(plug_in, "source_hash", None) is not None:
+        return plug_in.source_hash
+    plug_in_cls = getattr(plug_in, "estimator_cls", type(plug_in))
+    try:
+        path = os.path.abspath(inspect.getsourcefile(plug_in_cls))
+    except (TypeError, OSError):
+        return None
+    if path not in SOURCE_FILE_HASHES:
+        try:
+            with open(path, "rb") as f:
+                SOURCE_FILE_HASHES[path] = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            SOURCE_FILE_HASHES[path] = None
+    return SOURCE_FILE_HASHES[path]
+
+
+def _stable_repr(frozen: Any) -> str:
+    """
+    Returns a representation of a frozen value (see utils.freeze) that is stable across
+    processes. Raises TypeError for values whose representation may not be stable, such as
+    callables or other objects that are represented by their memory address.
+    """
+    if isinstance(frozen, tuple):
+        return "(" + ",".join(_stable_repr(f) for f in frozen) + ")"
+    if isinstance(frozen, type):
+        if frozen not in PERSISTABLE_TYPES:
+            raise TypeError(f"Values of type {frozen} can not be persisted.")
+        return frozen.__name__
+    if type(frozen) not in PERSISTABLE_TYPES:
+        raise TypeError(f"Values of type {type(frozen)} can not be persisted.")
+    return repr(frozen)
+
+
+class PersistentEstimationCache:
+    """
+    On-disk cache of plug-in estimations shared across Accelergy runs. Entries are keyed by the
+    canonical query and the name of the plug-in that estimated it. Each entry records a
+    fingerprint of the plug-in source file hash, the plug-in's reported accuracy, and the
+    Accelergy version; entries with a stale fingerprint are treated as misses and overwritten.
+    Other files that a plug-in reads, such as tables of data, are not part of the fingerprint,
+    so the cache is only used when requested (accelergy --cache). Entries made before such files
+    change must be cleared by deleting the cache directory.
+
+    The cache is a SQLite database in write-ahead-logging mode, so many Accelergy processes may
+    read and write it at once. Once more than max_entries entries are stored, the least recently
+    used entries are evicted when the cache is closed. Any database error disables the cache for
+    the remainder of the run rather than failing the run.
+    """
+
+    def __init__(self, cache_dir: str = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir if cache_dir is not None else get_default_cache_dir()
+        self.path = os.path.join(self.cache_dir, CACHE_FILE_NAME)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._used_keys = set()
+        self._lock = threading.Lock()
+        self._connection = None
+        try:
+            create_folder(self.cache_dir)
+            self._connection = sqlite3.connect(
+                self.path, timeout=SQLITE_TIMEOUT_SECONDS, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS estimations ("
+                    "key TEXT PRIMARY KEY, "
+                    "fingerprint TEXT NOT NULL, "
+                    "value REAL NOT NULL, "
+                    "unit TEXT NOT NULL, "
+                    "messages TEXT NOT NULL, "
+                    "last_used REAL NOT NULL)"
+                )
+            INFO(f"Using persistent estimation cache at {self.path}")
+        except (sqlite3.Error, OSError) as e:
+            self._disable(e)
+
+    def _disable(self, error: Exception):
+        WARN(
+            f"Persistent estimation cache at {self.path} is disabled due to an error: "
+            f"{type(error).__name__}: {error}"
+        )
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except sqlite3.Error:
+                pass
+        self._connection = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._connection is not None
+
+    def get_key(
+        self,
+        plug_in_name: str,
+        query: AccelergyQuery,
+        is_energy_estimation: bool,
+    ) -> Optional[str]:
+        """
+        Returns the cache key for a plug-in and query, or None if the query can not be persisted.
+        """
+        try:
+            to_hash = _stable_repr(
+                freeze(
+                    (
+                        plug_in_name,
+                        is_energy_estimation,
+                        query.input_file_version,
+                        query.class_name,
+                        query.class_attrs,
+                        query.action_name,
+                        query.action_args,
+                    )
+                )
+            )
+        except TypeError:
+            return None
+        return hashlib.sha256(to_hash.encode()).hexdigest()
+
+    @staticmethod
+    def get_fingerprint(plug_in: Any, accuracy: AccuracyEstimation) -> Optional[str]:
+        """
+        Returns the fingerprint that cached entries for a plug-in must match to be valid, or None
+        if the plug-in's source can not be located.
+        """
+        source_hash = get_plug_in_source_hash(plug_in)
+        if source_hash is None:
+            return None
+        return f"{source_hash}:{accuracy.value}:{version.__version__}"
+
+    def get(
+        self, key: Optional[str], fingerprint: Optional[str]
+    ) -> Optional[Estimation]:
+        """Returns the cached estimation for the key if it is present and up to date."""
+        if not self.enabled or key is None or fingerprint is None:
+            return None
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT fingerprint, value, unit, messages FROM estimations "
+                    "WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None or row[0] != fingerprint:
+                    self.misses += 1
+                    return None
+                self.hits += 1
+                self._used_keys.add(key)
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+        estimation = Estimation(row[1], UnitOption[row[2]])
+        estimation.add_messages(json.loads(row[3]))
+        estimation.add_messages("Loaded from the persistent estimation cache.")
+        return estimation
+
+    def put(
+        self, key: Optional[str], fingerprint: Optional[str], estimation: Estimation
+    ):
+        """Stores a successful estimation for the key."""
+        if not self.enabled or key is None or fingerprint is None:
+            return
+        if not estimation.success:
+            return
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO estimations "
+                    "(key, fingerprint, value, unit, messages, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        fingerprint,
+                        float(estimation.value),
+                        estimation.unit.name,
+                        json.dumps([str(m) for m in estimation.messages]),
+                        time.time(),
+                    ),
+                )
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def close(self):
+        """Records entry usage, evicts least recently used entries, and closes the cache."""
+        if not self.enabled:
+            return
+        try:
+            with self._lock, self._connection:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE estimations SET last_used = ? WHERE key = ?",
+                    [(now, k) for k in self._used_keys],
+                )
+                self._connection.execute(
+                    "DELETE FROM estimations WHERE key IN (SELECT key FROM estimations "
+                    "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            self._connection.close()
+        except sqlite3.Error as e:
+            self._disable(e)
+        self._connection = None
+        self._used_keys.clear()
+
+    def __str__(self):
+        return f"{self.hits} persistent hits, {self.misses} persistent misses"
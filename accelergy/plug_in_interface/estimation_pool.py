@@ -0,0 +1,256 @@
+import logging
+import math
+import multiprocessing.util
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from accelergy.plug_in_interface.interface import AccelergyQuery, Estimation
+from accelergy.plug_in_interface.estimation_cache import (
+    EstimationCache,
+    PersistentEstimationCache,
+)
+from accelergy.plug_in_interface.plug_in_manifest import PlugInManifest
+from accelergy.plug_in_interface.query_plug_ins import (
+    get_best_estimate,
+    iter_best_estimates,
+)
+from accelergy.plug_in_path_to_obj import plug_in_path_to_obj
+from accelergy.system_state import SystemState
+import accelergy.version as version
+
+# Number of batches sent to each worker. More batches balance load better, fewer batches have
+# less overhead.
+BATCHES_PER_WORKER = 4
+
+# State of a worker process, set by _init_worker
+WORKER_STATE = {}
+
+
+class _RecordingHandler(logging.Handler):
+    """Records (level, message) pairs so they can be sent to the parent process."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append((record.levelno, record.getMessage()))
+
+
+def to_payload(value: Any) -> Any:
+    """
+    Returns a copy of a query or one of its values made only of built-in types, so it can be
+    sent to another process. String and number subclasses (e.g. ruamel scalars) become their
+    built-in base types. Raises TypeError for other values, such as callables.
+    """
+    if value is None:
+        return None
+    for base in (str, bool, int, float):
+        if isinstance(value, base):
+            return base(value)
+    if isinstance(value, dict):
+        return {str(k): to_payload(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(to_payload(v) for v in value)
+    if isinstance(value, list):
+        return [to_payload(v) for v in value]
+    raise TypeError(
+        f"Values of type {type(value)} can not be sent to worker processes."
+    )
+
+
+def _init_worker(
+    estimator_paths: List[str],
+    python_paths: List[str],
+    output_prefix: str,
+    input_version: float,
+    log_level: int,
+    persistent_cache_dir: Optional[str],
+    manifest_dir: Optional[str],
+):
+    """
+    Loads plug-ins once per worker process and captures the worker's log messages. The
+    worker's plug-in manifest and persistent cache are closed when the worker exits.
+    """
+    root = logging.getLogger("")
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = _RecordingHandler()
+    root.addHandler(handler)
+    root.setLevel(log_level)
+    version.INPUT_VERSION = input_version
+
+    manifest = persistent = None
+    if manifest_dir is not None:
+        manifest = PlugInManifest(manifest_dir)
+    if persistent_cache_dir is not None:
+        persistent = PersistentEstimationCache(persistent_cache_dir)
+    system_state = SystemState()
+    system_state.add_plug_ins(
+        plug_in_path_to_obj(
+            list(estimator_paths), list(python_paths), output_prefix, manifest
+        )
+    )
+    system_state.estimation_cache.persistent = persistent
+    WORKER_STATE.update(
+        {
+            "plug_ins": system_state.plug_in_index,
+            "estimation_cache": system_state.estimation_cache,
+            "handler": handler,
+            "manifest": manifest,
+            "persistent_cache": persistent,
+        }
+    )
+    # Workers do not run atexit hooks, but run multiprocessing finalizers when they exit
+    multiprocessing.util.Finalize(None, _close_worker, exitpriority=10)
+    # The parent process has already logged plug-in loading
+    handler.records.clear()
+
+
+def _close_worker():
+    """
+    Saves the worker's plug-in manifest and closes its persistent cache, which records the
+    entries the worker used so they are not evicted as unused.
+    """
+    if WORKER_STATE.get("manifest") is not None:
+        WORKER_STATE["manifest"].save()
+    if WORKER_STATE.get("persistent_cache") is not None:
+        WORKER_STATE["persistent_cache"].close()
+
+
+def _estimate_batch(
+    queries: List[Dict[str, Any]], is_energy_estimation: bool
+) -> List[Tuple[Optional[Estimation], List[Tuple[int, str]]]]:
+    """
+    Estimates a batch of queries in a worker process. The batch is estimated together, so
+    queries that select the same plug-in are sent to its batch estimation method. Returns an
+    (estimation, log records) pair for each query; records logged while the batch is
+    estimated are returned with the first query. If a query can not be estimated, its
+    estimation is None and no later queries are returned.
+    """
+    handler = WORKER_STATE["handler"]
+    handler.records = []
+    results = []
+    try:
+        for estimation in iter_best_estimates(
+            WORKER_STATE["plug_ins"],
+            queries,
+            is_energy_estimation,
+            WORKER_STATE["estimation_cache"],
+        ):
+            estimation.messages = [str(m) for m in estimation.messages]
+            results.append((estimation, handler.records))
+            handler.records = []
+    except SystemExit:
+        results.append((None, handler.records))
+    return results
+
+
+class EstimationProcessPool:
+    """
+    Pool of worker processes that estimate queries. Unlike threads, workers are not limited by
+    the global interpreter lock, so Python-heavy plug-ins can run in parallel.
+
+    Each worker loads the plug-ins once from the same paths as the parent process. Queries are
+    sent to workers in batches made only of built-in types (see to_payload), and estimations
+    are returned along with the log messages that were emitted while estimating them. The
+    parent process emits these messages in query order, so verbose output is preserved.
+    Queries that are in the parent's estimation cache or can not be sent to workers (e.g.
+    attributes that are functions) are estimated in the parent process, and estimations made
+    by workers are added to the parent's estimation cache.
+    """
+
+    def __init__(
+        self,
+        jobs: int,
+        estimator_paths: List[str],
+        python_paths: List[str],
+        output_prefix: str = "",
+        persistent_cache_dir: Optional[str] = None,
+        manifest_dir: Optional[str] = None,
+    ):
+        self.jobs = jobs
+        self.executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(
+                [str(p) for p in estimator_paths],
+                [str(p) for p in python_paths],
+                str(output_prefix),
+                version.INPUT_VERSION,
+                logging.getLogger("").level,
+                persistent_cache_dir,
+                manifest_dir,
+            ),
+        )
+
+    def get_best_estimates(
+        self,
+        plug_ins: Any,
+        queries: List[Dict[str, Any]],
+        is_energy_estimation: bool,
+        estimation_cache: EstimationCache = None,
+    ) -> List[Estimation]:
+        """
+        Returns the best estimate for each query, in order. plug_ins and estimation_cache are
+        used for queries that are estimated in the parent process, and estimation_cache
+        stores the estimations made by workers.
+        """
+        payloads, keys = [], []
+        for query in queries:
+            key = None
+            if estimation_cache is not None:
+                key = estimation_cache.get_key(
+                    AccelergyQuery.from_interface_dict(query, check=False),
+                    is_energy_estimation,
+                )
+            keys.append(key)
+            if estimation_cache is not None and key in estimation_cache:
+                payloads.append(None)
+                continue
+            try:
+                payloads.append(to_payload(query))
+            except TypeError:
+                payloads.append(None)
+
+        to_send = [p for p in payloads if p is not None]
+        batch_size = max(1, math.ceil(len(to_send) / (self.jobs * BATCHES_PER_WORKER)))
+        futures = [
+            self.executor.submit(
+                _estimate_batch, to_send[i : i + batch_size], is_energy_estimation
+            )
+            for i in range(0, len(to_send), batch_size)
+        ]
+
+        def iter_results():
+            for f in futures:
+                for result in f.result():
+                    yield result
+
+        results = iter_results()
+        estimations = []
+        try:
+            for query, payload, key in zip(queries, payloads, keys):
+                if payload is None:
+                    estimations.append(
+                        get_best_estimate(
+                            plug_ins, query, is_energy_estimation, estimation_cache
+                        )
+                    )
+                    continue
+                estimation, records = next(results)
+                for level, message in records:
+                    logging.getLogger("").log(level, message)
+                if estimation is None:
+                    sys.exit(1)
+                if estimation_cache is not None:
+                    estimation_cache.put(key, estimation)
+                estimations.append(estimation)
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
+        return estimations
+
+    def close(self):
+        self.executor.shutdown()
@@ -18,6 +18,22 @@ def actionDynamicEnergy(func: Callable) -> Callable:
     return func
 
 
+def separableArguments(*argument_names: str) -> Callable:
+    """
+    Decorator that declares that each of the given arguments of an action changes its energy
+    independently of the other arguments, i.e., the energy is the energy with every argument at
+    its first value plus the change from each argument taking its own value. Accelergy then
+    estimates each argument's range with the others at their first values and sums the
+    changes, instead of estimating every combination of values. Use with @actionDynamicEnergy.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func._separable_arguments = tuple(argument_names)
+        return func
+
+    return decorator
+
+
 class Estimator(ListLoggable, ABC):
     """
     Estimator base class. Estimator class must have "name" attribute, "percent_accuracy_0_to_100"
@@ -27,6 +43,11 @@ class Estimator(ListLoggable, ABC):
 
     name: Union[str, List[str]] = None
     percent_accuracy_0_to_100: Number = None
+    # Set to False if the estimator may not be called from multiple threads at once
+    thread_safe: bool = True
+    # Set to False if actions change the estimator's state, so that each query is estimated by
+    # a newly-initialized estimator
+    reuse_instances: bool = True
 
     def __init__(self, name: str = None):
         super().__init__(name=name)
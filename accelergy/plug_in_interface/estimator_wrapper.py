@@ -1,10 +1,12 @@
 import copy
 import inspect
 import logging
+import threading
+from collections import OrderedDict
 from numbers import Number
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional, Set, Union
-from accelergy.utils.utils import INFO, WARN
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from accelergy.utils.utils import INFO, WARN, freeze
 from accelergy.plug_in_interface.interface import (
     AccelergyPlugIn,
     AccelergyQuery,
@@ -14,6 +16,9 @@ from accelergy.plug_in_interface.interface import (
 from accelergy.plug_in_interface.estimator import Estimator
 from accelergy.utils.logging import move_queue_from_one_logger_to_another
 
+# Maximum number of initialized estimators kept by each EstimatorWrapper for reuse
+INITIALIZED_ESTIMATOR_POOL_SIZE = 128
+
 
 class PrintableCall:
     def __init__(
@@ -49,6 +54,23 @@ class SupportedComponent:
         self.actions = actions
 
 
+class CallPlan:
+    """
+    Argument matching for one function and one ordered set of provided argument names.
+    Computed once per set of names by CallableFunction.get_call_plan.
+    """
+
+    def __init__(
+        self,
+        used_keys: tuple,
+        unused_warning: Optional[str],
+        missing_args: bool,
+    ):
+        self.used_keys = used_keys
+        self.unused_warning = unused_warning
+        self.missing_args = missing_args
+
+
 class CallableFunction:
     """Wrapper for a function to provide error checking and argument matching."""
 
@@ -82,6 +104,32 @@ class CallableFunction:
             function.__defaults__ if function.__defaults__ is not None else []
         )
         self.logger = logger
+        self.call_plans = {}
+
+    def get_call_plan(self, kwargs: Optional[dict], class_name: str = "") -> CallPlan:
+        """Returns the call plan for the names of the provided kwargs."""
+        keys = tuple(kwargs) if kwargs else ()
+        class_name = str(class_name)
+        plan = self.call_plans.get((keys, class_name))
+        if plan is not None:
+            return plan
+        used_keys = tuple(
+            k for k in keys if k in self.non_default_args or k in self.default_args
+        )
+        unused_keys = [k for k in keys if k not in used_keys]
+        unused_warning = None
+        if unused_keys:
+            unused_warning = (
+                f'Unused arguments ({", ".join(unused_keys)}) provided for {class_name}.'
+                f'{self.function_name}. Arguments used: ({", ".join(used_keys)})'
+            )
+        plan = CallPlan(
+            used_keys,
+            unused_warning,
+            any(a not in keys for a in self.non_default_args),
+        )
+        self.call_plans[(keys, class_name)] = plan
+        return plan
 
     def get_error_message_for_name_match(self, name: str, class_name: str = ""):
         if self.function_name != name:
@@ -105,28 +153,38 @@ class CallableFunction:
         name_error = self.get_error_message_for_name_match(name, class_name)
         if name_error is not None:
             return name_error
+        if not self.get_call_plan(kwargs, class_name).missing_args:
+            for arg in self.non_default_args:
+                if kwargs[arg] is None:
+                    break
+            else:
+                return None
         arg_error = self.get_error_message_for_non_default_arg_match(kwargs, class_name)
         if arg_error is not None:
             return arg_error
         return None
 
+    def get_used_kwargs(self, kwargs: dict) -> dict:
+        """Returns the subset of kwargs that are arguments of the function."""
+        return {k: kwargs[k] for k in self.get_call_plan(kwargs).used_keys}
+
+    def warn_unused_kwargs(self, kwargs: dict, class_name: str = ""):
+        warning = self.get_call_plan(kwargs, class_name).unused_warning
+        if warning is not None:
+            self.logger.warn(warning)
+
     def call(
         self,
         kwargs: dict,
         class_name: str = "",
         call_function_on_object: object = None,
     ) -> Any:
-        kwags_included = {
-            k: v
-            for k, v in kwargs.items()
-            if k in self.non_default_args or k in self.default_args
-        }
-        unneeded_args = [k for k in kwargs.keys() if k not in kwags_included]
-        if unneeded_args:
-            self.logger.warn(
-                f'Unused arguments ({", ".join(unneeded_args)}) provided for {class_name}.'
-                f'{self.function_name}. Arguments used: ({", ".join(kwags_included.keys())})'
-            )
+        plan = self.get_call_plan(kwargs, class_name)
+        if plan.unused_warning is None:
+            kwags_included = kwargs or {}
+        else:
+            self.logger.warn(plan.unused_warning)
+            kwags_included = {k: kwargs[k] for k in plan.used_keys}
 
         if call_function_on_object is not None:
             return self.function(call_function_on_object, **kwags_included)
@@ -145,6 +203,9 @@ class CallableFunction:
 class EstimatorWrapper(AccelergyPlugIn):
     """Accelergy primitive component estimator that wraps a Python class."""
 
+    # Queries are declined by class name, action name, and missing arguments
+    support_depends_on_values = False
+
     def __init__(self, estimator_cls: type, class_name: str):
         check_for_valid_estimator_attrs(estimator_cls)
         self.estimator_cls = estimator_cls
@@ -153,6 +214,10 @@ class EstimatorWrapper(AccelergyPlugIn):
         super().__init__()
 
         self.percent_accuracy = estimator_cls.percent_accuracy_0_to_100
+        self.thread_safe = getattr(estimator_cls, "thread_safe", True)
+        self.reuse_instances = getattr(estimator_cls, "reuse_instances", True)
+        self.initialized_estimators = OrderedDict()
+        self._initialized_estimators_lock = threading.Lock()
         self.get_area = CallableFunction(estimator_cls.get_area, self.logger)
         self.leak = CallableFunction(estimator_cls.leak, self.logger)
         self.init_function = CallableFunction(estimator_cls, self.logger, is_init=True)
@@ -175,6 +240,17 @@ class EstimatorWrapper(AccelergyPlugIn):
     def get_action_names(self) -> List[str]:
         return [a.function_name for a in self.actions]
 
+    def get_separable_arguments(self, action_name: str) -> Tuple[str, ...]:
+        """Arguments declared with @separableArguments by every action with the name."""
+        separable = None
+        for a in self.actions:
+            if a.function_name == action_name:
+                names = getattr(a.function, "_separable_arguments", ())
+                separable = names if separable is None else separable
+                if names != separable:
+                    return ()
+        return separable or ()
+
     def fail_missing(self, missing: str):
         raise AttributeError(
             f"Primitive component {self.class_name} " f"must have {missing}"
@@ -199,8 +275,39 @@ class EstimatorWrapper(AccelergyPlugIn):
         return True
 
     def get_initialized_subclass(self, query: AccelergyQuery) -> Estimator:
+        """
+        Returns an estimator initialized with the query's attributes. Estimators are reused for
+        queries that pass the same arguments to __init__, so each set of attributes is
+        initialized once. The least recently used estimators are discarded once more than
+        INITIALIZED_ESTIMATOR_POOL_SIZE are kept. Estimators with reuse_instances = False are
+        initialized for every query.
+        """
+        key = subclass = None
+        if self.reuse_instances:
+            try:
+                key = freeze(self.init_function.get_used_kwargs(query.class_attrs))
+            except TypeError:
+                pass
+        if key is not None:
+            with self._initialized_estimators_lock:
+                subclass = self.initialized_estimators.get(key)
+                if subclass is not None:
+                    self.initialized_estimators.move_to_end(key)
+            if subclass is not None:
+                self.init_function.warn_unused_kwargs(
+                    query.class_attrs, self.class_name
+                )
+                return subclass
+
         subclass = self.init_function.call(query.class_attrs, self.class_name)
         subclass.__ListLoggable__init__()
+
+        if key is not None:
+            with self._initialized_estimators_lock:
+                self.initialized_estimators[key] = subclass
+                pool = self.initialized_estimators
+                while len(pool) > INITIALIZED_ESTIMATOR_POOL_SIZE:
+                    pool.popitem(last=False)
         return subclass
 
     def get_matching_actions(self, query: AccelergyQuery) -> List[CallableFunction]:
@@ -258,6 +365,8 @@ class EstimatorWrapper(AccelergyPlugIn):
     def estimate_energy(self, query: AccelergyQuery) -> Estimation:
         """Returns the energy estimation for the given action."""
         initialized_obj = self.get_initialized_subclass(query)
+        # Reused estimators may be called by several threads at once. Log queues are kept per
+        # thread, so only the messages of this call are moved.
         move_queue_from_one_logger_to_another(initialized_obj.logger, self.logger)
         supported_actions = self.get_matching_actions(query)
         if len(supported_actions) == 0:
@@ -280,6 +389,9 @@ class EstimatorWrapper(AccelergyPlugIn):
     def get_name(self) -> str:
         return self.estimator_name
 
+    def get_max_accuracy(self) -> Number:
+        return self.percent_accuracy
+
     def get_class_names(self) -> List[str]:
         return (
             [self.class_name] if isinstance(self.class_name, str) else self.class_name
@@ -289,6 +401,100 @@ class EstimatorWrapper(AccelergyPlugIn):
     def print_action(action: CallableFunction) -> str:
         return action.function_name
 
+    def get_description(self) -> Dict[str, Any]:
+        """
+        Returns what a LazyEstimatorWrapper needs to know about this estimator, as a
+        JSON-serializable dictionary.
+        """
+        return {
+            "class_names": self.class_name,
+            "actions": self.get_action_names(),
+            "percent_accuracy": self.percent_accuracy,
+            "thread_safe": self.thread_safe,
+            "init_function": str(self.init_function),
+            "action_calls": [str(a) for a in self.actions],
+            "separable_arguments": {
+                name: list(self.get_separable_arguments(name))
+                for name in self.get_action_names()
+                if self.get_separable_arguments(name)
+            },
+        }
+
+
+class LazyEstimatorWrapper(AccelergyPlugIn):
+    """
+    Stand-in for an EstimatorWrapper whose module has not been imported. The names, actions,
+    and accuracy of the estimator are known from its description (see
+    EstimatorWrapper.get_description), so the plug-in can be indexed and ranked without
+    importing the module. The module is imported the first time the plug-in is asked whether
+    it supports a query or to estimate one. module must have a load() method that returns
+    the imported module.
+    """
+
+    support_depends_on_values = False
+
+    def __init__(
+        self,
+        module: Any,
+        estimator_name: str,
+        description: Dict[str, Any],
+        source_hash: str = None,
+    ):
+        self.module = module
+        self.estimator_name = estimator_name
+        self.class_name = description["class_names"]
+        self.action_names = list(description["actions"])
+        self.percent_accuracy = description["percent_accuracy"]
+        self.thread_safe = description["thread_safe"]
+        self.supported_component = SupportedComponent(
+            self.class_name, description["init_function"], description["action_calls"]
+        )
+        self.separable_arguments = description.get("separable_arguments", {})
+        self.source_hash = source_hash
+        self._wrapper = None
+        self._lock = threading.Lock()
+        super().__init__()
+
+    def get_wrapper(self) -> EstimatorWrapper:
+        """Imports the module if needed and returns the wrapped estimator."""
+        with self._lock:
+            if self._wrapper is None:
+                estimator_cls = getattr(self.module.load(), self.estimator_name)
+                self._wrapper = EstimatorWrapper(estimator_cls, self.estimator_name)
+        return self._wrapper
+
+    def primitive_action_supported(self, query: AccelergyQuery) -> AccuracyEstimation:
+        return self.get_wrapper().primitive_action_supported(query)
+
+    def primitive_area_supported(self, query: AccelergyQuery) -> AccuracyEstimation:
+        return self.get_wrapper().primitive_area_supported(query)
+
+    def estimate_energy(self, query: AccelergyQuery) -> Estimation:
+        return self.get_wrapper().estimate_energy(query)
+
+    def estimate_area(self, query: AccelergyQuery) -> Estimation:
+        return self.get_wrapper().estimate_area(query)
+
+    def get_name(self) -> str:
+        return self.estimator_name
+
+    def get_max_accuracy(self) -> Number:
+        return self.percent_accuracy
+
+    def get_class_names(self) -> List[str]:
+        return (
+            [self.class_name] if isinstance(self.class_name, str) else self.class_name
+        )
+
+    def get_action_names(self) -> List[str]:
+        return self.action_names
+
+    def get_separable_arguments(self, action_name: str) -> Tuple[str, ...]:
+        return tuple(self.separable_arguments.get(action_name, ()))
+
+    def get_supported_components(self) -> List[SupportedComponent]:
+        return [self.supported_component]
+
 
 def get_all_estimators_in_module(
     module: ModuleType, plug_in_ids: Set
@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
+import copy
 from dataclasses import dataclass
 from enum import Enum
 from math import floor, log10
 from numbers import Number
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from accelergy.utils.logging import ListLoggable
+from accelergy.utils.utils import freeze
 import accelergy.version as version
 
 from accelergy.parsing_utils import (
@@ -128,6 +130,15 @@ class Estimation:
     def __str__(self):
         return f"{self.value}{self.unit}"
 
+    def clone(self) -> "Estimation":
+        """
+        Returns a copy of this estimation with its own message list. The copy can be mutated
+        without affecting the original.
+        """
+        cloned = copy.copy(self)
+        cloned.messages = list(self.messages)
+        return cloned
+
     @classmethod
     def from_value(cls, value: Union[Number, "Estimation"]) -> "Estimation":
         if isinstance(value, Estimation):
@@ -216,11 +227,12 @@ class AccelergyQuery:
             s += f".{self.action_name}({args_stringified})"
         return s
 
-    def from_interface_dict(d: Dict[str, Any]) -> "AccelergyQuery":
+    def from_interface_dict(d: Dict[str, Any], check: bool = True) -> "AccelergyQuery":
         """
         Creates an AccelergyQuery from a dictionary. The dictionary is the same as the general
         internal representation in Accelergy, with "class_name", "attributes", "action_name", and
-        "arguments" keys.
+        "arguments" keys. If check is False, the attributes and arguments that must be numeric
+        are not checked.
         """
         # In case plug-ins don't like that the provided strings are subclasses of str, we convert
         attributes = {
@@ -236,12 +248,29 @@ class AccelergyQuery:
             a.action_name = d["action_name"]
             a.action_args = d["arguments"] if d["arguments"] is not None else {}
 
-        assert_required_keys_numeric(a.class_attrs or {}, f"{a.class_name} attributes")
-        assert_required_keys_numeric(
-            a.action_args or {}, f"{a.class_name} action arguments", True
-        )
+        if check:
+            assert_required_keys_numeric(
+                a.class_attrs or {}, f"{a.class_name} attributes"
+            )
+            assert_required_keys_numeric(
+                a.action_args or {}, f"{a.class_name} action arguments", True
+            )
         return a
 
+    def to_hashable(self) -> tuple:
+        """
+        Returns a hashable, canonical representation of this query. Queries with the same class
+        name, attributes, action name, and arguments have equal representations regardless of
+        attribute ordering or ruamel string types. Raises TypeError if an attribute or argument
+        can not be hashed.
+        """
+        return (
+            self.class_name,
+            freeze(self.class_attrs),
+            self.action_name,
+            freeze(self.action_args),
+        )
+
     def to_legacy_interface_dict(self) -> Dict[str, Any]:
         """Creates a dictionary in the legacy interface format."""
         d = {
@@ -258,6 +287,14 @@ class AccelergyQuery:
 
 
 class AccelergyPlugIn(ListLoggable, ABC):
+    # Set to False if the plug-in may not be called from multiple threads at once
+    thread_safe: bool = True
+    # Set to False if primitive_action_supported and primitive_area_supported decline queries
+    # based only on the class name, the action name, and which attributes and arguments are
+    # given (and not None). Declined queries are then remembered by their shape, and the
+    # plug-in is not asked again for queries of the same shape.
+    support_depends_on_values: bool = True
+
     def __AccelergyPlugIn__init__(self):  # Do not override this method
         """For internal use so users don't have to call super().__init__()"""
         super().__init__(name=self.get_name())
@@ -281,6 +318,25 @@ class AccelergyPlugIn(ListLoggable, ABC):
         exception if the plug-in cannot estimate the action.
         """
 
+    def estimate_energy_batch(self, queries: List[AccelergyQuery]) -> List[Estimation]:
+        """
+        Returns an Estimation with the energy of each query, in order. Override this to estimate
+        many queries at once, e.g. to launch an external tool once instead of once per query.
+        Only queries for which primitive_action_supported returned a nonzero accuracy are
+        passed. Raises an exception if any query cannot be estimated, in which case the queries
+        are estimated one at a time with estimate_energy. The default calls estimate_energy for
+        each query.
+        """
+        return [self.estimate_energy(query) for query in queries]
+
+    def get_separable_arguments(self, action_name: str) -> Tuple[str, ...]:
+        """
+        Returns the arguments of the action that change its energy independently of each other.
+        Accelergy may estimate the action while varying these arguments one at a time and sum
+        the changes in energy. The default is no separable arguments.
+        """
+        return ()
+
     @abstractmethod
     def primitive_area_supported(self, query: AccelergyQuery) -> AccuracyEstimation:
         """
@@ -296,8 +352,27 @@ class AccelergyPlugIn(ListLoggable, ABC):
         exception if the plug-in cannot estimate the area.
         """
 
+    def estimate_area_batch(self, queries: List[AccelergyQuery]) -> List[Estimation]:
+        """
+        Returns an Estimation with the area of each query, in order. Override this to estimate
+        many queries at once. Only queries for which primitive_area_supported returned a nonzero
+        accuracy are passed. Raises an exception if any query cannot be estimated, in which
+        case the queries are estimated one at a time with estimate_area. The default calls
+        estimate_area for each query.
+        """
+        return [self.estimate_area(query) for query in queries]
+
     @abstractmethod
     def get_name(self) -> str:
         """
         Returns the name of the plug-in.
         """
+
+    def get_max_accuracy(self) -> Optional[Number]:
+        """
+        Returns an upper bound on the percent accuracy that primitive_action_supported and
+        primitive_area_supported may return, or None if there is no bound. Plug-ins with lower
+        bounds are queried later and may not be queried at all if another plug-in gives a more
+        accurate estimate.
+        """
+        return None
@@ -0,0 +1,61 @@
+import threading
+from typing import Any, Callable, List, Optional, Union
+from accelergy.plug_in_interface.interface import AccelergyPlugIn
+from accelergy.utils.utils import INFO
+
+
+class LazyPlugIn:
+    """
+    Placeholder for plug-ins whose module has not been imported yet. The placeholder declares
+    the component classes that its plug-ins support, so PlugInIndex only routes queries for
+    those classes to it. The first time a query is routed to the placeholder, load_func is
+    called to import the module and create the plug-ins, which then replace the placeholder.
+    The placeholder itself can not estimate. If on_load is set, it is called with the loaded
+    plug-ins and returns the plug-ins to keep (see SystemState.check_plug_ins).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        class_names: Union[str, List[str]],
+        load_func: Callable[[], List[Any]],
+    ):
+        self.name = name
+        self.class_names = (
+            [class_names] if isinstance(class_names, str) else class_names
+        )
+        self.load_func = load_func
+        self.plug_ins = None
+        self.on_load: Optional[Callable[[List[Any]], List[Any]]] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> List[Any]:
+        """Returns the plug-ins, creating them on the first call."""
+        with self._lock:
+            if self.plug_ins is None:
+                INFO(
+                    f"Loading plug-in {self.name} for classes {', '.join(self.class_names)}"
+                )
+                plug_ins = list(self.load_func())
+                for plug_in in plug_ins:
+                    if isinstance(plug_in, AccelergyPlugIn) and not getattr(
+                        plug_in, "_accelergy_plug_in_initialized", False
+                    ):
+                        plug_in.__AccelergyPlugIn__init__()
+                if self.on_load is not None:
+                    plug_ins = list(self.on_load(plug_ins))
+                self.plug_ins = plug_ins
+        return self.plug_ins
+
+    @property
+    def loaded(self) -> bool:
+        return self.plug_ins is not None
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_class_names(self) -> List[str]:
+        return self.class_names
+
+    def __str__(self):
+        return f"{self.name} (not loaded, declares {', '.join(self.class_names)})"
@@ -0,0 +1,102 @@
+from typing import Any, Dict, Iterator, List, Optional, Set
+from accelergy.plug_in_interface.estimator_wrapper import (
+    EstimatorWrapper,
+    LazyEstimatorWrapper,
+)
+from accelergy.plug_in_interface.lazy_plug_in import LazyPlugIn
+
+
+class PlugInIndex:
+    """
+    Index from component class names to the plug-ins that may estimate them. Python plug-ins
+    (EstimatorWrapper and LazyEstimatorWrapper) declare their class names and actions statically, so they are only
+    consulted for queries they can answer. All other plug-ins may support any class (e.g. the
+    dummy "_anything_" plug-in) and are kept in a fallback bucket that is consulted for every
+    query. Candidates are always returned in the order the plug-ins were added, so plug-in
+    selection is unchanged for plug-ins with equal accuracy.
+
+    Placeholders for plug-ins that have not been loaded (LazyPlugIn) are indexed by the class
+    names they declare. When a placeholder is a candidate, its plug-ins are loaded and returned
+    in its place.
+
+    Iterating over the index yields all plug-ins.
+    """
+
+    def __init__(self, plug_ins: List[Any]):
+        self.plug_ins = list(plug_ins)
+        self.class_name_to_indices: Dict[str, List[int]] = {}
+        self.indices_to_actions: Dict[int, Optional[Set[str]]] = {}
+        self.fallback_indices: List[int] = []
+        self._candidates_cache = {}
+        for i, plug_in in enumerate(self.plug_ins):
+            if isinstance(plug_in, (EstimatorWrapper, LazyEstimatorWrapper)):
+                for class_name in plug_in.get_class_names():
+                    self.class_name_to_indices.setdefault(class_name, []).append(i)
+                self.indices_to_actions[i] = set(plug_in.get_action_names())
+            elif isinstance(plug_in, LazyPlugIn):
+                for class_name in plug_in.get_class_names():
+                    self.class_name_to_indices.setdefault(class_name, []).append(i)
+                self.indices_to_actions[i] = None
+            else:
+                self.fallback_indices.append(i)
+
+    def get_candidates(self, class_name: str, action_name: str = None) -> List[Any]:
+        """
+        Returns the plug-ins that may estimate the given class and action. If action_name is
+        None, returns the plug-ins that may estimate the area of the class.
+        """
+        key = (class_name, action_name)
+        if key not in self._candidates_cache:
+            indices = [
+                i
+                for i in self.class_name_to_indices.get(class_name, [])
+                if action_name is None
+                or self.indices_to_actions[i] is None
+                or action_name in self.indices_to_actions[i]
+            ]
+            self._candidates_cache[key] = resolve_lazy_plug_ins(
+                [self.plug_ins[i] for i in sorted(indices + self.fallback_indices)],
+                class_name,
+                action_name,
+            )
+        return self._candidates_cache[key]
+
+    @staticmethod
+    def supports(plug_in: Any, class_name: str, action_name: str = None) -> bool:
+        """
+        Returns False if the plug-in declares that it does not support the class and action.
+        Plug-ins that do not declare what they support may support anything.
+        """
+        if not isinstance(plug_in, (EstimatorWrapper, LazyEstimatorWrapper)):
+            return True
+        if class_name not in plug_in.get_class_names():
+            return False
+        return action_name is None or action_name in plug_in.get_action_names()
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.plug_ins)
+
+    def __len__(self) -> int:
+        return len(self.plug_ins)
+
+
+def resolve_lazy_plug_ins(
+    plug_ins: List[Any], class_name: str, action_name: str = None
+) -> List[Any]:
+    """
+    Returns the plug-ins with each placeholder (LazyPlugIn) that declares the class replaced
+    by the plug-ins it loads that may estimate the class and action. Placeholders that do not
+    declare the class are dropped without being loaded. Every caller that queries plug-ins
+    must resolve placeholders, which can not estimate.
+    """
+    resolved = []
+    for plug_in in plug_ins:
+        if not isinstance(plug_in, LazyPlugIn):
+            resolved.append(plug_in)
+        elif class_name in plug_in.get_class_names():
+            resolved += [
+                p
+                for p in plug_in.load()
+                if PlugInIndex.supports(p, class_name, action_name)
+            ]
+    return resolved
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+from accelergy.plug_in_interface.estimation_cache import get_default_cache_dir
+from accelergy.utils.utils import INFO, WARN, create_folder
+import accelergy.version as version
+
+MANIFEST_FILE_NAME = "plug_in_manifest.json"
+MANIFEST_FORMAT_VERSION = 2
+
+
+def get_file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class PlugInManifest:
+    """
+    On-disk record of plug-in discovery shared across Accelergy runs. For each plug-in file,
+    the manifest stores the file's modification time, size, and content hash along with what
+    was discovered in it (e.g. the estimator classes of a Python plug-in and their names,
+    actions, and accuracies). For each plug-in directory, it stores the files found in the
+    directory and the modification time of every directory walked, so unchanged directories
+    need not be walked again.
+
+    A file entry is valid while the file's modification time and size are unchanged. If they
+    change but the content hash does not, the entry is kept. Entries recorded by other
+    Accelergy versions are discarded. Errors reading or writing the manifest are reported and
+    leave the manifest empty rather than failing the run.
+    """
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir if cache_dir is not None else get_default_cache_dir()
+        self.path = os.path.join(self.cache_dir, MANIFEST_FILE_NAME)
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.directories: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.changed = False
+        self._lock = threading.Lock()
+        try:
+            with open(self.path) as f:
+                contents = json.load(f)
+            if contents.get("format_version") == MANIFEST_FORMAT_VERSION and (
+                contents.get("accelergy_version") == version.__version__
+            ):
+                self.files = contents["files"]
+                self.directories = contents["directories"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            WARN(
+                f"Could not read plug-in manifest at {self.path}. Plug-ins will be "
+                f"discovered again. {type(e).__name__}: {e}"
+            )
+
+    def get_file_entry(self, path: str) -> Any:
+        """Returns the data recorded for a file, or None if the file has changed."""
+        path = os.path.abspath(path)
+        with self._lock:
+            entry = self.files.get(path)
+            try:
+                stat = os.stat(path)
+                if entry is not None and (
+                    entry["mtime_ns"] != stat.st_mtime_ns
+                    or entry["size"] != stat.st_size
+                ):
+                    if entry["sha256"] != get_file_hash(path):
+                        entry = None
+                    else:
+                        entry["mtime_ns"] = stat.st_mtime_ns
+                        entry["size"] = stat.st_size
+                        self.changed = True
+            except OSError:
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry["data"]
+
+    def set_file_entry(self, path: str, data: Any):
+        """Records data discovered in a file. Data that can not be stored as JSON is dropped."""
+        path = os.path.abspath(path)
+        try:
+            data = json.loads(json.dumps(data))
+            stat = os.stat(path)
+            sha256 = get_file_hash(path)
+        except (OSError, TypeError, ValueError):
+            return
+        with self._lock:
+            self.files[path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": sha256,
+                "data": data,
+            }
+            self.changed = True
+
+    def get_file_hash(self, path: str) -> Optional[str]:
+        """Returns the recorded content hash of a file."""
+        entry = self.files.get(os.path.abspath(path))
+        return entry["sha256"] if entry is not None else None
+
+    def list_directory(self, directory: str) -> Optional[List[str]]:
+        """
+        Returns the files recorded for a directory, or None if a directory has been changed
+        since it was walked.
+        """
+        entry = self.directories.get(os.path.abspath(directory))
+        if entry is None:
+            return None
+        try:
+            for d, mtime_ns in entry["mtimes_ns"].items():
+                if os.stat(d).st_mtime_ns != mtime_ns:
+                    return None
+        except OSError:
+            return None
+        return entry["files"]
+
+    def set_directory_listing(
+        self, directory: str, mtimes_ns: Dict[str, int], files: List[str]
+    ):
+        """Records the files of a directory and the modification times of its subdirectories."""
+        with self._lock:
+            self.directories[os.path.abspath(directory)] = {
+                "mtimes_ns": mtimes_ns,
+                "files": files,
+            }
+            self.changed = True
+
+    def save(self):
+        """Writes the manifest if it has changed."""
+        if not self.changed:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            create_folder(self.cache_dir)
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "format_version": MANIFEST_FORMAT_VERSION,
+                        "accelergy_version": version.__version__,
+                        "files": self.files,
+                        "directories": self.directories,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+            self.changed = False
+            INFO(f"Saved plug-in manifest to {self.path}")
+        except (OSError, TypeError, ValueError) as e:
+            WARN(
+                f"Could not write plug-in manifest to {self.path}. "
+                f"{type(e).__name__}: {e}"
+            )
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def __str__(self):
+        return f"{self.hits} plug-in manifest hits, {self.misses} misses"
@@ -1,8 +1,20 @@
+import contextlib
 import logging
 import copy
-from typing import Any, Callable, Dict, List, Tuple, Union
+import threading
+from numbers import Number
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 from accelergy.plug_in_interface.interface import *
-from accelergy.utils.utils import ERROR_CLEAN_EXIT, indent_list_text_block, WARN
+from accelergy.plug_in_interface.estimation_cache import (
+    EstimationCache,
+    PersistentEstimationCache,
+)
+from accelergy.plug_in_interface.lazy_plug_in import LazyPlugIn
+from accelergy.plug_in_interface.plug_in_index import (
+    PlugInIndex,
+    resolve_lazy_plug_ins,
+)
+from accelergy.utils.utils import ERROR_CLEAN_EXIT, indent_list_text_block, INFO, WARN
 from accelergy.utils.logging import (
     get_logger,
     pop_all_messages,
@@ -11,6 +23,11 @@ from accelergy.utils.logging import (
 )
 
 RAISED_WARNINGS_FOR_CLASSES = []
+PLUG_IN_LOCKS = {}
+# Declined accuracy queries, keyed by get_query_shape_key. Cleared when plug-ins are added to a
+# SystemState and when it grows past the max size.
+DECLINED_QUERIES = {}
+DECLINED_QUERIES_MAX_SIZE = 65536
 
 
 def warn_depreciation(plug_in: Any):
@@ -24,46 +41,112 @@ def warn_depreciation(plug_in: Any):
 
 
 def plugin2name(plug_in: Any) -> str:
-    if isinstance(plug_in, AccelergyPlugIn):
+    if isinstance(plug_in, (AccelergyPlugIn, LazyPlugIn)):
         return plug_in.get_name()
     warn_depreciation(plug_in)
     return plug_in.estimator_name
 
 
+def get_plug_in_lock(plug_in: Any):
+    """
+    Returns a lock that serializes calls to a plug-in that is not thread-safe, or a no-op context
+    for thread-safe plug-ins. Plug-ins using the deprecated interface are not thread-safe.
+    """
+    if getattr(plug_in, "thread_safe", isinstance(plug_in, AccelergyPlugIn)):
+        return contextlib.nullcontext()
+    return PLUG_IN_LOCKS.setdefault(id(plug_in), threading.Lock())
+
+
 def call_plug_in(
     plug_in: Any,
     query: AccelergyQuery,
     target_func: Callable,
     estimation_type: Union[Estimation, AccuracyEstimation],
+    check: bool = True,
 ) -> Estimation:
     logger = get_logger(plugin2name(plug_in))
-    try:
-        # New interface
-        if isinstance(plug_in, AccelergyPlugIn):
-            estimation = target_func(query)
-            logger = plug_in.logger
-        # Deprecated interface
-        else:
-            warn_depreciation(plug_in)
-            estimation = estimation_type(target_func(query.to_legacy_interface_dict()))
-            if estimation.success and not isinstance(estimation, AccuracyEstimation):
-                estimation.unit = UnitOption.from_str("p")
-    except Exception as e:
-        # Error
-        # if isinstance(e, TypeError):
-        #     raise e
-        estimation = estimation_type(0, success=False)
-        logger.error(f"{type(e).__name__}: {e}")
-
-    if not isinstance(estimation, estimation_type):
-        raise TypeError(
-            f"Plug-in {plugin2name(plug_in)} returned {type(estimation)} instead of "
-            f"{estimation_type}. "
-            f'{indent_list_text_block("Messages:", pop_all_messages(plugin2name(plug_in)))}'
-        )
+    with get_plug_in_lock(plug_in):
+        try:
+            # New interface
+            if isinstance(plug_in, AccelergyPlugIn):
+                estimation = target_func(query)
+                logger = plug_in.logger
+            # Deprecated interface
+            else:
+                warn_depreciation(plug_in)
+                estimation = estimation_type(
+                    target_func(query.to_legacy_interface_dict())
+                )
+                if estimation.success and not isinstance(
+                    estimation, AccuracyEstimation
+                ):
+                    estimation.unit = UnitOption.from_str("p")
+        except Exception as e:
+            # Error
+            # if isinstance(e, TypeError):
+            #     raise e
+            estimation = estimation_type(0, success=False)
+            logger.error(f"{type(e).__name__}: {e}")
 
-    # Add message logs
-    estimation.add_messages(pop_all_messages(logger))
+        if not isinstance(estimation, estimation_type):
+            raise TypeError(
+                f"Plug-in {plugin2name(plug_in)} returned {type(estimation)} instead of "
+                f"{estimation_type}. "
+                f'{indent_list_text_block("Messages:", pop_all_messages(plugin2name(plug_in)))}'
+            )
+
+        # Add message logs
+        estimation.add_messages(pop_all_messages(logger))
+    if not check:
+        return estimation
+    return check_estimation(plug_in, query, estimation)
+
+
+def call_plug_in_batch(
+    plug_in: AccelergyPlugIn,
+    queries: List[AccelergyQuery],
+    target_func: Callable,
+    single_target_func: Callable,
+) -> List[Estimation]:
+    """
+    Calls a plug-in's batch estimation function with several queries. If the batch call fails,
+    the queries are estimated one at a time with single_target_func so that errors are reported
+    for the queries that caused them. Messages logged during the batch call are added to every
+    estimation in the batch.
+    """
+    name = plugin2name(plug_in)
+    with get_plug_in_lock(plug_in):
+        try:
+            estimations = list(target_func(queries))
+            if len(estimations) != len(queries) or not all(
+                isinstance(e, Estimation) for e in estimations
+            ):
+                raise TypeError(
+                    f"Expected {len(queries)} Estimations, got "
+                    f"{[type(e).__name__ for e in estimations]}"
+                )
+        except Exception as e:
+            logging.getLogger("").debug(
+                f"Plug-in {name} failed to estimate a batch of {len(queries)} queries: "
+                f"{type(e).__name__}: {e}. Estimating queries one at a time."
+            )
+            estimations = None
+        messages = pop_all_messages(plug_in.logger)
+
+    if estimations is None:
+        return [
+            call_plug_in(plug_in, q, single_target_func, Estimation) for q in queries
+        ]
+    for query, estimation in zip(queries, estimations):
+        estimation.add_messages(messages)
+        check_estimation(plug_in, query, estimation)
+    return estimations
+
+
+def check_estimation(
+    plug_in: Any, query: AccelergyQuery, estimation: Estimation
+) -> Estimation:
+    """Fails the estimation if it does not match the user requested plug-in and min accuracy."""
     estimation.estimator_name = plugin2name(plug_in)
 
     # See if this estimation matches user requested plug-in and min accuracy
@@ -81,16 +164,80 @@ def call_plug_in(
     return estimation
 
 
+def get_batch_func(plug_in: Any, is_energy_estimation: bool) -> Optional[Callable]:
+    """
+    Returns the plug-in's batch estimation function, or None if the plug-in does not override
+    the default, which estimates one query at a time.
+    """
+    name = "estimate_energy_batch" if is_energy_estimation else "estimate_area_batch"
+    if not isinstance(plug_in, AccelergyPlugIn):
+        return None
+    if getattr(type(plug_in), name) is getattr(AccelergyPlugIn, name):
+        return None
+    return getattr(plug_in, name)
+
+
+def get_query_shape_key(
+    plug_in: Any, query: AccelergyQuery, is_energy_estimation: bool
+) -> Optional[tuple]:
+    """
+    Returns the key under which a plug-in's decline of a query is remembered: the plug-in, the
+    class and action names, and the names of the attributes and arguments with whether each is
+    None. Returns None if the plug-in's support may depend on attribute or argument values.
+    """
+    if getattr(plug_in, "support_depends_on_values", True):
+        return None
+    attrs = query.class_attrs or {}
+    args = (query.action_args or {}) if is_energy_estimation else {}
+    key = (
+        plug_in,
+        is_energy_estimation,
+        query.class_name,
+        query.action_name if is_energy_estimation else None,
+        tuple((k, v is None) for k, v in attrs.items()),
+        tuple((k, v is None) for k, v in args.items()),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_accuracy(
+    plug_in: Any,
+    query: AccelergyQuery,
+    target_func: Callable,
+    is_energy_estimation: bool,
+) -> AccuracyEstimation:
+    """
+    Asks a plug-in for its accuracy on a query. If the plug-in declines and its support does
+    not depend on values, the decline is reused for later queries of the same shape without
+    asking the plug-in. The user-requested plug-in and minimum accuracy are checked for every
+    query.
+    """
+    key = get_query_shape_key(plug_in, query, is_energy_estimation)
+    declined = DECLINED_QUERIES.get(key) if key is not None else None
+    if declined is not None:
+        accuracy = declined.clone()
+    else:
+        accuracy = call_plug_in(
+            plug_in, query, target_func, AccuracyEstimation, check=False
+        )
+        if key is not None and not accuracy.success:
+            if len(DECLINED_QUERIES) >= DECLINED_QUERIES_MAX_SIZE:
+                DECLINED_QUERIES.clear()
+            DECLINED_QUERIES[key] = accuracy.clone()
+    return check_estimation(plug_in, query, accuracy)
+
+
 def primitive_energy_supported(
     plug_in: Any, query: AccelergyQuery
 ) -> AccuracyEstimation:
-    return call_plug_in(
-        plug_in, query, plug_in.primitive_action_supported, AccuracyEstimation
-    )
+    return get_accuracy(plug_in, query, plug_in.primitive_action_supported, True)
 
 
-def get_energy_estimation(plug_in: Any, query: AccelergyQuery) -> Estimation:
-    e = call_plug_in(plug_in, query, plug_in.estimate_energy, Estimation)
+def scale_energy_estimation(e: Estimation, query: AccelergyQuery) -> Estimation:
     if e and e.success and query.action_name == "leak":
         n_instances = query.class_attrs.get("n_instances", 1)
         e.add_messages(f"Multiplying by n_instances {n_instances}")
@@ -98,14 +245,28 @@ def get_energy_estimation(plug_in: Any, query: AccelergyQuery) -> Estimation:
     return e
 
 
-def primitive_area_supported(plug_in: Any, query: AccelergyQuery) -> AccuracyEstimation:
-    return call_plug_in(
-        plug_in, query, plug_in.primitive_area_supported, AccuracyEstimation
+def get_energy_estimation(plug_in: Any, query: AccelergyQuery) -> Estimation:
+    e = call_plug_in(plug_in, query, plug_in.estimate_energy, Estimation)
+    return scale_energy_estimation(e, query)
+
+
+def get_energy_estimations(
+    plug_in: Any, queries: List[AccelergyQuery]
+) -> List[Estimation]:
+    batch_func = get_batch_func(plug_in, True)
+    if batch_func is None or len(queries) == 1:
+        return [get_energy_estimation(plug_in, q) for q in queries]
+    estimations = call_plug_in_batch(
+        plug_in, queries, batch_func, plug_in.estimate_energy
     )
+    return [scale_energy_estimation(e, q) for e, q in zip(estimations, queries)]
 
 
-def get_area_estimation(plug_in: Any, query: AccelergyQuery) -> AccuracyEstimation:
-    e = call_plug_in(plug_in, query, plug_in.estimate_area, Estimation)
+def primitive_area_supported(plug_in: Any, query: AccelergyQuery) -> AccuracyEstimation:
+    return get_accuracy(plug_in, query, plug_in.primitive_area_supported, False)
+
+
+def scale_area_estimation(e: Estimation, query: AccelergyQuery) -> Estimation:
     if e and e.success:
         n_instances = query.class_attrs.get("n_instances", 1)
         e.add_messages(f"Multiplying by n_instances {n_instances}")
@@ -113,95 +274,374 @@ def get_area_estimation(plug_in: Any, query: AccelergyQuery) -> AccuracyEstimati
     return e
 
 
+def get_area_estimation(plug_in: Any, query: AccelergyQuery) -> AccuracyEstimation:
+    e = call_plug_in(plug_in, query, plug_in.estimate_area, Estimation)
+    return scale_area_estimation(e, query)
+
+
+def get_area_estimations(
+    plug_in: Any, queries: List[AccelergyQuery]
+) -> List[Estimation]:
+    batch_func = get_batch_func(plug_in, False)
+    if batch_func is None or len(queries) == 1:
+        return [get_area_estimation(plug_in, q) for q in queries]
+    estimations = call_plug_in_batch(
+        plug_in, queries, batch_func, plug_in.estimate_area
+    )
+    return [scale_area_estimation(e, q) for e, q in zip(estimations, queries)]
+
+
+def get_max_accuracy(plug_in: Any) -> Number:
+    """Returns the maximum accuracy of a plug-in, or 100 if the plug-in does not bound it."""
+    max_accuracy = None
+    if isinstance(plug_in, AccelergyPlugIn):
+        max_accuracy = plug_in.get_max_accuracy()
+    return 100 if max_accuracy is None else max_accuracy
+
+
+def _estimate_with_persistent_cache(
+    plug_in: Any,
+    requests: List[Tuple[AccelergyQuery, AccuracyEstimation]],
+    is_energy_estimation: bool,
+    est_func: Callable,
+    persistent_cache: PersistentEstimationCache = None,
+) -> List[Estimation]:
+    """
+    Estimates (query, accuracy) requests with a plug-in. Requests found in the persistent cache
+    are not sent to the plug-in, and the rest are sent to the plug-in together.
+    """
+    name = plugin2name(plug_in)
+    estimations = [None] * len(requests)
+    keys, fingerprints = [None] * len(requests), [None] * len(requests)
+    if persistent_cache is not None:
+        for i, (query, accuracy) in enumerate(requests):
+            keys[i] = persistent_cache.get_key(name, query, is_energy_estimation)
+            fingerprints[i] = persistent_cache.get_fingerprint(plug_in, accuracy)
+            estimations[i] = persistent_cache.get(keys[i], fingerprints[i])
+            if estimations[i] is not None:
+                estimations[i].estimator_name = name
+
+    to_estimate = [i for i, e in enumerate(estimations) if e is None]
+    if to_estimate:
+        new_estimations = est_func(
+            plug_in, [copy.deepcopy(requests[i][0]) for i in to_estimate]
+        )
+        for i, estimation in zip(to_estimate, new_estimations):
+            estimations[i] = estimation
+            if persistent_cache is not None:
+                persistent_cache.put(keys[i], fingerprints[i], estimation)
+    return estimations
+
+
 def get_best_estimate(
-    plug_ins: List[Union[AccelergyPlugIn, Any]],
+    plug_ins: Union[List[Union[AccelergyPlugIn, Any]], PlugInIndex],
     query: Dict[str, Any],
     is_energy_estimation: bool,
+    estimation_cache: EstimationCache = None,
 ) -> Estimation:
+    return get_best_estimates(
+        plug_ins, [query], is_energy_estimation, estimation_cache
+    )[0]
+
+
+def get_best_estimates(
+    plug_ins: Union[List[Union[AccelergyPlugIn, Any]], PlugInIndex],
+    queries: List[Dict[str, Any]],
+    is_energy_estimation: bool,
+    estimation_cache: EstimationCache = None,
+) -> List[Estimation]:
+    """
+    Returns the best estimate for each query. Each query selects a plug-in the same way as if it
+    were estimated alone, but queries that are waiting on the same plug-in are sent to it
+    together through its estimate_energy_batch or estimate_area_batch method. Logs are emitted
+    for one query at a time, in order.
+    """
+    return list(
+        iter_best_estimates(plug_ins, queries, is_energy_estimation, estimation_cache)
+    )
+
+
+def iter_best_estimates(
+    plug_ins: Union[List[Union[AccelergyPlugIn, Any]], PlugInIndex],
+    queries: List[Dict[str, Any]],
+    is_energy_estimation: bool,
+    estimation_cache: EstimationCache = None,
+) -> Generator[Estimation, None, None]:
+    """
+    Yields the best estimate for each query, in order, as get_best_estimates. All queries are
+    estimated before the first estimate is yielded, and the logs of each query are emitted
+    just before its estimate is yielded.
+    """
     acc_func = (
         primitive_energy_supported if is_energy_estimation else primitive_area_supported
     )
-    est_func = get_energy_estimation if is_energy_estimation else get_area_estimation
-    query = AccelergyQuery.from_interface_dict(query)
-    target = "ENERGY" if is_energy_estimation else "AREA"
-    if logging.getLogger("").isEnabledFor(logging.INFO):
-        logging.getLogger("").info("")
-    logging.getLogger("").info(f"{target} ESTIMATION for {query}")
-
-    accuracies = [(plug_in, acc_func(plug_in, query)) for plug_in in plug_ins]
-    estimations = []
-    accuracies = sorted(accuracies, key=lambda x: x[1].value, reverse=True)
-    estimation = None
-    for plug_in, accuracy in accuracies:
-        if not accuracy.success or accuracy.value == 0:
+    est_func = get_energy_estimations if is_energy_estimation else get_area_estimations
+    queries = [AccelergyQuery.from_interface_dict(q) for q in queries]
+    persistent_cache = getattr(estimation_cache, "persistent", None)
+
+    # Keys are computed before any plug-in sees (and possibly mutates) the queries. Repeats of a
+    # query in this call reuse the estimation of the first.
+    keys = [None] * len(queries)
+    cached, first_of_key, selectors = {}, {}, {}
+    for i, query in enumerate(queries):
+        if estimation_cache is not None:
+            keys[i] = estimation_cache.get_key(query, is_energy_estimation)
+            if keys[i] is not None and keys[i] in first_of_key:
+                continue
+            cached[i] = estimation_cache.get(keys[i])
+            if cached[i] is not None:
+                continue
+            first_of_key[keys[i]] = i
+        selectors[i] = _select_estimate(plug_ins, query, is_energy_estimation, acc_func)
+
+    # Advance the plug-in selection of each query until it is waiting on a plug-in, then send
+    # all waiting queries to each plug-in at once
+    selections, waiting = {}, {}
+    for i, selector in selectors.items():
+        _advance_selection(i, selector, None, selections, waiting)
+    while waiting:
+        by_plug_in = {}
+        for i, (plug_in, accuracy) in waiting.items():
+            by_plug_in.setdefault(id(plug_in), (plug_in, []))[1].append((i, accuracy))
+        waiting = {}
+        for plug_in, requests in by_plug_in.values():
+            estimations = _estimate_with_persistent_cache(
+                plug_in,
+                [(queries[i], accuracy) for i, accuracy in requests],
+                is_energy_estimation,
+                est_func,
+                persistent_cache,
+            )
+            for (i, _), estimation in zip(requests, estimations):
+                _advance_selection(i, selectors[i], estimation, selections, waiting)
+
+    for i, query in enumerate(queries):
+        target = "ENERGY" if is_energy_estimation else "AREA"
+        log_info = logging.getLogger("").isEnabledFor(logging.INFO)
+        if log_info:
+            logging.getLogger("").info("")
+            logging.getLogger("").info(f"{target} ESTIMATION for {query}")
+        if i in selections:
+            estimation = _report_selection(query, is_energy_estimation, selections[i])
+            if estimation_cache is not None:
+                estimation_cache.put(keys[i], estimation)
+        else:
+            estimation = cached.get(i) or estimation_cache.get(keys[i])
+            if log_info:
+                logging.getLogger("").info(
+                    f"Reusing {estimation.estimator_name} estimation {estimation} from "
+                    f"an identical query."
+                )
+        yield estimation
+
+
+def estimate_unique_queries(
+    estimate_func: Callable[[List[Dict[str, Any]]], List[Estimation]],
+    queries: List[Dict[str, Any]],
+    description: str = "queries",
+) -> List[Estimation]:
+    """
+    Estimates each distinct query once with estimate_func and returns an estimation for every
+    query, in order. Queries are identical if their canonical forms are equal (see
+    AccelergyQuery.to_hashable). Queries that can not be hashed are always estimated. Repeated
+    queries receive clones of the estimation, so callers may mutate them.
+    """
+    unique_queries, unique_indices, key_to_index = [], [], {}
+    for query in queries:
+        try:
+            key = AccelergyQuery.from_interface_dict(query).to_hashable()
+        except TypeError:
+            key = None
+        if key is not None and key in key_to_index:
+            unique_indices.append(key_to_index[key])
             continue
-        estimation = est_func(plug_in, copy.deepcopy(query))
+        if key is not None:
+            key_to_index[key] = len(unique_queries)
+        unique_indices.append(len(unique_queries))
+        unique_queries.append(query)
+
+    INFO(
+        f"Estimating {len(unique_queries)} unique {description} for {len(queries)} "
+        f"requested."
+    )
+    unique_estimations = estimate_func(unique_queries)
+    estimations, used = [], set()
+    for i in unique_indices:
+        estimation = unique_estimations[i]
+        estimations.append(estimation.clone() if i in used else estimation)
+        used.add(i)
+    return estimations
+
+
+def _advance_selection(
+    i: int,
+    selector: Generator,
+    estimation: Optional[Estimation],
+    selections: Dict[int, tuple],
+    waiting: Dict[int, Tuple[Any, AccuracyEstimation]],
+):
+    """Sends an estimation to a selector and records whether it is done or waiting."""
+    try:
+        waiting[i] = selector.send(estimation)
+    except StopIteration as e:
+        selections[i] = e.value
+
+
+def _select_estimate(
+    plug_ins: Union[List[Union[AccelergyPlugIn, Any]], PlugInIndex],
+    query: AccelergyQuery,
+    is_energy_estimation: bool,
+    acc_func: Callable,
+) -> Generator:
+    """
+    Selects the best plug-in for a query. This generator yields (plug_in, accuracy) when it
+    needs an estimate from a plug-in, and the Estimation must be sent back. When done, it
+    returns (estimation, accuracy, accuracies, estimations, n_not_queried) for
+    _report_selection.
+    """
+    n_not_queried = 0
+    if isinstance(plug_ins, PlugInIndex):
+        n_plug_ins = len(plug_ins)
+        plug_ins = plug_ins.get_candidates(
+            query.class_name, query.action_name if is_energy_estimation else None
+        )
+        n_not_queried = n_plug_ins - len(plug_ins)
+    else:
+        plug_ins = resolve_lazy_plug_ins(
+            plug_ins,
+            query.class_name,
+            query.action_name if is_energy_estimation else None,
+        )
+
+    # Plug-ins are queried in descending order of their maximum accuracy. Once a plug-in has
+    # estimated successfully with an accuracy that no remaining plug-in can beat, the remaining
+    # plug-ins are not queried. Ties are broken by plug-in order, as if all accuracies had been
+    # queried and sorted.
+    to_query = sorted(
+        enumerate(plug_ins), key=lambda x: (-get_max_accuracy(x[1]), x[0])
+    )
+    accuracies, candidates, estimations = [], [], []
+    estimation = accuracy = None
+    while True:
+        if candidates and (
+            not to_query
+            or (-candidates[0][1].value, candidates[0][0])
+            < (-get_max_accuracy(to_query[0][1]), to_query[0][0])
+        ):
+            _, accuracy, plug_in = candidates.pop(0)
+        elif to_query:
+            i, plug_in = to_query.pop(0)
+            accuracy = acc_func(plug_in, query)
+            accuracies.append((plug_in, accuracy))
+            if accuracy.success and accuracy.value != 0:
+                candidates.append((i, accuracy, plug_in))
+                candidates.sort(key=lambda x: (-x[1].value, x[0]))
+            continue
+        else:
+            break
+
+        estimation = yield plug_in, accuracy
         logger = get_logger(plugin2name(plug_in))
         if not estimation.success:
             estimation.add_messages(pop_all_messages(logger))
             estimations.append((accuracy, estimation))
         else:
-            log_all_lines(
-                f"Accelergy",
-                "info",
-                f"{estimation.estimator_name} estimated "
-                f"{estimation} with accuracy {accuracy}. "
-                + indent_list_text_block("Messages:", estimation.messages),
-            )
             break
 
-    full_logs_acc = [
+    # Complete the logs in verbose mode
+    if logging.getLogger("").isEnabledFor(logging.DEBUG):
+        accuracies += [(p, acc_func(p, query)) for _, p in to_query]
+    accuracies = sorted(accuracies, key=lambda x: x[1].value, reverse=True)
+    return estimation, accuracy, accuracies, estimations, n_not_queried
+
+
+def _get_full_logs(
+    accuracies: List[Tuple[Any, AccuracyEstimation]],
+    estimations: List[Tuple[AccuracyEstimation, Estimation]],
+) -> List[str]:
+    """Returns the messages of every accuracy and estimation made for a query."""
+    return [
         indent_list_text_block(
             f"{e.estimator_name} with accuracy {e} estimating accuracy:", e.messages
         )
         for _, e in accuracies
-    ]
-    full_logs_estimations = [
+    ] + [
         indent_list_text_block(
             f"{e.estimator_name} with accuracy {a} estimating value: ", e.messages
         )
         for a, e in estimations
     ]
-    full_logs = full_logs_acc + full_logs_estimations
-    fail_reasons_accuracy = [
+
+
+def _get_fail_reasons(
+    accuracies: List[Tuple[Any, AccuracyEstimation]],
+    estimations: List[Tuple[AccuracyEstimation, Estimation]],
+) -> List[str]:
+    """Returns the last message of every accuracy and estimation made for a query."""
+    return [
         f"{e.estimator_name} with accuracy {e} estimating accuracy: {e.lastmessage()}"
         for _, e in accuracies
-    ]
-    fail_reasons_estimations = [
-        f"{e.estimator_name} with accuracy {a} estimating value: " f"{e.lastmessage()}"
+    ] + [
+        f"{e.estimator_name} with accuracy {a} estimating value: {e.lastmessage()}"
         for a, e in estimations
     ]
-    fail_reasons = fail_reasons_accuracy + fail_reasons_estimations
 
-    if full_logs:
-        log_all_lines(
-            "Accelergy", "debug", indent_list_text_block("Estimator logs:", full_logs)
-        )
-    if fail_reasons:
+
+def _report_selection(
+    query: AccelergyQuery, is_energy_estimation: bool, selection: tuple
+) -> Estimation:
+    """Logs the plug-in selection for a query and returns the estimation, or exits on failure."""
+    estimation, accuracy, accuracies, estimations, n_not_queried = selection
+    succeeded = estimation and estimation.success
+    # Log text is only built if it will be emitted
+    root_logger = logging.getLogger("")
+    if succeeded and root_logger.isEnabledFor(logging.INFO):
         log_all_lines(
-            "Accelergy",
-            "debug",
-            indent_list_text_block("Why plug-ins did not estimate:", fail_reasons),
+            f"Accelergy",
+            "info",
+            f"{estimation.estimator_name} estimated "
+            f"{estimation} with accuracy {accuracy}. "
+            + indent_list_text_block("Messages:", estimation.messages),
         )
-    if fail_reasons_estimations:
+
+    if root_logger.isEnabledFor(logging.DEBUG):
+        full_logs = _get_full_logs(accuracies, estimations)
+        fail_reasons = _get_fail_reasons(accuracies, estimations)
+        if full_logs:
+            log_all_lines(
+                "Accelergy",
+                "debug",
+                indent_list_text_block("Estimator logs:", full_logs),
+            )
+        if fail_reasons:
+            log_all_lines(
+                "Accelergy",
+                "debug",
+                indent_list_text_block("Why plug-ins did not estimate:", fail_reasons),
+            )
+    if estimations and root_logger.isEnabledFor(logging.INFO):
         log_all_lines(
             "Accelergy",
             "info",
             indent_list_text_block(
                 "Plug-ins provided accuracy, but failed to estimate:",
-                fail_reasons_estimations,
+                _get_fail_reasons([], estimations),
             ),
         )
 
-    if estimation and estimation.success:
+    if succeeded:
         return estimation
 
+    full_logs = _get_full_logs(accuracies, estimations)
+    fail_reasons = _get_fail_reasons(accuracies, estimations)
     estimation_target = "energy" if is_energy_estimation else "area"
     ERROR_CLEAN_EXIT(
         *(
             f"Can not find an {estimation_target} estimator for {query}\n"
             f'{indent_list_text_block("Logs for plug-ins that could estimate query:", full_logs)}\n'
             f'{indent_list_text_block("Why plug-ins did not estimate:", fail_reasons)}\n'
+            f"{n_not_queried} plug-ins do not support this class and action and were not "
+            f"queried.\n"
             f'\n.\n.\nTo see a list of available component models, run "<command you used> -h" and '
             f"find the option to list Accelergy components. Alternatively, run accelergy verbose and "
             f"check the log file."
@@ -1,40 +1,135 @@
 from importlib.machinery import SourceFileLoader
-from typing import Union
+import functools
+import threading
+from types import ModuleType
+from typing import Any, List, Set, Union
 from accelergy.utils.utils import *
 from accelergy.plug_in_interface.estimator_wrapper import *
+from accelergy.plug_in_interface.lazy_plug_in import LazyPlugIn
+from accelergy.plug_in_interface.plug_in_manifest import PlugInManifest
 from accelergy.plug_in_interface.query_plug_ins import plugin2name
 from accelergy.utils.yaml import load_yaml
 
 
-def iter_files_recursive(path: Union[str, list]) -> iter:
+def iter_files_recursive(
+    path: Union[str, list], manifest: PlugInManifest = None
+) -> iter:
     if isinstance(path, str):
         path = [path]
 
     for p in path:
         if not os.path.isdir(p):
             yield os.path.dirname(p), p
+            continue
+        files = manifest.list_directory(p) if manifest is not None else None
+        if files is None:
+            files, mtimes_ns = [], {}
+            for root, dirs, names in os.walk(p):
+                mtimes_ns[os.path.abspath(root)] = os.stat(root).st_mtime_ns
+                files += [os.path.join(root, name) for name in names]
+            if manifest is not None:
+                manifest.set_directory_listing(p, mtimes_ns, files)
+        for file in files:
+            yield os.path.dirname(file), file
+
+
+def load_python_plug_in_module(path: str, module_name: str) -> ModuleType:
+    """Imports a Python plug-in module. The module may import files in its directory."""
+    prev_sys_path = copy.deepcopy(sys.path)
+    sys.path.append(os.path.dirname(os.path.abspath(path)))
+    # Plug-ins loaded earlier in this process may have used the same module name
+    sys.modules.pop(module_name, None)
+    try:
+        return SourceFileLoader(module_name, path).load_module()
+    finally:
+        sys.path = prev_sys_path
+
+
+def load_estimator_plug_in(
+    file_path: str, estimator_info: dict, output_prefix: str = ""
+) -> List[Any]:
+    """Imports the module of an .estimator.yaml plug-in and returns the plug-in."""
+    module_name = estimator_info["module"]
+    class_name = estimator_info["class"]
+    estimator_module = SourceFileLoader(class_name, file_path).load_module()
+
+    if "parameters" not in estimator_info:
+        if not module_name == "cacti_wrapper":
+            estimator_obj = getattr(estimator_module, class_name)()
         else:
-            for root, dirs, files in os.walk(p):
-                for file in files:
-                    yield root, os.path.join(root, file)
+            # for CACTI to use prefix to avoid contention
+            estimator_obj = getattr(estimator_module, class_name)(output_prefix)
+    else:
+        estimator_obj = getattr(estimator_module, class_name)(
+            estimator_info["parameters"]
+        )
+    return [estimator_obj]
+
+
+def load_python_plug_in_estimators(
+    path: str, module_name: str, plug_in_ids: Set
+) -> List[EstimatorWrapper]:
+    """Imports a Python plug-in module and returns its estimators."""
+    return get_all_estimators_in_module(
+        load_python_plug_in_module(path, module_name), plug_in_ids
+    )
+
+
+class LazyPlugInModule:
+    """Python plug-in module that is imported the first time it is loaded."""
+
+    def __init__(self, path: str, module_name: str):
+        self.path = path
+        self.module_name = module_name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def load(self) -> ModuleType:
+        with self._lock:
+            if self._module is None:
+                INFO(
+                    f"Importing Python plug-in: {self.path}. Errors below are likely due "
+                    f"to plug-in, not Accelergy."
+                )
+                self._module = load_python_plug_in_module(self.path, self.module_name)
+        return self._module
 
 
 def plug_in_path_to_obj(
-    estimator_path_list: list, python_path_list: list, output_prefix: str = ""
+    estimator_path_list: list,
+    python_path_list: list,
+    output_prefix: str = "",
+    manifest: PlugInManifest = None,
 ):
     """
     instantiate a list of estimator plug-in objects for later queries
     estimator plug-in paths are specified in config file
+
+    If a manifest is given, plug-in files that are unchanged since they were recorded in the
+    manifest are not parsed again, and Python plug-ins are imported only when they are first
+    used (see LazyEstimatorWrapper). Newly discovered plug-ins are recorded in the manifest.
+
+    Plug-ins in .estimator.yaml files may declare the classes they support with
+    "class_names", in which case they are loaded only when a query for one of those classes
+    is made (see LazyPlugIn). Python plug-ins listed under "python_plug_ins" may do the same
+    by being listed as {path: <path>, class_names: [<class names>]}.
     """
     # Load classic plug-ins
     estimator_plug_ins = []
-    for root, estimator_path in iter_files_recursive(estimator_path_list):
+    declared_class_names = {}
+    for root, estimator_path in iter_files_recursive(estimator_path_list, manifest):
         # print(f'Testing {estimator_path}')
         if ".estimator.yaml" not in estimator_path:
             continue
 
         INFO(f"Estimator plug-in identified by: {estimator_path}")
-        estimator_spec = load_yaml(estimator_path)
+        estimator_spec = None
+        if manifest is not None:
+            estimator_spec = manifest.get_file_entry(estimator_path)
+        if estimator_spec is None:
+            estimator_spec = load_yaml(estimator_path)
+            if manifest is not None and isinstance(estimator_spec, dict):
+                manifest.set_file_entry(estimator_path, estimator_spec)
         assert isinstance(estimator_spec, dict), (
             f"Estimator spec must be a dictionary. Found invalid "
             f"type: {type(estimator_spec)} in path: {estimator_path}"
@@ -48,54 +143,87 @@ def plug_in_path_to_obj(
             if key == "version":
                 continue
             elif key == "python_plug_ins":
-                python_path_list += [
-                    os.path.join(root, python_path) for python_path in val
-                ]
+                for python_plug_in in val:
+                    if isinstance(python_plug_in, dict):
+                        python_path = os.path.join(root, python_plug_in["path"])
+                        if "class_names" in python_plug_in:
+                            declared_class_names[os.path.abspath(python_path)] = (
+                                python_plug_in["class_names"]
+                            )
+                    else:
+                        python_path = os.path.join(root, python_plug_in)
+                    python_path_list.append(python_path)
             else:
                 assert isinstance(val, dict), (
                     f"Estimator info under key {key} must be a dictionary. "
                     f"type: {type(val)} in path: {estimator_path}"
                 )
-                estimator_infos.append(val)
+                estimator_infos.append((key, val))
 
-        for estimator_info in estimator_infos:
-            module_name = estimator_info["module"]
-            class_name = estimator_info["class"]
-            file_path = root + "/" + module_name
+        for key, estimator_info in estimator_infos:
+            file_path = root + "/" + estimator_info["module"]
             if not file_path.endswith(".py"):
                 file_path += ".py"
             if not os.path.isfile(file_path):
                 raise FileNotFoundError(f"Estimator module not found: {file_path}")
-            estimator_module = SourceFileLoader(class_name, file_path).load_module()
-
-            if "parameters" not in estimator_info:
-                if not module_name == "cacti_wrapper":
-                    estimator_obj = getattr(estimator_module, class_name)()
-                else:
-                    # for CACTI to use prefix to avoid contention
-                    estimator_obj = getattr(estimator_module, class_name)(output_prefix)
-            else:
-                estimator_obj = getattr(estimator_module, class_name)(
-                    estimator_info["parameters"]
+            load_func = functools.partial(
+                load_estimator_plug_in, file_path, estimator_info, output_prefix
+            )
+            if "class_names" in estimator_info:
+                estimator_plug_ins.append(
+                    LazyPlugIn(key, estimator_info["class_names"], load_func)
                 )
-            estimator_plug_ins.append(estimator_obj)
+            else:
+                estimator_plug_ins += load_func()
 
     # Load Python plug-ins
     plug_in_ids = set()
     n_plugins = 0
-    for root, python_path in iter_files_recursive(python_path_list):
+    for root, python_path in iter_files_recursive(python_path_list, manifest):
         INFO(f"Loading Python plug-in: {python_path}. Errors below are likely due to plug-in, not Accelergy.")
         if not python_path.endswith(".py"):
             continue
-        prev_sys_path = copy.deepcopy(sys.path)
-        sys.path.append(os.path.dirname(os.path.abspath(python_path)))
-        if not os.path.isfile(file_path):
-            raise FileNotFoundError(f"Estimator module not found: {file_path}")
-        python_module = SourceFileLoader(f"python_plug_in{n_plugins}", python_path).load_module()
-        estimator_plug_ins += get_all_estimators_in_module(python_module, plug_in_ids)
-        sys.path = prev_sys_path
+        if not os.path.isfile(python_path):
+            raise FileNotFoundError(f"Estimator module not found: {python_path}")
+        module_name = f"python_plug_in{n_plugins}"
         n_plugins += 1
-        
+
+        descriptions = None
+        if manifest is not None:
+            descriptions = manifest.get_file_entry(python_path)
+        if descriptions is not None:
+            INFO(f"Found {python_path} in the plug-in manifest. Importing when used.")
+            module = LazyPlugInModule(python_path, module_name)
+            source_hash = manifest.get_file_hash(python_path)
+            estimator_plug_ins += [
+                LazyEstimatorWrapper(module, name, description, source_hash)
+                for name, description in descriptions
+            ]
+            continue
+
+        class_names = declared_class_names.get(os.path.abspath(python_path))
+        if class_names is not None:
+            estimator_plug_ins.append(
+                LazyPlugIn(
+                    python_path,
+                    class_names,
+                    functools.partial(
+                        load_python_plug_in_estimators,
+                        python_path,
+                        module_name,
+                        plug_in_ids,
+                    ),
+                )
+            )
+            continue
+
+        found = load_python_plug_in_estimators(python_path, module_name, plug_in_ids)
+        if manifest is not None:
+            manifest.set_file_entry(
+                python_path, [(e.get_name(), e.get_description()) for e in found]
+            )
+        estimator_plug_ins += found
+
     INFO(f"Done loading Python plug-ins.")
 
     for estimator_plug_in in estimator_plug_ins:
@@ -0,0 +1,103 @@
+import sys
+from typing import Any, Hashable, Iterable, List, Sequence, Tuple
+
+from accelergy.plug_in_interface.interface import AccelergyQuery
+
+
+class PrimitiveActionPlan:
+    """
+    Actions lowered to sparse rows over the distinct primitive action queries they are made
+    of. Row r holds one action. Each nonzero of the row is a primitive action of it: the
+    column of its query and the multiplier of its energy, e.g. the energy scales of the
+    subaction and subcomponent times the number of identical subcomponents. The rows are
+    stored as a CSR matrix (indptr, indices, data), so the energy of every action is the
+    product of the matrix with the vector of query energies. Recomputing the actions after
+    the primitive energies change, e.g. with another plug-in or technology, needs no
+    flattening.
+
+    Each nonzero also has a label (e.g. the subcomponent name and subaction) and each row a
+    key, so the per-primitive breakdown of an action can be rebuilt from the query energies.
+    """
+
+    def __init__(self):
+        self.queries = []
+        self.query_columns = {}
+        self.indptr = [0]
+        self.indices = []
+        self.data = []
+        self.row_keys = []
+        self.labels = []
+
+    def get_column(self, query: dict) -> int:
+        """
+        Returns the column of a query, adding a column if no identical query has one.
+        Queries that can not be hashed (see AccelergyQuery.to_hashable) each get a column.
+        """
+        try:
+            key = AccelergyQuery.from_interface_dict(query).to_hashable()
+        except TypeError:
+            key = None
+        column = self.query_columns.get(key) if key is not None else None
+        if column is None:
+            column = len(self.queries)
+            self.queries.append(query)
+            if key is not None:
+                self.query_columns[key] = column
+        return column
+
+    def add_row(self, key: Any, entries: Iterable[Tuple[dict, float, Hashable]]) -> int:
+        """
+        Adds a row for the (query, multiplier, label) entries of an action and returns its
+        index. Entries keep their order, including repeated queries.
+        """
+        for query, multiplier, label in entries:
+            self.indices.append(self.get_column(query))
+            self.data.append(multiplier)
+            self.labels.append(label)
+        self.indptr.append(len(self.indices))
+        self.row_keys.append(key)
+        return len(self.row_keys) - 1
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.row_keys), len(self.queries)
+
+    def get_row(self, row: int) -> List[Tuple[int, float, Any]]:
+        """Returns the (column, multiplier, label) of each nonzero of a row."""
+        start, end = self.indptr[row], self.indptr[row + 1]
+        return list(
+            zip(self.indices[start:end], self.data[start:end], self.labels[start:end])
+        )
+
+    def get_column_values(self, values: Sequence) -> list:
+        """
+        Returns, for each column, the first of values (one per nonzero, in row order) that
+        belongs to the column. E.g. the estimations of the queries of every entry.
+        """
+        column_values = [None] * len(self.queries)
+        for column, value in zip(reversed(self.indices), reversed(values)):
+            column_values[column] = value
+        return column_values
+
+    def multiply(self, energies: Sequence[float]):
+        """
+        Returns the energy of each row: the sum over its nonzeros of the query energy times
+        the multiplier, added in order. If energies is a NumPy array, it is multiplied with
+        NumPy and the result is an array.
+        """
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(energies, np.ndarray):
+            counts = np.diff(np.asarray(self.indptr))
+            rows = np.repeat(np.arange(len(self.row_keys)), counts)
+            products = energies[np.asarray(self.indices, dtype=np.int64)] * np.asarray(
+                self.data, dtype=float
+            )
+            return np.bincount(rows, weights=products, minlength=len(self.row_keys))
+        indices, data = self.indices, self.data
+        row_energies = []
+        for start, end in zip(self.indptr, self.indptr[1:]):
+            energy = 0
+            for k in range(start, end):
+                energy += energies[indices[k]] * data[k]
+            row_energies.append(energy)
+        return row_energies
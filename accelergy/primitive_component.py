@@ -1,4 +1,3 @@
-from copy import deepcopy
 from accelergy.utils.utils import *
 from accelergy.parsing_utils import *
 
@@ -15,19 +14,13 @@ class PrimitiveComponent:
         self._attributes = arch_component.get_attributes()
         self._area_scale = arch_component.get_area_scale()
         self._energy_scale = arch_component.get_energy_scale()
-        self._actions = []
-        for action in self.flatten_top_level_action_list(component_class):
-            self._actions.append(action)
-
-    def flatten_top_level_action_list(self, component_class):
-        actionNameList = component_class.get_action_name_list()
-        flattenedActionList = []
-        for actionName in actionNameList:
-            actionObj = deepcopy(component_class.get_action(actionName))
-            flattened = actionObj.flatten_action_args_into_list(self.get_attributes())
-            for action in flattened:
-                flattenedActionList.append(action)
-        return flattenedActionList
+        # actions are flattened into argument combinations when used
+        self._argument_spaces = []
+        for actionName in component_class.get_action_name_list():
+            action = component_class.get_action(actionName)
+            self._argument_spaces.append(
+                (action, action.get_argument_space(self.get_attributes()))
+            )
 
     def get_name(self):
         return self._name
@@ -38,8 +31,15 @@ class PrimitiveComponent:
     def get_class_name(self):
         return self._class_name
 
+    def get_argument_spaces(self):
+        """(action, ArgumentSpace) pairs, one for each action of the class"""
+        return self._argument_spaces
+
     def get_actions(self):
-        return self._actions
+        """yields one action for each combination of argument values"""
+        for action, argument_space in self._argument_spaces:
+            for arguments in argument_space:
+                yield action.with_arguments(arguments)
 
     def get_dict_representation(self):
         from collections import OrderedDict
@@ -48,10 +48,15 @@ class PrimitiveComponent:
             {"name": self.get_name(), "class": self.get_class_name(), "actions": []}
         )
         for action in self.get_actions():
+            arguments = action.get_arguments()
+            propagate_required_keys(
+                self.get_attributes(),
+                arguments,
+                f"attributes for {self.get_name()}.{action.get_name()}",
+                action_keys=True,
+            )
             dict_rep["actions"].append(
-                OrderedDict(
-                    {"name": action.get_name(), "arguments": action.get_arguments()}
-                )
+                OrderedDict({"name": action.get_name(), "arguments": arguments})
             )
         return dict_rep
 
@@ -26,6 +26,16 @@ class RawInputs2Dicts:
         self.action_counts_dict = {}
         self.config = None
         self.arch_variables = {}
+        # Unparsed variables and architecture, kept to parse them again with other values
+        self.keep_architecture_inputs = input_info.get(
+            "keep_architecture_inputs", False
+        )
+        self.architecture_inputs = None
+        # Parsed local components, in parsing order, kept with the architecture inputs. The
+        # components of the index that with_variables sets are copied instead of parsed again.
+        self.local_components = [] if self.keep_architecture_inputs else None
+        self.reused_components = {}
+        self.n_parsed_components = 0
         self.load_and_construct_dicts(update_config_version)
 
     def load_and_construct_dicts(self, update_config_version):
@@ -65,17 +75,20 @@ class RawInputs2Dicts:
             else:
                 raise FileNotFoundError("Cannot recognize input path: ", path)
 
-        if "variables" in input_file_info:
-            for variable_spec in input_file_info["variables"]:
-                variable_spec["content"]["variables"] = (
-                    parse_expressions_sequentially_replacing_bindings(
-                        variable_spec["content"]["variables"],
-                        {},
-                        "variables.",
-                        strings_allowed=True,
-                    )
-                )
-                self.arch_variables.update(variable_spec["content"]["variables"])
+        if self.keep_architecture_inputs:
+            self.architecture_inputs = {
+                top_key: [
+                    {
+                        **file_info,
+                        "content": {
+                            top_key: copy_containers(file_info["content"][top_key])
+                        },
+                    }
+                    for file_info in input_file_info.get(top_key, [])
+                ]
+                for top_key in ["variables", "architecture"]
+            }
+        self.variables_input_parser(input_file_info.get("variables", []))
 
         for top_key, top_key_file_list in input_file_info.items():
             if top_key != "variables":
@@ -88,6 +101,119 @@ class RawInputs2Dicts:
         # construct primitive classes dictionary
         self.primitive_classes_input_parser()
 
+    def variables_input_parser(self, file_info_list, values=None):
+        """
+        Parses the variables of each file. Values replace the variables of the same names and
+        are added as variables if no file defines them.
+        """
+        values = values or {}
+        for variable_spec in file_info_list:
+            variables = variable_spec["content"]["variables"]
+            for name in variables:
+                if name in values:
+                    variables[name] = values[name]
+            variable_spec["content"]["variables"] = (
+                parse_expressions_sequentially_replacing_bindings(
+                    variables,
+                    {},
+                    "variables.",
+                    strings_allowed=True,
+                )
+            )
+            self.arch_variables.update(variable_spec["content"]["variables"])
+        for name, value in values.items():
+            self.arch_variables.setdefault(name, value)
+
+    def with_variables(self, values):
+        """
+        Returns a copy of the inputs with the variables and architecture parsed again with new
+        values. Values replace the variables and top-level architecture attributes of the same
+        names. Only the components that may depend on the values are parsed again (see
+        get_changed_components); the others are copies of the components parsed when the
+        inputs were loaded. The component classes, action counts and config are shared with
+        this object.
+        """
+        ASSERT_MSG(
+            self.architecture_inputs is not None,
+            "Inputs must be loaded with keep_architecture_inputs to parse them again",
+        )
+        raw_dicts = copy.copy(self)
+        raw_dicts.arch_variables = {}
+        raw_dicts.hier_arch_spec_dict = {}
+        raw_dicts.flatten_arch_spec_dict = {}
+        raw_dicts.local_components = None
+        changed = self.get_changed_components(values)
+        raw_dicts.reused_components = {}
+        if len(changed) == len(self.local_components):
+            raw_dicts.reused_components = {
+                index: component
+                for index, component in enumerate(self.local_components)
+                if not changed[index]
+            }
+        inputs = {
+            top_key: [
+                {**file_info, "content": copy_containers(file_info["content"])}
+                for file_info in file_info_list
+            ]
+            for top_key, file_info_list in self.architecture_inputs.items()
+        }
+        raw_dicts.variables_input_parser(inputs["variables"], values)
+        for file_info in inputs["architecture"]:
+            replace_top_level_attributes(file_info["content"]["architecture"], values)
+            raw_dicts.architecture_input_parser(file_info)
+        return raw_dicts
+
+    def get_changed_components(self, names):
+        """
+        Returns, for each local component of the kept architecture in parsing order, whether
+        parsing it with new values of the given names may change it. A component may change
+        if its name or attributes, or the name or attributes of a node above it, reference
+        one of the names or a variable that depends on one of them. Top-level attributes with
+        the given names are replaced by the values, so they change every component.
+        """
+        variables = {}
+        for file_info in self.architecture_inputs["variables"]:
+            variables.update(file_info["content"]["variables"] or {})
+        changed_names, n_changed_names = set(names), -1
+        while len(changed_names) != n_changed_names:
+            n_changed_names = len(changed_names)
+            changed_names.update(
+                name
+                for name, value in variables.items()
+                if get_expression_names(value) & changed_names
+            )
+
+        def references_changed(node):
+            attributes = node.get("attributes") or {}
+            if not isinstance(attributes, dict):
+                return True
+            # Bounds of lists in names, e.g. the n_PEs - 1 of PE[0..n_PEs - 1]
+            name = str(node.get("name", ""))
+            name_parts = name.replace("..", "[").replace("]", "[").split("[")
+            return any(
+                get_expression_names(value) & changed_names
+                for value in list(attributes.values()) + name_parts
+            )
+
+        changed = []
+
+        def add_changed(node, node_changed):
+            node_changed = node_changed or references_changed(node)
+            for subtree_node in node.get("subtree") or []:
+                add_changed(subtree_node, node_changed)
+            for component in node.get("local") or []:
+                changed.append(node_changed or references_changed(component))
+
+        for file_info in self.architecture_inputs["architecture"]:
+            architecture = file_info["content"]["architecture"]
+            if architecture.get("subtree"):
+                top_node = architecture["subtree"][0]
+                attributes = top_node.get("attributes") or {}
+                add_changed(top_node, any(name in attributes for name in names))
+            else:
+                add_changed(architecture, False)
+        return changed
+
     def load_file(self, file_path):
         if ".yaml" in file_path:
             file = load_yaml(file_path)
@@ -147,6 +273,7 @@ class RawInputs2Dicts:
 
         # create arch spec dict
         self.hier_arch_spec_dict = {"architecture": {}}
+        self.n_parsed_components = 0
         self.flatten_arch_spec_dict = {
             "version": self.parser_version,
             "components": {},
@@ -204,6 +331,19 @@ class RawInputs2Dicts:
                 "error: %s.local has to be a list of components" % prefix,
             )
             for c_id in range(len(node_description["local"])):
+                index = self.n_parsed_components
+                self.n_parsed_components += 1
+                if index in self.reused_components:
+                    local_name, node_info = self.reused_components[index]
+                    node_info = copy_containers(node_info)
+                    node_description["local"][c_id] = OrderedDict(
+                        node_info, name=local_name
+                    )
+                    self.flatten_arch_spec_dict["components"][
+                        node_info["name"]
+                    ] = node_info
+                    continue
+
                 node_info = node_description["local"][c_id]
                 ASSERT_MSG("name" in node_info, "name must be specified for each node")
                 if "attributes" not in node_info:
@@ -244,6 +384,13 @@ class RawInputs2Dicts:
                 )
                 node_info["name"] = local_node_name
                 self.flatten_arch_spec_dict["components"][local_node_name] = node_info
+                if self.local_components is not None:
+                    self.local_components.append(
+                        (
+                            node_description["local"][c_id]["name"],
+                            copy_containers(node_info),
+                        )
+                    )
 
         if "subtree" not in node_description and "local" not in node_description:
             raise AttributeError(
@@ -635,3 +782,28 @@ class RawInputs2Dicts:
         if not self.ERT_dict == {}:
             available_inputs.append("ERT")
         return available_inputs
+
+
+def replace_top_level_attributes(architecture, values):
+    """
+    Replaces the attributes of the top-level node of an architecture, which its components
+    inherit, that have the same names as values.
+    """
+    for node in (architecture.get("subtree") or [])[:1]:
+        attributes = node.get("attributes") if isinstance(node, dict) else None
+        if isinstance(attributes, dict):
+            for name in attributes:
+                if name in values:
+                    attributes[name] = values[name]
+
+
+def copy_containers(value):
+    """
+    Returns a copy of nested dicts and lists as plain dicts and lists. Other values, such as
+    strings and numbers, are shared. Much faster than deepcopy for loaded YAML.
+    """
+    if isinstance(value, dict):
+        return {k: copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_containers(v) for v in value]
+    return value
@@ -1,3 +1,5 @@
+import copy
+
 from accelergy.utils.utils import INFO
 
 
@@ -12,6 +14,17 @@ class Subcomponent:
                 self.dict_representation["attributes"]["energy_scale"]
             )
         self.set_energy_scale(self.dict_representation["energy_scale"])
+        self._shared_attributes = False
+
+    def copy(self):
+        """
+        Returns a copy that can be renamed, rescaled and given new attributes. The copy shares
+        the attributes with this subcomponent until add_new_attr copies them.
+        """
+        subcomponent = Subcomponent.__new__(Subcomponent)
+        subcomponent.dict_representation = copy.copy(self.dict_representation)
+        subcomponent._shared_attributes = True
+        return subcomponent
 
     def set_name(self, name):
         self.dict_representation["name"] = name
@@ -35,6 +48,11 @@ class Subcomponent:
         # DO NOT CHANGE. Dictionary was not updating if we're going from dict["abc"] is a Ruamel
         # string -> dict["abc"] is a standard string.
         # To fix this, we delete the key before populating
+        if self._shared_attributes:
+            self.dict_representation["attributes"] = copy.copy(
+                self.dict_representation["attributes"]
+            )
+            self._shared_attributes = False
         for k, v in attr_dict.items():
             if k in self.dict_representation["attributes"]:
                 del self.dict_representation["attributes"][k]
@@ -0,0 +1,213 @@
+import csv
+import itertools
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import ruamel.yaml
+
+from accelergy.action_counts_dict_2_obj import action_counts_dict_2_obj
+from accelergy.arch_dict_2_obj import arch_dict_2_obj
+from accelergy.ART_generator import AreaReferenceTableGenerator
+from accelergy.energy_calculator import EnergyCalculator
+from accelergy.ERT_generator import EnergyReferenceTableGenerator
+from accelergy.system_state import SystemState
+from accelergy.utils.parallel import parallel_map
+
+
+def parse_sweep_value(value: str):
+    """
+    Returns a value of a sweep as an int or float if it is a number, else as a quoted string,
+    which is not parsed as an expression.
+    """
+    for number_type in (int, float):
+        try:
+            return number_type(value)
+        except ValueError:
+            pass
+    return ruamel.yaml.scalarstring.DoubleQuotedScalarString(value)
+
+
+def parse_sweep_values(spec: str) -> Tuple[str, list]:
+    """
+    Parses NAME=VALUES into the name and the list of values. VALUES is a list of values
+    separated by commas (e.g. technology=45nm,32nm) or a range START:STOP[:STEP] that includes
+    STOP if it is reached. STEP is an increment (default 1) or, if it starts with x, a factor
+    (e.g. depth=64:65536:x2).
+    """
+    name, _, values = spec.partition("=")
+    name, values = name.strip(), values.strip()
+    if not name or not values:
+        raise ValueError(f'Expected NAME=VALUES to sweep, got "{spec}"')
+    if ":" not in values:
+        return name, [parse_sweep_value(v.strip()) for v in values.split(",")]
+
+    bounds = values.split(":")
+    step = bounds[2].strip() if len(bounds) == 3 else "1"
+    factor = step.startswith("x")
+    if factor:
+        step = step[1:]
+    start, stop, step = (parse_sweep_value(v.strip()) for v in bounds[:2] + [step])
+    if len(bounds) > 3 or not all(
+        isinstance(v, (int, float)) for v in (start, stop, step)
+    ):
+        raise ValueError(
+            f'Expected a range START:STOP[:STEP] for {name}, got "{values}"'
+        )
+    if (factor and (step <= 1 or start <= 0)) or (not factor and step <= 0):
+        raise ValueError(f'Range "{values}" of {name} does not increase')
+
+    if start > stop:
+        raise ValueError(f'Range "{values}" of {name} has no values')
+
+    if factor:
+        n_values = math.floor(math.log(stop / start, step) + 1e-9) + 1
+        return name, [start * step**i for i in range(n_values)]
+    n_values = math.floor((stop - start) / step + 1e-9) + 1
+    return name, [start + step * i for i in range(n_values)]
+
+
+def get_sweep_points(values: Dict[str, list]) -> List[dict]:
+    """Returns every combination of the values of each name. The last name varies fastest."""
+    return [dict(zip(values, point)) for point in itertools.product(*values.values())]
+
+
+class PointExpansions(dict):
+    """
+    The compound component expansions of one point of a sweep: the expansions made by the
+    point, and copies of the shared expansions that it uses. Shared expansions are copied
+    the first time they are used, so a point copies only the expansions of its components.
+    """
+
+    def __init__(self, shared: dict):
+        super().__init__()
+        self.shared = shared
+
+    def __contains__(self, key) -> bool:
+        return super().__contains__(key) or key in self.shared
+
+    def __missing__(self, key):
+        expansion = self[key] = self.shared[key].copy()
+        return expansion
+
+
+class Sweep:
+    """
+    Evaluates a design at each point of a sweep of variables. The inputs, component classes
+    and plug-ins are loaded once, into raw_dicts (loaded with keep_architecture_inputs) and
+    system_state. For each point, the variables and only the components whose names or
+    attributes depend on the swept values are parsed again (see
+    RawInputs2Dicts.with_variables). Points are parsed one at a time rather than as NumPy
+    arrays of values, since the names of component lists and string attributes such as the
+    technology differ between points. All points share the estimation cache, so a primitive
+    action or area is estimated once for the sweep, and the compound component expansions,
+    so a compound component whose attributes do not change with the point is not expanded
+    again.
+
+    Points are evaluated by up to jobs threads. Generating the ERT adds keys to the arguments
+    of the actions of an expansion, so a point uses copies of the shared expansions (see
+    PointExpansions), and its new expansions are shared once it is done.
+    """
+
+    def __init__(self, info):
+        self.raw_dicts = info["raw_dicts"]
+        self.system_state = info["system_state"]
+        self.parser_version = info["parser_version"]
+        self.precision = info["precision"]
+        self.jobs = info.get("jobs", 1)
+        self.process_pool = info.get("process_pool", None)
+        self.lock = threading.Lock()
+
+    def evaluate(self, values: dict) -> SystemState:
+        """
+        Returns the state of the design with the given values: its components, ERT and ART,
+        and its energy estimations if action counts are given.
+        """
+        shared = self.system_state
+        state = SystemState()
+        state.set_accelergy_version(self.parser_version)
+        state.cc_classes, state.pc_classes = shared.cc_classes, shared.pc_classes
+        state.plug_ins, state.plug_in_index = shared.plug_ins, shared.plug_in_index
+        state.estimation_cache = shared.estimation_cache
+        # Defining the arch spec and its components may add classes and actions to the shared
+        # classes
+        with self.lock:
+            raw_dicts = self.raw_dicts.with_variables(values)
+            state.cc_expansions = PointExpansions(shared.cc_expansions)
+            state.set_arch_spec(
+                arch_dict_2_obj(
+                    raw_dicts.get_flatten_arch_spec_dict(),
+                    state.cc_classes,
+                    state.pc_classes,
+                )
+            )
+            state.define_components()
+
+        info = {
+            "parser_version": self.parser_version,
+            "pcs": state.pcs,
+            "ccs": state.ccs,
+            "plug_ins": state.plug_in_index,
+            "estimation_cache": state.estimation_cache,
+            "process_pool": self.process_pool,
+            "precision": self.precision,
+        }
+        state.set_ERT(EnergyReferenceTableGenerator(info).get_ERT())
+        state.set_ART(AreaReferenceTableGenerator(info).get_ART())
+        if "action_counts" in raw_dicts.get_available_inputs():
+            state.set_action_counts(
+                action_counts_dict_2_obj(raw_dicts.get_action_counts_dict())
+            )
+            energy_calc = EnergyCalculator(
+                {
+                    "parser_version": self.parser_version,
+                    "action_counts": state.action_counts,
+                    "ERT": state.ERT,
+                }
+            )
+            state.set_energy_estimations(energy_calc.energy_estimates)
+
+        with self.lock:
+            for key, expansion in state.cc_expansions.items():
+                shared.cc_expansions.setdefault(key, expansion)
+        return state
+
+    def get_rows(self, point: int, values: dict, state: SystemState) -> List[dict]:
+        """
+        Returns a row for each component of an evaluated point: the point index, the values,
+        the component name and area, its energy for the action counts if they are given, and
+        the energy of each action (the average energy if it has several entries).
+        """
+        rows = []
+        for name, ERT_entry in state.ERT.entries.items():
+            row = OrderedDict({"point": point})
+            row.update(values)
+            row["component"] = name
+            ART_entry = state.ART.entries.get(name)
+            row["area"] = ART_entry.get_component_area() if ART_entry else None
+            if state.energy_estimations is not None:
+                row["energy"] = state.energy_estimations.get_energy_estimation(name)
+            for action in ERT_entry.get_actions_energy_min_max_avg_as_list():
+                energy = action.get("energy", action.get("average_energy"))
+                row[f"energy.{action['name']}"] = energy
+            rows.append(row)
+        return rows
+
+    def run(self, points: List[dict]) -> List[dict]:
+        """Evaluates each point and returns the rows of all points, in order."""
+
+        def evaluate_rows(point):
+            return self.get_rows(point, points[point], self.evaluate(points[point]))
+
+        rows = parallel_map(evaluate_rows, range(len(points)), self.jobs)
+        return [row for point_rows in rows for row in point_rows]
+
+
+def write_sweep_csv(path: str, rows: List[dict]):
+    """Writes rows to a CSV file. Columns are in order of appearance; missing values are empty."""
+    columns = list(OrderedDict.fromkeys(k for row in rows for k in row))
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, restval="")
+        writer.writeheader()
+        writer.writerows(rows)
@@ -1,5 +1,13 @@
+import threading
 from accelergy.utils.utils import *
+from accelergy.component_class import ComponentClass
+from accelergy.compound_component import CompoundComponent
+from accelergy.primitive_component import PrimitiveComponent
 from accelergy.plug_in_interface.interface import AccelergyPlugIn
+from accelergy.plug_in_interface.estimation_cache import EstimationCache
+from accelergy.plug_in_interface.lazy_plug_in import LazyPlugIn
+from accelergy.plug_in_interface.plug_in_index import PlugInIndex
+from accelergy.plug_in_interface.query_plug_ins import DECLINED_QUERIES
 
 # Option to list all names and option to list all names and arguments
 # tl accelergy list-components
@@ -14,8 +22,13 @@ class SystemState:
         self.hier_arch_spec = None
         self.ccs = {}
         self.pcs = {}
+        self.cc_expansions = {}
         self.action_counts = None
         self.plug_ins = []
+        self.plug_in_index = PlugInIndex([])
+        self.plug_in_names = set()
+        self._plug_in_names_lock = threading.Lock()
+        self.estimation_cache = EstimationCache()
         self.ERT = None
         self.ART = None
         self.parser_version = None
@@ -68,20 +81,65 @@ class SystemState:
         )
         self.pcs[pc_name] = pc
 
+    def define_components(self):
+        """Adds the fully defined (flattened) component of each component in the arch spec"""
+        for arch_component in self.arch_spec:
+            if arch_component.get_class_name() in self.cc_classes:
+                cc = CompoundComponent(
+                    {
+                        "component": arch_component,
+                        "pc_classes": self.pc_classes,
+                        "cc_classes": self.cc_classes,
+                        "expansions": self.cc_expansions,
+                    }
+                )
+                self.add_cc(cc)
+            else:
+                class_name = arch_component.get_class_name()
+                if class_name not in self.pc_classes:
+                    self.pc_classes[class_name] = ComponentClass(
+                        {"name": class_name, "attributes": {}, "actions": []}
+                    )
+                pc = PrimitiveComponent(
+                    {
+                        "component": arch_component,
+                        "pc_class": self.pc_classes[class_name],
+                    }
+                )
+                self.add_pc(pc)
+
     def add_plug_ins(self, plug_ins):
         ASSERT_MSG(
             isinstance(plug_ins, list), "plug in objects need to be passed in as a list"
         )
-        self.plug_ins = []
-        found_names = set()
-        for plug_in in plug_ins:
-            if plug_in.get_name() in found_names:
-                WARN(f"Plug-in {plug_in.get_name()} is already added")
-            else:
-                self.plug_ins.append(plug_in)
-                found_names.add(plug_in.get_name())
-
+        self.estimation_cache.clear()
+        # Remembered declines keep the previous plug-ins alive
+        DECLINED_QUERIES.clear()
+        self.plug_in_names = set()
+        self.plug_ins = self.check_plug_ins(plug_ins)
         for plug_in in self.plug_ins:
+            if isinstance(plug_in, LazyPlugIn):
+                plug_in.on_load = self.check_plug_ins
+        self.plug_in_index = PlugInIndex(self.plug_ins)
+
+    def check_plug_ins(self, plug_ins):
+        """
+        Returns the plug-ins whose names have not been added yet, warning about the others,
+        and initializes them. Placeholders (LazyPlugIn) are kept, and the plug-ins they load
+        are checked when they are loaded.
+        """
+        checked = []
+        with self._plug_in_names_lock:
+            for plug_in in plug_ins:
+                if isinstance(plug_in, LazyPlugIn):
+                    checked.append(plug_in)
+                elif plug_in.get_name() in self.plug_in_names:
+                    WARN(f"Plug-in {plug_in.get_name()} is already added")
+                else:
+                    checked.append(plug_in)
+                    self.plug_in_names.add(plug_in.get_name())
+
+        for plug_in in checked:
             if isinstance(plug_in, AccelergyPlugIn):
                 if not getattr(plug_in, "_accelergy_plug_in_initialized", False):
                     plug_in.__AccelergyPlugIn__init__()
@@ -90,6 +148,7 @@ class SystemState:
                         f"Plug-in {plug_in.get_name()} is not initialized. Please "
                         f"call super().__init__() in the plug-in's __init__ method."
                     )
+        return checked
 
     def set_ERT(self, ERT):
         self.ERT = ERT
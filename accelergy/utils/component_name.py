@@ -0,0 +1,85 @@
+from functools import cached_property
+from typing import Tuple, Union
+
+# Parsed names keyed by name. Cleared when it grows past the max size.
+COMPONENT_NAMES = {}
+COMPONENT_NAMES_MAX_SIZE = 65536
+
+
+class ComponentName:
+    """
+    A component name parsed once into the parts that are otherwise parsed from the string on
+    every use. E.g. "PE[0..15].buf[2]" has base name "PE.buf", ranges and indices
+    [(0, 15), 2], and names 16 identical components. Each part is parsed the first time it is
+    used, so a part that can not be parsed raises only where it is used. ComponentName.get
+    returns one object per name.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @staticmethod
+    def get(name: str) -> "ComponentName":
+        """Returns the parsed name, parsing it on the first call."""
+        component_name = COMPONENT_NAMES.get(name)
+        if component_name is None:
+            if len(COMPONENT_NAMES) >= COMPONENT_NAMES_MAX_SIZE:
+                COMPONENT_NAMES.clear()
+            component_name = COMPONENT_NAMES[name] = ComponentName(name)
+        return component_name
+
+    @cached_property
+    def base_name(self) -> str:
+        """
+        The name without its list brackets. Raises ValueError if a bracket is not closed or
+        opened.
+        """
+        base_name, name = "", self.name
+        while "[" in name:
+            start_idx = name.find("[")
+            end_idx = name.find("]", start_idx)
+            if end_idx == -1 or "]" in name[:start_idx]:
+                break
+            base_name, name = base_name + name[:start_idx], name[end_idx + 1 :]
+        if "[" in name or "]" in name:
+            raise ValueError(
+                f'Component name "{self.name}" has a bracket that is not closed or '
+                f'opened. Lists of components are named as "name[start..end]".'
+            )
+        return base_name + name
+
+    @cached_property
+    def ranges(self) -> Tuple[Union[int, Tuple[int, int]], ...]:
+        """The (start, end) range or the index in each pair of brackets, in order."""
+        ranges, name = [], self.name
+        while True:
+            start_idx, end_idx = name.find("["), name.find("]")
+            in_brackets = name[start_idx + 1 : end_idx]
+            if ".." in in_brackets:
+                bounds = in_brackets.split("..")
+                ranges.append((int(bounds[0]), int(bounds[1])))
+            else:
+                ranges.append(int(in_brackets))
+            name = name[end_idx + 1 :]
+            if "]" not in name:
+                return tuple(ranges)
+
+    @cached_property
+    def n_identical(self) -> int:
+        """The number of identical components named: the product of the range lengths."""
+        n_identical, name = 1, self.name
+        while True:
+            start_idx, end_idx = name.find("["), name.find("]")
+            in_brackets = name[start_idx + 1 : end_idx]
+            if ".." in in_brackets:
+                bounds = in_brackets.split("..")
+                n_identical *= int(bounds[1]) - int(bounds[0]) + 1
+            name = name[end_idx + 1 :]
+            if "]" not in name:
+                return n_identical
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"ComponentName({self.name!r})"
@@ -1,5 +1,6 @@
 import logging
 import queue
+import threading
 from typing import Callable, List, Union
 from logging.handlers import QueueHandler, QueueListener
 
@@ -13,6 +14,31 @@ FORMATTED = '2023-01-12 17:00:59 LEVEL:'
 LOG_QUEUES = {}
 NAME2LOGGER = {}
 
+class ThreadLocalQueue(threading.local):
+    """
+    A queue of log records with one queue.Queue for each thread. Records are queued in and
+    popped from the queue of the calling thread, so the messages logged by a plug-in call
+    are popped by the same call when calls run in parallel threads.
+    """
+    def __init__(self):
+        self.local_queue = queue.Queue()
+
+    @property
+    def queue(self):
+        return self.local_queue.queue
+
+    def put(self, item, block=True, timeout=None):
+        self.local_queue.put(item, block, timeout)
+
+    def put_nowait(self, item):
+        self.local_queue.put_nowait(item)
+
+    def get(self, block=True, timeout=None):
+        return self.local_queue.get(block, timeout)
+
+    def empty(self):
+        return self.local_queue.empty()
+
 def queue_from_logger(logger: Union[logging.Logger, str]) -> List[str]:
     if isinstance(logger, str) and logger in LOG_QUEUES:
         return LOG_QUEUES[logger]
@@ -29,7 +55,7 @@ def get_logger(name: str) -> logging.Logger:
     logger.propagate = False
     NAME2LOGGER[name] = logger
     if name not in LOG_QUEUES:
-        LOG_QUEUES[name] = queue.Queue()
+        LOG_QUEUES[name] = ThreadLocalQueue()
         logger.addHandler(logging.handlers.QueueHandler(LOG_QUEUES[name]))
     return logger
 
@@ -0,0 +1,46 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def parallel_map(func: Callable[[T], R], items: Iterable[T], jobs: int = 1) -> List[R]:
+    """
+    Returns [func(item) for item in items], calling func from up to jobs threads. Results are
+    returned in the order of items regardless of the order in which they finish. If a call
+    raises (including SystemExit from ERROR_CLEAN_EXIT), calls that have not started are
+    cancelled and the exception of the first failing item in order is raised.
+    """
+    items = list(items)
+    if jobs is None or jobs <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        try:
+            return [f.result() for f in futures]
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
+
+
+def parallel_map_batches(
+    func: Callable[[List[T]], List[R]],
+    items: Iterable[T],
+    jobs: int = 1,
+    batches_per_job: int = 4,
+) -> List[R]:
+    """
+    Returns func applied to contiguous batches of items, flattened in the order of items. With
+    one job, all items are passed in a single batch. Otherwise, items are split into about
+    jobs * batches_per_job batches that are processed by up to jobs threads.
+    """
+    items = list(items)
+    if jobs is None or jobs <= 1:
+        return func(items) if items else []
+    batch_size = max(1, math.ceil(len(items) / (jobs * batches_per_job)))
+    batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+    return [r for results in parallel_map(func, batches, jobs) for r in results]
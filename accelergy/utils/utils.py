@@ -24,6 +24,7 @@ import os, sys
 
 from copy import deepcopy
 from typing import List
+from accelergy.utils.component_name import ComponentName
 
 import logging
 
@@ -77,15 +78,41 @@ def ASSERT_MSG(expression, msg):
 
 
 def remove_brackets(name):
-    """Removes the brackets from a component name in a list"""
-    if "[" not in name and "]" not in name:
-        return name
-    if "[" in name and "]" in name:
-        start_idx = name.find("[")
-        end_idx = name.find("]")
-        name = name[:start_idx] + name[end_idx + 1 :]
-        name = remove_brackets(name)
-        return name
+    """
+    Removes the brackets from a component name in a list. Raises ValueError if a bracket is
+    not closed or opened.
+    """
+    return ComponentName.get(name).base_name
+
+
+def freeze(value):
+    """
+    Returns a hashable, canonical representation of a (possibly nested) value. Dicts are frozen
+    into sorted tuples of key-value pairs, lists and tuples into tuples, and string subclasses
+    (e.g. ruamel scalar strings) into plain strings. Other scalars are tagged with their type so
+    that values that compare equal across types (e.g. 1, 1.0, and True) are kept distinct;
+    subclasses of bool, int, and float (e.g. ruamel scalar numbers) are tagged with the base type.
+    Raises TypeError if the value can not be hashed.
+    """
+    if isinstance(value, str):
+        return str(value)
+    for base in (bool, int, float):
+        if isinstance(value, base):
+            return (base, base(value))
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple(
+                sorted(
+                    ((str(k), freeze(v)) for k, v in value.items()),
+                    key=lambda x: x[0],
+                )
+            ),
+        )
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(freeze(v) for v in value))
+    hash(value)
+    return (type(value), value)
 
 
 def indent_list_text_block(prefix: str, list_to_print: List[str]):
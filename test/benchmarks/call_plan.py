@@ -0,0 +1,86 @@
+"""
+Microbenchmark of the per-call overhead of CallableFunction: checking that the arguments
+match, then calling the function. Compares precompiled call plans with matching the
+arguments on every call, as was done before call plans.
+
+Usage: python call_plan.py [n_calls]
+"""
+
+import logging
+import sys
+import timeit
+from typing import Any, Optional
+
+from accelergy.plug_in_interface.estimator_wrapper import CallableFunction
+
+USED_ATTRIBUTES = {"technology": "45nm", "width": 32, "depth": 1024}
+ALL_ATTRIBUTES = {
+    "technology": "45nm",
+    "global_cycle_seconds": 1e-9,
+    "action_latency_cycles": 1,
+    "cycle_seconds": 1e-9,
+    "n_instances": 1,
+    "width": 32,
+    "depth": 1024,
+    "n_rw_ports": 1,
+}
+
+
+class SRAM:
+    def __init__(self, technology, width, depth, n_rw_ports=1, n_banks=1):
+        pass
+
+
+class UnplannedCallableFunction(CallableFunction):
+    """CallableFunction that matches arguments on every call."""
+
+    def get_call_error_message(
+        self, name: str, kwargs: dict, class_name: str = ""
+    ) -> Optional[str]:
+        name_error = self.get_error_message_for_name_match(name, class_name)
+        if name_error is not None:
+            return name_error
+        return self.get_error_message_for_non_default_arg_match(kwargs, class_name)
+
+    def call(self, kwargs: dict, class_name: str = "", obj: object = None) -> Any:
+        kwags_included = {
+            k: v
+            for k, v in kwargs.items()
+            if k in self.non_default_args or k in self.default_args
+        }
+        unneeded_args = [k for k in kwargs.keys() if k not in kwags_included]
+        if unneeded_args:
+            self.logger.warn(
+                f'Unused arguments ({", ".join(unneeded_args)}) provided for {class_name}.'
+                f'{self.function_name}. Arguments used: ({", ".join(kwags_included.keys())})'
+            )
+        return self.function(**kwags_included)
+
+
+def check_and_call(function: CallableFunction, kwargs: dict):
+    if function.get_call_error_message("__init__", kwargs, "SRAM") is None:
+        function.call(kwargs, "SRAM")
+
+
+def main(n_calls: int):
+    logger = logging.getLogger("benchmark")
+    logger.disabled = True
+    # Logger.warn is deprecated and issues a warning, which would dominate the timings
+    logger.warn = logger.info
+
+    for attrs in [USED_ATTRIBUTES, ALL_ATTRIBUTES]:
+        for cls in [UnplannedCallableFunction, CallableFunction]:
+            function = cls(SRAM, logger, is_init=True)
+            seconds = min(
+                timeit.repeat(
+                    lambda: check_and_call(function, attrs), number=n_calls, repeat=5
+                )
+            )
+            print(
+                f"{cls.__name__:>25}, {len(attrs)} attributes: "
+                f"{seconds / n_calls * 1e6:.2f} us per call"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
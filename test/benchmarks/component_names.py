@@ -0,0 +1,151 @@
+"""
+Benchmark of component name parsing. Compares the interned ComponentName, which parses each
+name once, with parsing the name string on every use as was done before.
+
+Names are those of a deep hierarchy, e.g. "chip[0..3].cluster[0..7].PE[0..15].buf[0..3]"
+for the ERT and "chip[2].cluster[5].PE[11].buf[1]" for the action counts. The benchmark
+times the ERT lookups of the energy calculation and the name parsing of ERT and ART
+generation.
+
+Usage: python component_names.py [n_names] [depth]
+"""
+
+import logging
+import random
+import sys
+import timeit
+
+import accelergy.ERT_generator as ERT_generator
+import accelergy.parsing_utils as parsing_utils
+from accelergy.ERT_generator import ERT
+from accelergy.utils.component_name import ComponentName
+
+LEVELS = ["chip", "cluster", "PE", "buf", "bank", "row", "mux", "cell"]
+
+
+def remove_brackets(name):
+    if "[" not in name and "]" not in name:
+        return name
+    if "[" in name and "]" in name:
+        start_idx = name.find("[")
+        end_idx = name.find("]")
+        name = name[:start_idx] + name[end_idx + 1 :]
+        name = remove_brackets(name)
+        return name
+
+
+def count_num_identical_comps(name):
+    total_num_identical_comps = 1
+    start_idx = name.find("[")
+    end_idx = name.find("]")
+    potential_range = name[start_idx + 1 : end_idx]
+    if ".." in potential_range:
+        range_start = int(potential_range.split("..")[0])
+        range_end = int(potential_range.split("..")[1])
+        total_num_identical_comps *= range_end - range_start + 1
+    if "]" in name[end_idx + 1 :]:
+        total_num_identical_comps *= count_num_identical_comps(name[end_idx + 1 :])
+    return total_num_identical_comps
+
+
+def get_ranges_or_indices_in_name(name):
+    exisiting_ranges = []
+    start_idx = name.find("[")
+    end_idx = name.find("]")
+    range = name[start_idx + 1 : end_idx]
+    if ".." in range:
+        val = (int(range.split("..")[0]), int(range.split("..")[1]))
+    else:
+        val = int(range)
+    exisiting_ranges.append(val)
+    subname = name[end_idx + 1 :]
+    if "]" in subname:
+        exisiting_ranges += get_ranges_or_indices_in_name(subname)
+    return exisiting_ranges
+
+
+class UninternedComponentName:
+    """Parses the name string every time a part is used"""
+
+    def __init__(self, name):
+        self.name = name
+
+    @staticmethod
+    def get(name):
+        return UninternedComponentName(name)
+
+    base_name = property(lambda self: remove_brackets(self.name))
+    ranges = property(lambda self: get_ranges_or_indices_in_name(self.name))
+    n_identical = property(lambda self: count_num_identical_comps(self.name))
+
+
+def set_interned(interned: bool):
+    name_type = ComponentName if interned else UninternedComponentName
+    for module in [ERT_generator, parsing_utils]:
+        module.ComponentName = name_type
+
+
+def make_names(n_names: int, depth: int):
+    """Returns names of components with ranges and names of one component in each"""
+    random.seed(0)
+    ranged, indexed = [], []
+    for i in range(n_names):
+        levels = [
+            f"{LEVELS[d % len(LEVELS)]}{i if d == depth - 1 else ''}"
+            for d in range(depth)
+        ]
+        sizes = [random.choice([2, 4, 8, 16]) for _ in range(depth)]
+        ranged.append(".".join(f"{l}[0..{s - 1}]" for l, s in zip(levels, sizes)))
+        indexed.append(
+            ".".join(f"{l}[{random.randrange(s)}]" for l, s in zip(levels, sizes))
+        )
+    return ranged, indexed
+
+
+def lookup(ert: ERT, names: list):
+    for name in names:
+        ert.get_ERT_entry(name)
+
+
+def generate(names: list):
+    """Parses the names as ERT and ART generation do for each primitive action"""
+    for name in names:
+        component_name = ERT_generator.ComponentName.get(name)
+        component_name.base_name
+        component_name.n_identical
+
+
+def main(n_names: int, depth: int):
+    logging.disable(logging.CRITICAL)
+    ranged, indexed = make_names(n_names, depth)
+    ert = ERT(0.4, 6)
+    for name in ranged:
+        ert.add_action_entry(
+            {
+                "name": name,
+                "action_name": "read",
+                "arguments": None,
+                "energy": 1,
+                "estimator": "bench",
+            }
+        )
+    print(f"{n_names} names with {depth} levels, e.g. {ranged[0]}")
+    for task, func in [
+        ("ERT lookups", lambda: lookup(ert, indexed)),
+        ("ERT generation", lambda: generate(ranged)),
+    ]:
+        for interned in [False, True]:
+            set_interned(interned)
+            seconds = min(timeit.repeat(func, number=10, repeat=5)) / 10
+            print(
+                f"{'Interned' if interned else 'Strings':>8} {task:>14}: "
+                f"{seconds / n_names * 1e6:.2f} us per name"
+            )
+    set_interned(True)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 6,
+    )
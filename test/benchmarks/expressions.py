@@ -0,0 +1,144 @@
+"""
+Benchmark of expression evaluation in parse_expression_for_arithmetic. Compares compiled
+expressions and prebuilt function bindings with compiling each expression and rebuilding the
+bindings on every call, as was done before the caches.
+
+The first part times single expressions. The second part records every expression evaluated
+while running Accelergy, then times evaluating all of them again. The inputs are given as
+Accelergy arguments, e.g. the input files of a timeloop-accelergy-exercises example (see
+test/tests/exercises), or, by default, are the synthetic inputs of synthetic_inputs.py.
+
+Usage: python expressions.py [n_calls] [accelergy arguments...]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import timeit
+
+import accelergy.parsing_utils as parsing_utils
+from accelergy.accelergy_console import run
+from synthetic_inputs import write_inputs
+
+EXPRESSIONS = [
+    ("depth * width", {"depth": 1024, "width": 32}),
+    ("log2(datawidth)", {"datawidth": 16}),
+    ("max(1, ceil(depth / n_banks))", {"depth": 1024, "n_banks": 4}),
+]
+
+
+def uncached_compiled_expression(expression: str) -> str:
+    return expression
+
+
+def uncached_function_bindings() -> dict:
+    bindings = {"__builtins__": None}
+    bindings.update(parsing_utils.SCRIPT_FUNCS)
+    bindings.update(parsing_utils.MATH_FUNCS)
+    return bindings
+
+
+def uncached_refresh_math_funcs():
+    scripts = os.environ.get("ACCELERGY_MATH_FUNCTIONS", "").split(":")
+    scripts = [s.strip() for s in scripts if s.strip()]
+    scripts += parsing_utils.SCRIPTS_FROM
+    for script in scripts:
+        if script in parsing_utils.LOADED_MATH_FUNCS_FROM:
+            continue
+        parsing_utils.load_functions_from_file(script)
+
+
+CACHED = {
+    "get_compiled_expression": parsing_utils.get_compiled_expression,
+    "get_function_bindings": parsing_utils.get_function_bindings,
+    "refresh_math_funcs": parsing_utils.refresh_math_funcs,
+}
+UNCACHED = {
+    "get_compiled_expression": uncached_compiled_expression,
+    "get_function_bindings": uncached_function_bindings,
+    "refresh_math_funcs": uncached_refresh_math_funcs,
+}
+
+
+def set_cached(cached: bool):
+    """Switches parse_expression_for_arithmetic between the caches and the old behavior."""
+    for name, func in (CACHED if cached else UNCACHED).items():
+        setattr(parsing_utils, name, func)
+
+
+def record_expressions(args: list) -> list:
+    """Runs Accelergy and returns the arguments of each parse_expression_for_arithmetic call."""
+    calls = []
+    parse = parsing_utils.parse_expression_for_arithmetic
+
+    def recording_parse(expression, binding_dictionary, *args, **kwargs):
+        calls.append((expression, dict(binding_dictionary or {}), args, kwargs))
+        return parse(expression, binding_dictionary, *args, **kwargs)
+
+    # Modules import the function with "from accelergy.parsing_utils import *"
+    modules = [
+        m
+        for m in list(sys.modules.values())
+        if getattr(m, "__dict__", None) is not None
+    ]
+    modules = [m for m in modules if m.__dict__.get(parse.__name__) is parse]
+    for m in modules:
+        setattr(m, parse.__name__, recording_parse)
+    try:
+        with tempfile.TemporaryDirectory() as outdir:
+            sys.argv = ["accelergy"] + args + ["-o", outdir, "--no-cache"]
+            run()
+    finally:
+        for m in modules:
+            setattr(m, parse.__name__, parse)
+    return calls
+
+
+def replay_expressions(calls: list):
+    for expression, binding_dictionary, args, kwargs in calls:
+        parsing_utils.parse_expression_for_arithmetic(
+            expression, binding_dictionary, *args, **kwargs
+        )
+
+
+def main(n_calls: int, args: list):
+    logging.disable(logging.CRITICAL)
+    for expression, bindings in EXPRESSIONS:
+        for cached in [False, True]:
+            set_cached(cached)
+            seconds = min(
+                timeit.repeat(
+                    lambda: parsing_utils.parse_expression_for_arithmetic(
+                        expression, bindings, "benchmark"
+                    ),
+                    number=n_calls,
+                    repeat=5,
+                )
+            )
+            print(
+                f"{'Cached' if cached else 'Uncached':>8} {expression:>30}: "
+                f"{seconds / n_calls * 1e6:.2f} us per call"
+            )
+
+    if not args:
+        args = write_inputs(tempfile.mkdtemp(prefix="accelergy_benchmark_"))
+    calls = record_expressions(args)
+    expressions = [c[0] for c in calls if isinstance(c[0], str)]
+    print(
+        f"Accelergy run evaluated {len(calls)} expressions, {len(expressions)} strings, "
+        f"{len(set(expressions))} distinct strings."
+    )
+    for cached in [False, True]:
+        set_cached(cached)
+        seconds = min(
+            timeit.repeat(lambda: replay_expressions(calls), number=1, repeat=5)
+        )
+        print(
+            f"{'Cached' if cached else 'Uncached':>8} expressions of Accelergy run: "
+            f"{seconds * 1e3:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000, sys.argv[2:])
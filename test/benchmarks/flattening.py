@@ -0,0 +1,85 @@
+"""
+Benchmark of component flattening: defining each component of an architecture from its
+class, which expands the subcomponents and flattens the actions of compound components.
+Reports the time and the peak memory allocated (traced with tracemalloc) while defining the
+components. Each compound component is expanded, as if no two had the same attributes.
+
+The inputs are those of synthetic_inputs.py with n_pairs scratchpad/MAC pairs, i.e.
+2 * n_pairs + 1 components.
+
+Usage: python flattening.py [n_pairs]
+"""
+
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import accelergy.version as version
+from accelergy.arch_dict_2_obj import arch_dict_2_obj
+from accelergy.component_class import ComponentClass
+from accelergy.compound_component import CompoundComponent
+from accelergy.primitive_component import PrimitiveComponent
+from accelergy.raw_inputs_2_dicts import RawInputs2Dicts
+from synthetic_inputs import write_inputs
+
+
+def define_components(arch_obj, cc_classes: dict, pc_classes: dict) -> list:
+    components = []
+    for arch_component in arch_obj:
+        class_name = arch_component.get_class_name()
+        if class_name in cc_classes:
+            components.append(
+                CompoundComponent(
+                    {
+                        "component": arch_component,
+                        "pc_classes": pc_classes,
+                        "cc_classes": cc_classes,
+                    }
+                )
+            )
+        else:
+            components.append(
+                PrimitiveComponent(
+                    {"component": arch_component, "pc_class": pc_classes[class_name]}
+                )
+            )
+    return components
+
+
+def main(n_pairs: int):
+    logging.disable(logging.CRITICAL)
+    args = write_inputs(tempfile.mkdtemp(prefix="accelergy_benchmark_"), n_pairs)
+    raw_dicts = RawInputs2Dicts(
+        {"path_arglist": args[:2], "parser_version": version.__version__}, False
+    )
+    cc_classes = {
+        name: ComponentClass(info) for name, info in raw_dicts.get_cc_classses().items()
+    }
+    pc_classes = {}
+    arch_obj = arch_dict_2_obj(
+        raw_dicts.get_flatten_arch_spec_dict(), cc_classes, pc_classes
+    )
+    for name, info in raw_dicts.get_pc_classses().items():
+        pc_classes.setdefault(name, ComponentClass(info))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    components = define_components(arch_obj, cc_classes, pc_classes)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"Defined {len(components)} components in {seconds:.2f} s (traced), "
+        f"peak {peak / 2 ** 20:.1f} MiB allocated"
+    )
+
+    start = time.perf_counter()
+    define_components(arch_obj, cc_classes, pc_classes)
+    seconds = time.perf_counter() - start
+    print(f"Defined {len(components)} components in {seconds:.2f} s (untraced)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,65 @@
+"""
+Benchmark of parsing the attributes of a component over a sweep of one attribute. Compares
+parsing the attributes once for each point of the sweep with parsing them once with the
+swept attribute bound to a NumPy array, then splitting the result into points.
+
+Usage: python sweep_expressions.py [n_points]
+"""
+
+import logging
+import math
+import sys
+import timeit
+
+import numpy as np
+
+from accelergy.parsing_utils import parse_expressions_sequentially_replacing_bindings
+
+ATTRIBUTES = {
+    "width": "datawidth * 4",
+    "n_banks": "max(1, depth // 4096)",
+    "bank_depth": "max(1, ceil(depth / n_banks))",
+    "n_bits": "width * depth",
+    "address_width": "max(1, ceil(log2(bank_depth)))",
+    "area_scale": "sqrt(n_bits / 1024)",
+    "energy_scale": "log2(bank_depth) / 10 + 1",
+}
+BINDINGS = {"datawidth": 16, "technology": "45nm", "global_cycle_seconds": 1e-9}
+
+
+def parse_points(depths: list) -> list:
+    return [
+        parse_expressions_sequentially_replacing_bindings(
+            ATTRIBUTES, dict(BINDINGS, depth=d), "benchmark.", propagate_keys=False
+        )
+        for d in depths
+    ]
+
+
+def parse_sweep(depths: list) -> list:
+    parsed = parse_expressions_sequentially_replacing_bindings(
+        ATTRIBUTES,
+        dict(BINDINGS, depth=np.array(depths)),
+        "benchmark.",
+        propagate_keys=False,
+    )
+    points = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in parsed.items()}
+    return [
+        {k: v[i] if isinstance(parsed[k], np.ndarray) else v for k, v in points.items()}
+        for i in range(len(depths))
+    ]
+
+
+def main(n_points: int):
+    logging.disable(logging.CRITICAL)
+    depths = [64 * 2 ** (i % 11) + i for i in range(n_points)]
+    # NumPy and math functions may round the last digit differently
+    for point, swept in zip(parse_points(depths), parse_sweep(depths)):
+        assert all(math.isclose(v, swept[k], rel_tol=1e-12) for k, v in point.items())
+    for name, func in [("Each point", parse_points), ("Vectorized", parse_sweep)]:
+        seconds = min(timeit.repeat(lambda: func(depths), number=1, repeat=5))
+        print(f"{name:>10}: {seconds * 1e3:.2f} ms for {n_points} points")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
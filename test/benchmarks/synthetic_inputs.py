@@ -0,0 +1,173 @@
+"""
+Writes synthetic Accelergy inputs for benchmarks: an architecture with a global buffer and a
+list of PEs. Each PE has n_pairs pairs of a scratchpad and a MAC of different sizes, so there
+are 2 * n_pairs + 1 distinct components. Component attributes are expressions of variables
+and of the attributes of their classes, as in the timeloop-accelergy-exercises inputs, and
+the plug-in estimates every primitive component.
+
+Usage: python synthetic_inputs.py <directory> [n_pairs]
+"""
+
+import os
+import sys
+from typing import List
+
+COMPONENTS = """
+compound_components:
+  version: 0.4
+  classes:
+  - name: smartbuffer
+    attributes: {technology: "must_specify", width: 16, depth: 1024, n_banks: 4}
+    subcomponents:
+    - name: storage
+      class: bench_sram
+      attributes:
+        width: width
+        depth: max(1, ceil(depth / n_banks))
+        n_banks: n_banks
+        n_bits: width * depth
+    - name: address_generator
+      class: bench_adder
+      attributes:
+        width: max(1, ceil(log2(depth)))
+    actions:
+    - name: read
+      subcomponents:
+      - {name: storage, actions: [{name: read}]}
+      - {name: address_generator, actions: [{name: add}]}
+    - name: write
+      subcomponents:
+      - {name: storage, actions: [{name: write}]}
+      - {name: address_generator, actions: [{name: add}]}
+    - name: idle
+      subcomponents:
+      - {name: storage, actions: [{name: leak}]}
+"""
+
+ARCHITECTURE = """
+variables:
+  version: 0.4
+  technology: "45nm"
+  global_cycle_seconds: 1e-9
+  datawidth: 16
+  meshX: 16
+
+architecture:
+  version: 0.4
+  subtree:
+  - name: system
+    local:
+    - name: buffer
+      class: smartbuffer
+      attributes: {{width: datawidth * 4, depth: 2 ** 14, n_banks: 8}}
+    subtree:
+    - name: PE[0..{last_pe}]
+      local:
+{pe_components}
+"""
+
+PE_COMPONENTS = """
+      - name: scratchpad{i}
+        class: smartbuffer
+        attributes: {{width: datawidth, depth: 16 * {depth}, n_banks: 1}}
+      - name: mac{i}
+        class: bench_mac
+        attributes:
+          width: datawidth * {width}
+          n_instances: max(1, meshX // 16)
+"""
+
+PLUG_IN = """
+from accelergy.plug_in_interface.estimator import Estimator, actionDynamicEnergy
+
+
+class BenchSRAM(Estimator):
+    name = "bench_sram"
+    percent_accuracy_0_to_100 = 90
+
+    def __init__(self, width: int, depth: int, n_banks: int = 1):
+        super().__init__()
+        self.width, self.depth, self.n_banks = width, depth, n_banks
+
+    @actionDynamicEnergy
+    def read(self):
+        return 1e-15 * self.width * self.depth ** 0.5
+
+    @actionDynamicEnergy
+    def write(self):
+        return 1.2e-15 * self.width * self.depth ** 0.5
+
+    def leak(self, global_cycle_seconds):
+        return 1e-6 * self.width * self.depth * self.n_banks * global_cycle_seconds
+
+    def get_area(self):
+        return 1e-12 * self.width * self.depth
+
+
+class BenchAdder(Estimator):
+    name = "bench_adder"
+    percent_accuracy_0_to_100 = 90
+
+    def __init__(self, width: int):
+        super().__init__()
+        self.width = width
+
+    @actionDynamicEnergy
+    def add(self):
+        return 5e-15 * self.width
+
+    def leak(self, global_cycle_seconds):
+        return 0
+
+    def get_area(self):
+        return 1e-12 * self.width
+
+
+class BenchMAC(Estimator):
+    name = "bench_mac"
+    percent_accuracy_0_to_100 = 90
+
+    def __init__(self, width: int):
+        super().__init__()
+        self.width = width
+
+    @actionDynamicEnergy
+    def mac(self):
+        return 1e-15 * self.width ** 2
+
+    def leak(self, global_cycle_seconds):
+        return 0
+
+    def get_area(self):
+        return 1e-12 * self.width ** 2
+"""
+
+
+def write_inputs(directory: str, n_pairs: int = 100, n_pes: int = 256) -> List[str]:
+    """Writes the inputs to directory and returns the arguments to run Accelergy on them."""
+    os.makedirs(directory, exist_ok=True)
+    pe_components = "".join(
+        PE_COMPONENTS.format(i=i, depth=i % 64 + 1, width=i % 4 + 1)
+        for i in range(n_pairs)
+    )
+    paths = {
+        "arch.yaml": ARCHITECTURE.format(
+            last_pe=n_pes - 1, pe_components=pe_components.strip("\n")
+        ),
+        "components.yaml": COMPONENTS,
+        "plug_in.py": PLUG_IN,
+    }
+    for name, contents in paths.items():
+        with open(os.path.join(directory, name), "w") as f:
+            f.write(contents.lstrip())
+    return [
+        os.path.join(directory, "arch.yaml"),
+        os.path.join(directory, "components.yaml"),
+        "-e",
+        os.path.join(directory, "plug_in.py"),
+    ]
+
+
+if __name__ == "__main__":
+    args = write_inputs(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 100)
+    print("accelergy " + " ".join(args))
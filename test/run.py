@@ -1,5 +1,11 @@
 import os
+import sys
 import unittest
+
+# The basic tests import their shared helpers from their directory
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "basic")
+)
 import tests.action_area_scale.test
 import tests.plugin_choices.test
 import tests.plugin_choices_II.test
@@ -8,6 +14,22 @@ import tests.exercises.test
 from tests.basic.test_energy_calculation import TestEnergyCalculation
 from tests.basic.test_helper_functions import TestHelperFunctions
 from tests.basic.test_parsing_utils import TestParsingUtils
+from tests.basic.test_estimation_cache import (
+    TestEstimationCache,
+    TestPersistentEstimationCache,
+)
+from tests.basic.test_plug_in_index import TestPlugInIndex
+from tests.basic.test_plug_in_selection import TestPlugInSelection
+from tests.basic.test_parallel import TestParallel
+from tests.basic.test_estimation_pool import TestEstimationPool
+from tests.basic.test_batch_estimation import TestBatchEstimation
+from tests.basic.test_estimator_wrapper import TestEstimatorWrapper
+from tests.basic.test_plug_in_manifest import TestPlugInManifest
+from tests.basic.test_lazy_plug_in import TestLazyPlugIn
+from tests.basic.test_component_class import TestComponentClass
+from tests.basic.test_separable_arguments import TestSeparableArguments
+from tests.basic.test_primitive_action_plan import TestPrimitiveActionPlan
+from tests.basic.test_sweep import TestSweep
 import argparse
 import utils
 
@@ -34,6 +56,20 @@ if __name__ == "__main__":
     addTests(TestEnergyCalculation)
     addTests(TestHelperFunctions)
     addTests(TestParsingUtils)
+    addTests(TestEstimationCache)
+    addTests(TestPersistentEstimationCache)
+    addTests(TestPlugInIndex)
+    addTests(TestPlugInSelection)
+    addTests(TestParallel)
+    addTests(TestEstimationPool)
+    addTests(TestBatchEstimation)
+    addTests(TestEstimatorWrapper)
+    addTests(TestPlugInManifest)
+    addTests(TestLazyPlugIn)
+    addTests(TestComponentClass)
+    addTests(TestSeparableArguments)
+    addTests(TestPrimitiveActionPlan)
+    addTests(TestSweep)
     addTests(tests.action_area_scale.test.Test)
     addTests(tests.plugin_choices.test.Test)
     addTests(tests.plugin_choices_II.test.Test)
@@ -0,0 +1,98 @@
+"""Fake plug-ins and a query builder shared by the tests."""
+
+from accelergy.plug_in_interface.estimator import Estimator, actionDynamicEnergy
+from accelergy.plug_in_interface.interface import (
+    AccelergyPlugIn,
+    AccuracyEstimation,
+    Estimation,
+)
+
+
+class FakePlugIn(AccelergyPlugIn):
+    """
+    Estimates any query with the given accuracy. The energy (pJ) and area (um^2) are
+    the value of the value_key argument or attribute of the query, or 1 if the query
+    has neither. Estimating fails if fails is True or the value is in fail_values.
+    Calls are counted.
+    """
+
+    def __init__(
+        self,
+        name="fake",
+        accuracy=100,
+        max_accuracy=None,
+        value_key="width",
+        fails=False,
+        fail_values=(),
+        thread_safe=True,
+    ):
+        self.name = name
+        self.accuracy = accuracy
+        self.max_accuracy = max_accuracy
+        self.value_key = value_key
+        self.fails = fails
+        self.fail_values = fail_values
+        self.thread_safe = thread_safe
+        self.n_accuracy_calls = 0
+        self.n_estimate_calls = 0
+        super().__init__()
+
+    def get_value(self, query):
+        arguments = query.action_args or {}
+        value = arguments.get(self.value_key, query.class_attrs.get(self.value_key, 1))
+        if self.fails or value in self.fail_values:
+            raise ValueError(f"{self.name} can not estimate {self.value_key}={value}")
+        return value
+
+    def primitive_action_supported(self, query):
+        self.n_accuracy_calls += 1
+        return AccuracyEstimation(self.accuracy)
+
+    def estimate_energy(self, query):
+        self.n_estimate_calls += 1
+        return Estimation(self.get_value(query), "p")
+
+    def primitive_area_supported(self, query):
+        return self.primitive_action_supported(query)
+
+    def estimate_area(self, query):
+        self.n_estimate_calls += 1
+        return Estimation(self.get_value(query), "u^2")
+
+    def get_max_accuracy(self):
+        return self.max_accuracy
+
+    def get_name(self):
+        return self.name
+
+
+class Adder(Estimator):
+    """A Python plug-in for the adder class. Energy and area are 1 pJ and 1 um^2/bit."""
+
+    name = "adder"
+    percent_accuracy_0_to_100 = 90
+
+    def __init__(self, width: int):
+        super().__init__()
+        self.width = width
+
+    @actionDynamicEnergy
+    def add(self) -> float:
+        return self.width * 1e-12
+
+    def get_area(self) -> float:
+        return self.width * 1e-12
+
+    def leak(self, global_cycle_seconds: float) -> float:
+        return 0
+
+
+def make_query(class_name="regfile", action_name="read", arguments=None, **attributes):
+    """
+    Returns a query in the interface format with the given attributes. Queries with no
+    action_name are area queries.
+    """
+    query = {"class_name": class_name, "attributes": attributes}
+    if action_name is not None:
+        query.update({"action_name": action_name, "arguments": arguments or {}})
+    return query
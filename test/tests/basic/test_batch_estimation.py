@@ -0,0 +1,132 @@
+import logging
+import unittest
+from unittest import mock
+
+from accelergy.plug_in_interface.estimation_cache import EstimationCache
+from accelergy.plug_in_interface.estimation_pool import (
+    WORKER_STATE,
+    _estimate_batch,
+    _RecordingHandler,
+)
+from accelergy.plug_in_interface.query_plug_ins import (
+    estimate_unique_queries,
+    get_best_estimate,
+    get_best_estimates,
+)
+from plug_in_helpers import FakePlugIn, make_query
+
+
+class BatchTablePlugIn(FakePlugIn):
+    """Estimates energy as the "depth" argument, with a batch estimation method."""
+
+    def __init__(self, name="table", accuracy=90, fail_depths=(), batch_fails=False):
+        super().__init__(name, accuracy, value_key="depth", fail_values=fail_depths)
+        self.batch_fails = batch_fails
+        self.batch_sizes = []
+
+    def estimate_energy_batch(self, queries):
+        self.batch_sizes.append(len(queries))
+        if self.batch_fails:
+            raise RuntimeError("Table could not be loaded")
+        return super().estimate_energy_batch(queries)
+
+
+class TestBatchEstimation(unittest.TestCase):
+    def test_one_call_per_plug_in(self):
+        plug_in = BatchTablePlugIn()
+        queries = [make_query(arguments={"depth": d}) for d in range(1, 1025)]
+        estimations = get_best_estimates([plug_in], queries, True)
+        self.assertEqual([e.value for e in estimations], list(range(1, 1025)))
+        self.assertEqual(plug_in.batch_sizes, [1024])
+
+    def test_default_batch_is_not_used(self):
+        """Plug-ins that do not override the batch methods are called once per query"""
+        plug_in = FakePlugIn("table", 90, value_key="depth")
+        get_best_estimates(
+            [plug_in], [make_query(arguments={"depth": d}) for d in range(1, 5)], True
+        )
+        self.assertEqual(plug_in.n_estimate_calls, 4)
+        self.assertEqual([e.value for e in plug_in.estimate_energy_batch([])], [])
+
+    def test_failed_batch_falls_back_to_single_queries(self):
+        plug_in = BatchTablePlugIn(fail_depths=(2,))
+        fallback = BatchTablePlugIn("fallback", accuracy=50)
+        queries = [make_query(arguments={"depth": d}) for d in range(1, 5)]
+        estimations = get_best_estimates([plug_in, fallback], queries, True)
+        self.assertEqual(
+            [e.estimator_name for e in estimations],
+            ["table", "fallback", "table", "table"],
+        )
+        self.assertEqual(plug_in.batch_sizes, [4])
+        self.assertEqual(fallback.batch_sizes, [])  # A single query is not batched
+        # The batch stops at the failing query, then each query is estimated alone
+        self.assertEqual(plug_in.n_estimate_calls, 2 + 4)
+
+    def test_batch_error_is_isolated(self):
+        plug_in = BatchTablePlugIn(batch_fails=True)
+        estimations = get_best_estimates(
+            [plug_in],
+            [make_query(arguments={"depth": 1}), make_query(arguments={"depth": 2})],
+            True,
+        )
+        self.assertEqual([e.value for e in estimations], [1, 2])
+        self.assertEqual(plug_in.n_estimate_calls, 2)
+
+    def test_same_as_single_queries(self):
+        queries = [make_query(arguments={"depth": d}) for d in [1, 2, 3, 2, 1]]
+        batched_cache, single_cache = EstimationCache(), EstimationCache()
+        plug_ins = [
+            BatchTablePlugIn(fail_depths=(3,)),
+            FakePlugIn("other", 10, value_key="depth"),
+        ]
+        batched = get_best_estimates(plug_ins, queries, True, batched_cache)
+        single = [get_best_estimate(plug_ins, q, True, single_cache) for q in queries]
+        for b, s in zip(batched, single):
+            self.assertEqual(b.estimator_name, s.estimator_name)
+            self.assertEqual(b.value, s.value)
+        self.assertEqual(batched_cache.hits, single_cache.hits)
+        self.assertEqual(len(batched_cache), len(single_cache))
+
+    def test_unique_queries(self):
+        plug_in = BatchTablePlugIn()
+        queries = [make_query(arguments={"depth": d}) for d in [1, 2, 1, 1, 2]]
+        queries[3]["attributes"] = {"width": 8, "func": lambda: 0}
+        estimations = estimate_unique_queries(
+            lambda q: get_best_estimates([plug_in], q, True), queries
+        )
+        self.assertEqual(plug_in.batch_sizes, [3])
+        self.assertEqual([e.value for e in estimations], [1, 2, 1, 1, 2])
+        # Repeated queries get their own estimations
+        estimations[0].value = 100
+        self.assertEqual(estimations[2].value, 1)
+
+    def test_worker_batches_queries(self):
+        """Worker processes send a batch of queries to a plug-in together"""
+        plug_in, handler = BatchTablePlugIn(fail_depths=(3,)), _RecordingHandler()
+        worker_state = {
+            "plug_ins": [plug_in],
+            "estimation_cache": EstimationCache(),
+            "handler": handler,
+        }
+        logging.getLogger("").addHandler(handler)
+        try:
+            with mock.patch.dict(WORKER_STATE, worker_state):
+                results = _estimate_batch(
+                    [make_query(arguments={"depth": d}) for d in [1, 2, 3, 4]], True
+                )
+        finally:
+            logging.getLogger("").removeHandler(handler)
+        self.assertEqual(plug_in.batch_sizes, [4])
+        self.assertEqual([e.value for e, _ in results[:2]], [1, 2])
+        # The batch stops at the query that can not be estimated
+        self.assertEqual(len(results), 3)
+        self.assertIsNone(results[2][0])
+        # Each query has its own log records
+        self.assertIn(
+            "ENERGY ESTIMATION for regfile().read(depth=2)",
+            [m for _, m in results[1][1]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
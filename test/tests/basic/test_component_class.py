@@ -0,0 +1,296 @@
+import unittest
+from unittest import mock
+
+import accelergy.component_class
+from accelergy.action import Action, ArgumentSpace
+from accelergy.arch_dict_2_obj import ArchComp
+from accelergy.component_class import ComponentClass
+from accelergy.compound_component import CompoundComponent
+from accelergy.primitive_component import PrimitiveComponent
+from accelergy.subcomponent import Subcomponent
+
+
+def make_class(attributes):
+    return ComponentClass({"name": "buffer", "attributes": attributes, "actions": []})
+
+
+def make_subcomponent(attributes):
+    return Subcomponent(
+        {
+            "name": "storage",
+            "class": "buffer",
+            "attributes": attributes,
+            "area_scale": None,
+            "energy_scale": None,
+        }
+    )
+
+
+class TestComponentClass(unittest.TestCase):
+    def test_constant_defaults_are_parsed_once(self):
+        component_class = make_class(
+            {"latency": "1e-9", "depth": 128, "n_bits": "width * depth"}
+        )
+        parse = accelergy.component_class.parse_expression_for_arithmetic
+        with mock.patch.object(
+            accelergy.component_class, "parse_expression_for_arithmetic", wraps=parse
+        ) as parse_mock:
+            for width in [8, 16]:
+                attrs = component_class.get_default_attr_to_apply({"width": width})
+                self.assertEqual(
+                    dict(attrs),
+                    {"latency": 1e-9, "depth": 128, "n_bits": "width * depth"},
+                )
+        self.assertEqual(parse_mock.call_count, 1)
+
+    def test_must_specify(self):
+        component_class = make_class({"technology": "must_specify"})
+        with self.assertRaises(AttributeError):
+            component_class.get_default_attr_to_apply({})
+        attrs = component_class.get_default_attr_to_apply({"technology": "45nm"})
+        self.assertEqual(dict(attrs), {"technology": "45nm"})
+
+    def test_subcomponent_defaults(self):
+        """Defaults see the attributes before them, then the compound attributes"""
+        component_class = make_class(
+            {
+                "latency": "1e-9",
+                "depth": 128,
+                "n_bits": "width * depth",
+                "energy": "latency * 2",
+            }
+        )
+        compound = CompoundComponent.__new__(CompoundComponent)
+        subcomponent = make_subcomponent({"width": "data_width * 2", "depth": 64})
+        compound.define_attrs_area_scale_for_subcomponent(
+            subcomponent,
+            {
+                "technology": "45nm",
+                "global_cycle_seconds": 1e-9,
+                "data_width": 8,
+                "latency": 5,
+            },
+            component_class,
+        )
+        attrs = subcomponent.get_attributes()
+        self.assertEqual(attrs["width"], 16)
+        # Defaults come last, in the order of the class
+        self.assertEqual(
+            list(attrs.items())[-4:],
+            [("latency", 1e-9), ("depth", 64), ("n_bits", 1024), ("energy", 2e-9)],
+        )
+
+    def test_compound_expansion_is_reused(self):
+        cc_classes = {
+            "buffer": ComponentClass(
+                {
+                    "name": "buffer",
+                    "attributes": {"width": 16},
+                    "subcomponents": [
+                        {
+                            "name": "storage[0..1]",
+                            "class": "sram",
+                            "attributes": {"width": "width"},
+                            "area_scale": None,
+                            "energy_scale": None,
+                        }
+                    ],
+                    "actions": [
+                        {
+                            "name": "read",
+                            "subcomponents": [
+                                {"name": "storage[0..1]", "actions": [{"name": "read"}]}
+                            ],
+                        }
+                    ],
+                }
+            )
+        }
+        expansions, ccs = {}, []
+        for name, width in [("buf_a", 8), ("buf_b", 8), ("buf_c", 32)]:
+            attributes = {
+                "technology": "45nm",
+                "global_cycle_seconds": 1e-9,
+                "width": width,
+            }
+            arch_component = ArchComp(
+                {"name": name, "class": "buffer", "attributes": attributes}
+            )
+            ccs.append(
+                CompoundComponent(
+                    {
+                        "component": arch_component,
+                        "pc_classes": {},
+                        "cc_classes": cc_classes,
+                        "expansions": expansions,
+                    }
+                )
+            )
+        a, b, c = ccs
+        self.assertEqual(len(expansions), 2)
+        self.assertIs(
+            b.get_subcomponents()["storage[0..1]"],
+            a.get_subcomponents()["storage[0..1]"],
+        )
+        self.assertIsNot(
+            c.get_subcomponents()["storage[0..1]"],
+            a.get_subcomponents()["storage[0..1]"],
+        )
+        self.assertEqual(
+            c.get_subcomponents()["storage[0..1]"].get_attributes()["width"], 32
+        )
+        self.assertEqual(b.get_name(), "buf_b")
+        self.assertIs(b.find_subcomponent_obj("buf_b"), b)
+        a_dict, b_dict = a.get_dict_representation(), b.get_dict_representation()
+        self.assertEqual(b_dict["name"], "buf_b")
+        self.assertEqual(a_dict["actions"], b_dict["actions"])
+        self.assertEqual(a_dict["primitive_components"], b_dict["primitive_components"])
+
+    def test_flattening_leaves_class_unchanged(self):
+        component_class = ComponentClass(
+            {
+                "name": "buffer",
+                "attributes": {"width": 16, "n_banks": 2},
+                "subcomponents": [
+                    {
+                        "name": "storage[0..n_banks-1]",
+                        "class": "sram",
+                        "attributes": {"width": "width", "depth": 64},
+                        "area_scale": None,
+                        "energy_scale": None,
+                    }
+                ],
+                "actions": [
+                    {
+                        "name": "read",
+                        "arguments": {"n_words": "1..n_banks"},
+                        "subcomponents": [
+                            {
+                                "name": "storage[0..n_banks-1]",
+                                "actions": [
+                                    {
+                                        "name": "read",
+                                        "arguments": {"n_bits": "n_words * width"},
+                                        "energy_scale": "n_words",
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            }
+        )
+        arch_component = ArchComp(
+            {
+                "name": "buf",
+                "class": "buffer",
+                "attributes": {
+                    "technology": "45nm",
+                    "global_cycle_seconds": 1e-9,
+                    "width": 8,
+                    "n_banks": 2,
+                },
+            }
+        )
+        compound = CompoundComponent(
+            {
+                "component": arch_component,
+                "pc_classes": {},
+                "cc_classes": {"buffer": component_class},
+            }
+        )
+        primitive_actions = [
+            (name, action.get_arguments()["n_bits"], action.get_energy_scale())
+            for top_action in compound.get_actions()
+            for name, action in top_action.get_primitive_list()
+        ]
+        self.assertEqual(
+            primitive_actions,
+            [
+                ("storage[0..1]", 8, 1),
+                ("storage[0..1]", 16, 2),
+            ],
+        )
+        self.assertEqual(
+            compound.get_subcomponents()["storage[0..1]"].get_attributes()["width"], 8
+        )
+        subcomponent = component_class.get_subcomponents_as_dict()[
+            "storage[0..n_banks-1]"
+        ]
+        self.assertEqual(subcomponent.get_name(), "storage[0..n_banks-1]")
+        self.assertEqual(subcomponent.get_attributes(), {"width": "width", "depth": 64})
+        action = component_class.get_action("read")
+        self.assertEqual(action.get_arguments(), {"n_words": "1..n_banks"})
+        subaction = action.get_subactions("storage[0..n_banks-1]")[0]
+        self.assertEqual(subaction.get_arguments(), {"n_bits": "n_words * width"})
+        self.assertEqual(subaction.get_energy_scale(), "n_words")
+        self.assertIsNone(subaction.get_primitive_list())
+
+    def test_argument_space(self):
+        space = ArgumentSpace({"a": range(0, 3), "b": range(1, 3)})
+        combinations = [
+            {"a": 0, "b": 1},
+            {"a": 1, "b": 1},
+            {"a": 2, "b": 1},
+            {"a": 0, "b": 2},
+            {"a": 1, "b": 2},
+            {"a": 2, "b": 2},
+        ]
+        self.assertEqual(len(space), 6)
+        self.assertEqual(list(space), combinations)
+        self.assertEqual([space[i] for i in range(-6, 6)], combinations * 2)
+        with self.assertRaises(IndexError):
+            space[6]
+        self.assertEqual(space.axes, {"a": range(0, 3), "b": range(1, 3)})
+        self.assertEqual(list(ArgumentSpace({})), [{}])
+
+    def test_action_argument_space(self):
+        action = Action(
+            {"name": "read", "arguments": {"n_words": "1..n_banks", "address": "0..3"}}
+        )
+        space = action.get_argument_space({"n_banks": 1024})
+        self.assertEqual(len(space), 4096)
+        self.assertEqual(space[-1], {"n_words": 1024, "address": 3})
+        self.assertEqual(
+            [
+                a.get_arguments()
+                for a in action.flatten_action_args_into_list({"n_banks": 2})
+            ],
+            list(action.get_argument_space({"n_banks": 2})),
+        )
+
+    def test_primitive_component_actions(self):
+        component_class = ComponentClass(
+            {
+                "name": "sram",
+                "attributes": {"depth": 1024},
+                "actions": [
+                    {
+                        "name": "read",
+                        "arguments": {
+                            "address_delta": "0..depth-1",
+                            "data_delta": "0..1",
+                        },
+                    },
+                    {"name": "idle"},
+                ],
+            }
+        )
+        arch_component = ArchComp(
+            {"name": "sram", "class": "sram", "attributes": {"depth": 1024}}
+        )
+        pc = PrimitiveComponent(
+            {"component": arch_component, "pc_class": component_class}
+        )
+        (read, read_space), (idle, idle_space) = pc.get_argument_spaces()
+        self.assertEqual(read_space.axes["address_delta"], range(1024))
+        self.assertEqual(len(read_space), 2048)
+        self.assertEqual(len(idle_space), 1)
+        actions = pc.get_actions()
+        first = next(actions)
+        self.assertEqual(first.get_arguments(), {"address_delta": 0, "data_delta": 0})
+        self.assertEqual(sum(1 for _ in actions), 2048)
+
+
+if __name__ == "__main__":
+    unittest.main()
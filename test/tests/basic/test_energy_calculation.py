@@ -3,7 +3,7 @@ import pkg_resources
 
 from accelergy.raw_inputs_2_dicts import RawInputs2Dicts
 from accelergy.ERT_generator import ERT_dict_to_obj
-from accelergy.action_counts_dict_2_obj import action_counts_dict_2_obj
+from accelergy.action_counts_dict_2_obj import action_counts_dict_2_obj, ActionCountEntry
 from accelergy.energy_calculator import EnergyCalculator
 
 
@@ -113,6 +113,25 @@ class TestEnergyCalculation(unittest.TestCase):
         self.assertEqual(float(mac_energy), float(250))
         self.assertEqual(float(scrachpad_energy), float(1150*3 + 24*7))
 
+    def test_actionEnergyLookup(self):
+        """ action energies are looked up by all or some of their arguments """
+        ERT_obj = ERT_dict_to_obj(
+            {'ERT_dict': self.desired_ERT_dict, 'parser_version': self.version, 'precision': 3})
+        ERT_entry_obj = ERT_obj.get_ERT_entry('design.scratchpad[0..2]')
+        lookups = [({'name': 'read', 'arguments': {'address_delta': 1, 'data_delta': 0}}, 6),
+                   ({'name': 'read', 'arguments': {'data_delta': 1.0, 'address_delta': 1}}, 8),
+                   ({'name': 'read', 'arguments': {'data_delta': 1}}, 7),
+                   ({'name': 'fill', 'arguments': {}}, 3),
+                   ({'name': 'leak'}, 0)]
+        for _ in range(2):
+            for action_info_dict, energy in lookups:
+                action_info_dict['counts'] = 1
+                self.assertEqual(ERT_entry_obj.get_action_energy(ActionCountEntry(action_info_dict)), energy)
+
+        missing = ActionCountEntry({'name': 'read', 'arguments': {'address_delta': 2}, 'counts': 1})
+        with self.assertRaises(AssertionError):
+            ERT_entry_obj.get_action_energy(missing)
+
     def test_wrongActionCounts(self):
         """ test if wrong component name in action count will result in error"""
 
@@ -0,0 +1,137 @@
+import tempfile
+import unittest
+
+import ruamel.yaml
+
+from accelergy.plug_in_interface.interface import AccelergyQuery, Estimation
+from accelergy.plug_in_interface.estimation_cache import (
+    EstimationCache,
+    PersistentEstimationCache,
+)
+from accelergy.plug_in_interface.query_plug_ins import get_best_estimate
+from plug_in_helpers import FakePlugIn, make_query
+
+
+class TestEstimationCache(unittest.TestCase):
+    def test_canonical_key(self):
+        """Attribute order and ruamel string types do not change the key"""
+        q1 = AccelergyQuery("regfile", {"width": 8, "technology": "45nm"})
+        q2 = AccelergyQuery(
+            "regfile",
+            {
+                "technology": ruamel.yaml.scalarstring.DoubleQuotedScalarString("45nm"),
+                "width": 8,
+            },
+        )
+        q3 = AccelergyQuery("regfile", {"width": 8.0, "technology": "45nm"})
+        self.assertEqual(q1.to_hashable(), q2.to_hashable())
+        self.assertNotEqual(q1.to_hashable(), q3.to_hashable())
+        self.assertNotEqual(
+            EstimationCache.get_key(q1, True), EstimationCache.get_key(q1, False)
+        )
+
+    def test_hits_and_misses(self):
+        """Identical queries are answered from the cache"""
+        plug_in = FakePlugIn()
+        cache = EstimationCache()
+        for _ in range(3):
+            e = get_best_estimate([plug_in], make_query(width=8), True, cache)
+            self.assertEqual(e.value, 8)
+            self.assertEqual(e.estimator_name, "fake")
+        get_best_estimate([plug_in], make_query(width=16), True, cache)
+        self.assertEqual(plug_in.n_estimate_calls, 2)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 2)
+
+    def test_energy_and_area_are_separate(self):
+        plug_in = FakePlugIn()
+        cache = EstimationCache()
+        query = make_query(width=8)
+        area_query = {"class_name": "regfile", "attributes": query["attributes"]}
+        get_best_estimate([plug_in], query, True, cache)
+        get_best_estimate([plug_in], area_query, False, cache)
+        self.assertEqual(plug_in.n_estimate_calls, 2)
+        self.assertEqual(cache.hits, 0)
+
+    def test_returned_estimations_are_clones(self):
+        """Mutating a returned estimation does not corrupt the cached entry"""
+        plug_in = FakePlugIn()
+        cache = EstimationCache()
+        e = get_best_estimate([plug_in], make_query(width=8), True, cache)
+        e.value *= 10
+        e.add_messages("Scaled by 10")
+        e2 = get_best_estimate([plug_in], make_query(width=8), True, cache)
+        self.assertEqual(e2.value, 8)
+        self.assertNotIn("Scaled by 10", e2.messages)
+
+    def test_unhashable_queries_are_not_cached(self):
+        plug_in = FakePlugIn()
+        cache = EstimationCache()
+        for _ in range(2):
+            get_best_estimate([plug_in], make_query(width=8, table={1, 2}), True, cache)
+        self.assertEqual(plug_in.n_estimate_calls, 2)
+        self.assertEqual(len(cache), 0)
+
+
+class TestPersistentEstimationCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_shared_across_runs(self):
+        """A second run is answered from disk without calling the plug-in"""
+        for n_run in range(2):
+            plug_in = FakePlugIn()
+            cache = EstimationCache(PersistentEstimationCache(self.cache_dir.name))
+            e = get_best_estimate([plug_in], make_query(width=8), True, cache)
+            cache.persistent.close()
+            self.assertEqual(e.get_value(), 8e-12)
+            self.assertEqual(e.estimator_name, "fake")
+            self.assertEqual(plug_in.n_estimate_calls, 1 - n_run)
+
+    def test_stale_fingerprint_is_a_miss(self):
+        cache = PersistentEstimationCache(self.cache_dir.name)
+        query = AccelergyQuery("regfile", {"width": 8})
+        key = cache.get_key("fake", query, True)
+        cache.put(key, "a", Estimation(1, "p"))
+        self.assertEqual(cache.get(key, "a").value, 1)
+        self.assertIsNone(cache.get(key, "b"))
+        self.assertIsNone(cache.get(None, "a"))
+        cache.close()
+
+    def test_unpersistable_queries_have_no_key(self):
+        cache = PersistentEstimationCache(self.cache_dir.name)
+        query = AccelergyQuery("regfile", {"width": 8, "func": lambda: 0})
+        self.assertIsNone(cache.get_key("fake", query, True))
+        cache.close()
+
+    def test_lru_eviction(self):
+        cache = PersistentEstimationCache(self.cache_dir.name, max_entries=2)
+        keys = [
+            cache.get_key("p", AccelergyQuery("regfile", {"width": w}), True)
+            for w in range(3)
+        ]
+        for k in keys:
+            cache.put(k, "f", Estimation(1))
+        cache.get(keys[0], "f")  # Most recently used
+        cache.close()
+        cache = PersistentEstimationCache(self.cache_dir.name)
+        self.assertIsNotNone(cache.get(keys[0], "f"))
+        self.assertIsNone(cache.get(keys[1], "f"))
+        self.assertIsNotNone(cache.get(keys[2], "f"))
+        cache.close()
+
+    def test_concurrent_writers(self):
+        caches = [PersistentEstimationCache(self.cache_dir.name) for _ in range(4)]
+        for i, cache in enumerate(caches):
+            key = cache.get_key("p", AccelergyQuery("regfile", {"width": 8}), True)
+            cache.put(key, "f", Estimation(i))
+        for cache in caches:
+            self.assertEqual(cache.get(key, "f").value, 3)
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
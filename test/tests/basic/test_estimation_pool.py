@@ -0,0 +1,142 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+import unittest
+
+import ruamel.yaml
+
+from accelergy.plug_in_interface.estimation_cache import (
+    CACHE_FILE_NAME,
+    EstimationCache,
+)
+from accelergy.plug_in_interface.estimation_pool import (
+    EstimationProcessPool,
+    to_payload,
+)
+from accelergy.plug_in_interface.query_plug_ins import get_best_estimate
+from accelergy.plug_in_path_to_obj import plug_in_path_to_obj
+from accelergy.system_state import SystemState
+from plug_in_helpers import make_query
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+ESTIMATOR_PATHS = [
+    os.path.join(TEST_DIR, "..", "..", "..", "share", "estimation_plug_ins")
+]
+PYTHON_PATHS = [os.path.join(TEST_DIR, "..", "plugin_choices", "plugins", "plugins.py")]
+
+
+ATTRIBUTES = {"technology": "45nm", "global_cycle_seconds": 1e-9}
+
+
+class TestEstimationPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        system_state = SystemState()
+        system_state.add_plug_ins(
+            plug_in_path_to_obj(list(ESTIMATOR_PATHS), list(PYTHON_PATHS))
+        )
+        cls.plug_ins = system_state.plug_in_index
+        cls.pool = EstimationProcessPool(2, ESTIMATOR_PATHS, PYTHON_PATHS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_payload(self):
+        """Payloads are made of built-in types and can be pickled"""
+        query = make_query(
+            "component",
+            "action_a",
+            **ATTRIBUTES,
+            name=ruamel.yaml.scalarstring.DoubleQuotedScalarString("x"),
+            sizes=(1, [2, 3]),
+        )
+        payload = to_payload(query)
+        self.assertEqual(payload, query)
+        self.assertIs(type(payload["attributes"]["name"]), str)
+        self.assertEqual(pickle.loads(pickle.dumps(payload)), payload)
+        with self.assertRaises(TypeError):
+            to_payload(
+                make_query("component", "action_a", **ATTRIBUTES, func=lambda: 0)
+            )
+
+    def test_same_as_serial(self):
+        queries = [
+            (make_query("component", "action_a", **ATTRIBUTES), True),
+            (make_query("component", "action_b", **ATTRIBUTES), True),
+            (
+                make_query(
+                    "component", "leak", {"global_cycle_seconds": 1e-9}, **ATTRIBUTES
+                ),
+                True,
+            ),
+            (make_query("component", None, **ATTRIBUTES), False),
+        ]
+        for query, is_energy in queries:
+            (pooled,) = self.pool.get_best_estimates(self.plug_ins, [query], is_energy)
+            serial = get_best_estimate(self.plug_ins, query, is_energy)
+            self.assertEqual(pooled.estimator_name, serial.estimator_name)
+            self.assertEqual(pooled.get_value(), serial.get_value())
+
+    def test_results_in_order(self):
+        queries = [
+            make_query("component", "action_a", **ATTRIBUTES, width=w)
+            for w in range(20)
+        ]
+        queries.insert(
+            5, make_query("component", "action_a", **ATTRIBUTES, func=lambda: 0)
+        )
+        estimations = self.pool.get_best_estimates(self.plug_ins, queries, True)
+        self.assertEqual(len(estimations), len(queries))
+        self.assertTrue(all(e.success for e in estimations))
+
+    def test_parent_cache(self):
+        """Worker estimations are cached in the parent, and cached queries stay there"""
+        cache = EstimationCache()
+        queries = [
+            make_query("component", "action_a", **ATTRIBUTES, width=w) for w in range(4)
+        ]
+        first = self.pool.get_best_estimates(self.plug_ins, queries, True, cache)
+        self.assertEqual(len(cache), 4)
+        self.assertEqual(cache.hits, 0)
+        second = self.pool.get_best_estimates(self.plug_ins, queries, True, cache)
+        self.assertEqual(cache.hits, 4)
+        self.assertEqual(
+            [e.get_value() for e in first], [e.get_value() for e in second]
+        )
+
+    def test_worker_closes_persistent_cache(self):
+        """Workers record the persistent cache entries they used when they exit"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for _ in range(2):
+                pool = EstimationProcessPool(
+                    1, ESTIMATOR_PATHS, PYTHON_PATHS, persistent_cache_dir=cache_dir
+                )
+                pool.get_best_estimates(
+                    self.plug_ins,
+                    [make_query("component", "action_a", **ATTRIBUTES)],
+                    True,
+                )
+                pool.close()
+                connection = sqlite3.connect(os.path.join(cache_dir, CACHE_FILE_NAME))
+                with connection:
+                    (last_used,) = connection.execute(
+                        "SELECT last_used FROM estimations"
+                    ).fetchone()
+                    connection.execute("UPDATE estimations SET last_used = 0")
+                connection.close()
+            # The second worker only hit the entry
+            self.assertGreater(last_used, 0)
+
+    def test_worker_errors_exit(self):
+        with self.assertRaises(SystemExit):
+            self.pool.get_best_estimates(
+                self.plug_ins,
+                [make_query("component", "action_a", **ATTRIBUTES, plug_in="missing")],
+                True,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
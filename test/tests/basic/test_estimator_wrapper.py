@@ -0,0 +1,213 @@
+import logging
+import time
+import unittest
+
+from accelergy.plug_in_interface.estimator import Estimator, actionDynamicEnergy
+from accelergy.plug_in_interface.estimator_wrapper import (
+    CallableFunction,
+    EstimatorWrapper,
+)
+import accelergy.plug_in_interface.estimator_wrapper as estimator_wrapper
+from accelergy.plug_in_interface.interface import AccelergyQuery
+from accelergy.plug_in_interface.query_plug_ins import get_best_estimate
+from accelergy.utils.parallel import parallel_map
+from plug_in_helpers import make_query
+
+
+class CountingSRAM(Estimator):
+    name = "counting_sram"
+    percent_accuracy_0_to_100 = 90
+    n_init = 0
+
+    def __init__(self, width: int, depth: int = 32):
+        super().__init__()
+        type(self).n_init += 1
+        self.width = width
+        self.depth = depth
+        self.n_reads = 0
+
+    @actionDynamicEnergy
+    def read(self, bits: int = 1) -> float:
+        self.n_reads += 1
+        return self.width * self.depth * bits * self.n_reads
+
+    @actionDynamicEnergy
+    def write(self) -> float:
+        return self.width * self.depth * 2
+
+    def get_area(self) -> float:
+        return self.width * self.depth
+
+    def leak(self, global_cycle_seconds: float) -> float:
+        return 0
+
+
+class LoggingSRAM(CountingSRAM):
+    name = "logging_sram"
+
+    @actionDynamicEnergy
+    def read(self, bits: int = 1) -> float:
+        self.logger.info(f"Reading {bits} bits")
+        # Later reads finish first
+        time.sleep(0.01 * (10 - bits))
+        return self.width * bits
+
+
+class StatefulSRAM(CountingSRAM):
+    name = "stateful_sram"
+    reuse_instances = False
+    n_init = 0
+
+
+class TestEstimatorWrapper(unittest.TestCase):
+    def test_one_init_per_attributes(self):
+        CountingSRAM.n_init = 0
+        wrapper = EstimatorWrapper(CountingSRAM, "CountingSRAM")
+        for width in [8, 16]:
+            wrapper.estimate_energy(
+                AccelergyQuery.from_interface_dict(
+                    make_query("counting_sram", "read", {"bits": 4}, width=width)
+                )
+            )
+            wrapper.estimate_energy(
+                AccelergyQuery.from_interface_dict(
+                    make_query("counting_sram", "read", {"bits": 2}, width=width)
+                )
+            )
+            wrapper.estimate_energy(
+                AccelergyQuery.from_interface_dict(
+                    make_query("counting_sram", "write", width=width)
+                )
+            )
+            wrapper.estimate_area(
+                AccelergyQuery.from_interface_dict(
+                    make_query("counting_sram", None, width=width)
+                )
+            )
+        self.assertEqual(CountingSRAM.n_init, 2)
+
+    def test_unused_attributes_share_instances(self):
+        """Attributes that are not arguments of __init__ do not affect reuse"""
+        CountingSRAM.n_init = 0
+        wrapper = EstimatorWrapper(CountingSRAM, "CountingSRAM")
+        query = AccelergyQuery.from_interface_dict(
+            make_query("counting_sram", None, width=8, technology="45nm")
+        )
+        wrapper.estimate_area(query)
+        query.class_attrs["technology"] = "7nm"
+        wrapper.estimate_area(query)
+        self.assertEqual(CountingSRAM.n_init, 1)
+
+    def test_opt_out(self):
+        StatefulSRAM.n_init = 0
+        wrapper = EstimatorWrapper(StatefulSRAM, "StatefulSRAM")
+        reads = [
+            wrapper.estimate_energy(
+                AccelergyQuery.from_interface_dict(
+                    make_query("counting_sram", "read", width=8)
+                )
+            )
+            for _ in range(3)
+        ]
+        self.assertEqual(StatefulSRAM.n_init, 3)
+        self.assertEqual([r.value for r in reads], [256, 256, 256])
+
+    def test_pool_is_bounded(self):
+        CountingSRAM.n_init = 0
+        wrapper = EstimatorWrapper(CountingSRAM, "CountingSRAM")
+        size = estimator_wrapper.INITIALIZED_ESTIMATOR_POOL_SIZE
+        for width in range(size + 1):
+            wrapper.estimate_area(
+                AccelergyQuery.from_interface_dict(
+                    make_query("counting_sram", None, width=width)
+                )
+            )
+        self.assertEqual(len(wrapper.initialized_estimators), size)
+        # The least recently used estimator was discarded
+        wrapper.estimate_area(
+            AccelergyQuery.from_interface_dict(
+                make_query("counting_sram", None, width=size)
+            )
+        )
+        wrapper.estimate_area(
+            AccelergyQuery.from_interface_dict(
+                make_query("counting_sram", None, width=0)
+            )
+        )
+        self.assertEqual(CountingSRAM.n_init, size + 2)
+
+    def test_messages_of_shared_instances(self):
+        """Threads reading with one instance each get the messages of their own read"""
+        wrapper = EstimatorWrapper(LoggingSRAM, "LoggingSRAM")
+
+        def read(bits):
+            query = make_query("logging_sram", "read", {"bits": bits}, width=8)
+            return get_best_estimate([wrapper], query, True)
+
+        for jobs in [1, 8]:
+            estimations = parallel_map(read, range(1, 9), jobs)
+            self.assertEqual(
+                [
+                    [m for m in e.messages if m.startswith("Reading")]
+                    for e in estimations
+                ],
+                [[f"Reading {bits} bits"] for bits in range(1, 9)],
+            )
+        self.assertEqual(len(wrapper.initialized_estimators), 1)
+
+    def test_unhashable_attributes(self):
+        CountingSRAM.n_init = 0
+        wrapper = EstimatorWrapper(CountingSRAM, "CountingSRAM")
+        for _ in range(2):
+            wrapper.estimate_area(
+                AccelergyQuery.from_interface_dict(
+                    make_query("counting_sram", None, width=Unhashable(8))
+                )
+            )
+        self.assertEqual(CountingSRAM.n_init, 2)
+
+    def test_call_plan_per_argument_names(self):
+        wrapper = EstimatorWrapper(CountingSRAM, "CountingSRAM")
+        init = wrapper.init_function
+        plan = init.get_call_plan({"width": 8, "technology": "45nm"}, "sram")
+        self.assertIs(init.get_call_plan({"width": 1, "technology": 0}, "sram"), plan)
+        self.assertEqual(plan.used_keys, ("width",))
+        self.assertEqual(
+            plan.unused_warning,
+            "Unused arguments (technology) provided for sram.__init__. "
+            "Arguments used: (width)",
+        )
+        self.assertIsNone(init.get_call_plan({"width": 8}, "sram").unused_warning)
+
+    def test_call_errors(self):
+        def func(self, a, b, c=1):
+            return a + b + c
+
+        function = CallableFunction(func, logging.getLogger(__name__))
+        self.assertIsNone(function.get_call_error_message("func", {"a": 1, "b": 2}))
+        self.assertEqual(function.call({"a": 1, "b": 2, "c": 3}, "", self), 6)
+        for kwargs, missing in [
+            ({"a": 1}, "b"),
+            ({"b": 1}, "a"),
+            ({"a": None, "b": 1}, "a"),
+            ({"b": None}, "a"),
+        ]:
+            self.assertIn(
+                f"is missing: {missing}.",
+                function.get_call_error_message("func", kwargs),
+            )
+        self.assertIn("does not match", function.get_call_error_message("f", {}))
+
+
+class Unhashable:
+    __hash__ = None
+
+    def __init__(self, value):
+        self.value = value
+
+    def __mul__(self, other):
+        return self.value * other
+
+
+if __name__ == "__main__":
+    unittest.main()
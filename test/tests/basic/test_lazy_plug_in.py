@@ -0,0 +1,142 @@
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+from accelergy.plug_in_interface.lazy_plug_in import LazyPlugIn
+from accelergy.plug_in_interface.query_plug_ins import get_best_estimate
+from accelergy.plug_in_path_to_obj import plug_in_path_to_obj
+from accelergy.system_state import SystemState
+from plug_in_helpers import FakePlugIn, make_query
+
+ESTIMATOR_YAML = """
+version: 0.4
+sram_table:
+  module: sram_table
+  class: SRAMTable
+  class_names: [SRAM]
+python_plug_ins:
+  - path: adder.py
+    class_names: [adder]
+"""
+
+SRAM_TABLE = """
+from accelergy.plug_in_interface.interface import *
+
+
+class SRAMTable(AccelergyPlugIn):
+    def __init__(self):
+        pass
+
+    def primitive_action_supported(self, query):
+        return AccuracyEstimation(90 if query.class_name == "SRAM" else 0)
+
+    def estimate_energy(self, query):
+        return Estimation(2, "p")
+
+    def primitive_area_supported(self, query):
+        return AccuracyEstimation(90 if query.class_name == "SRAM" else 0)
+
+    def estimate_area(self, query):
+        return Estimation(3, "u^2")
+
+    def get_name(self):
+        return "sram_table"
+"""
+
+ADDER = """
+from accelergy.plug_in_interface.estimator import Estimator, actionDynamicEnergy
+
+
+class Adder(Estimator):
+    name = "adder"
+    percent_accuracy_0_to_100 = 80
+
+    def __init__(self, width: int):
+        super().__init__()
+        self.width = width
+
+    @actionDynamicEnergy
+    def add(self):
+        return self.width * 1e-12
+
+    def get_area(self):
+        return self.width * 1e-12
+
+    def leak(self, global_cycle_seconds):
+        return 0
+"""
+
+
+class TestLazyPlugIn(unittest.TestCase):
+    def setUp(self):
+        self.plug_in_dir = tempfile.mkdtemp()
+        for name, contents in [
+            ("lazy.estimator.yaml", ESTIMATOR_YAML),
+            ("sram_table.py", SRAM_TABLE),
+            ("adder.py", ADDER),
+        ]:
+            with open(os.path.join(self.plug_in_dir, name), "w") as f:
+                f.write(textwrap.dedent(contents))
+        system_state = SystemState()
+        system_state.add_plug_ins(plug_in_path_to_obj([self.plug_in_dir], []))
+        self.plug_ins = system_state.plug_ins
+        self.index = system_state.plug_in_index
+
+    def tearDown(self):
+        shutil.rmtree(self.plug_in_dir)
+
+    def test_loaded_when_routed(self):
+        self.assertEqual(len(self.plug_ins), 2)
+        self.assertTrue(all(isinstance(p, LazyPlugIn) for p in self.plug_ins))
+        sram, adder = self.plug_ins
+        self.assertFalse(sram.loaded or adder.loaded)
+
+        e = get_best_estimate(self.index, make_query("SRAM", "read", width=8), True)
+        self.assertEqual(e.estimator_name, "sram_table")
+        self.assertEqual(e.get_value(), 2e-12)
+        self.assertTrue(sram.loaded)
+        self.assertFalse(adder.loaded)
+
+        e = get_best_estimate(self.index, make_query("adder", "add", width=8), True)
+        self.assertEqual(e.estimator_name, "Adder")
+        self.assertEqual(e.get_value(), 8e-12)
+        self.assertTrue(adder.loaded)
+
+    def test_undeclared_classes_do_not_load(self):
+        with self.assertRaises(SystemExit):
+            get_best_estimate(self.index, make_query("regfile", "read", width=8), True)
+        self.assertFalse(any(p.loaded for p in self.plug_ins))
+
+    def test_loaded_estimators_are_filtered(self):
+        """Loaded estimators are only candidates for the actions they support"""
+        with self.assertRaises(SystemExit):
+            get_best_estimate(
+                self.index, make_query("adder", "multiply", width=8), True
+            )
+        self.assertTrue(self.plug_ins[1].loaded)
+
+    def test_plain_list(self):
+        """Placeholders in a list of plug-ins are loaded like placeholders in an index"""
+        e = get_best_estimate(self.plug_ins, make_query("SRAM", "read", width=8), True)
+        self.assertEqual(e.estimator_name, "sram_table")
+        self.assertTrue(self.plug_ins[0].loaded)
+        self.assertFalse(self.plug_ins[1].loaded)
+
+    def test_loaded_duplicate_names(self):
+        """Loaded plug-ins are dropped if a plug-in with the same name was added"""
+        system_state = SystemState()
+        system_state.add_plug_ins(
+            [FakePlugIn("sram_table", accuracy=10)]
+            + plug_in_path_to_obj([self.plug_in_dir], [])
+        )
+        e = get_best_estimate(
+            system_state.plug_in_index, make_query("SRAM", "read", width=8), True
+        )
+        self.assertEqual(e.get_value(), 8e-12)
+        self.assertEqual(system_state.plug_ins[1].plug_ins, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import threading
+import time
+import unittest
+
+from accelergy.ART_generator import AreaReferenceTableGenerator
+from accelergy.plug_in_interface.query_plug_ins import get_best_estimate
+from accelergy.utils.parallel import parallel_map
+from plug_in_helpers import FakePlugIn, make_query
+
+
+class SlowPlugIn(FakePlugIn):
+    def __init__(self, thread_safe=True):
+        super().__init__("slow", thread_safe=thread_safe)
+        self.n_running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def estimate_area(self, query):
+        with self.lock:
+            self.n_running += 1
+            self.max_running = max(self.max_running, self.n_running)
+        self.logger.info(f"Estimating width {query.class_attrs['width']}")
+        # Later components finish first
+        time.sleep(0.01 * (10 - query.class_attrs["width"]))
+        with self.lock:
+            self.n_running -= 1
+        return super().estimate_area(query)
+
+
+class FakeComponent:
+    def __init__(self, width):
+        self.width = width
+
+    def get_name(self):
+        return f"component{self.width}"
+
+    def get_class_name(self):
+        return "regfile"
+
+    def get_attributes(self):
+        return {"width": self.width}
+
+    def get_area_scale(self):
+        return 1
+
+
+class TestParallel(unittest.TestCase):
+    def test_results_in_order(self):
+        def func(x):
+            time.sleep(0.01 * (5 - x))
+            return x * 2
+
+        self.assertEqual(parallel_map(func, range(5), 4), [0, 2, 4, 6, 8])
+        self.assertEqual(parallel_map(func, range(5), 1), [0, 2, 4, 6, 8])
+
+    def test_first_error_in_order_is_raised(self):
+        def func(x):
+            time.sleep(0.01 * (5 - x))
+            if x in (1, 3):
+                raise ValueError(x)
+            return x
+
+        with self.assertRaisesRegex(ValueError, "1"):
+            parallel_map(func, range(5), 4)
+
+    def test_deterministic_ART(self):
+        """Parallel and serial ART generation add entries in the same order"""
+        components = {f"component{w}": FakeComponent(w) for w in range(10)}
+        arts = []
+        for jobs in [1, 8]:
+            info = {
+                "pcs": components,
+                "ccs": {},
+                "precision": 3,
+                "plug_ins": [SlowPlugIn()],
+                "parser_version": 0.4,
+                "jobs": jobs,
+            }
+            arts.append(AreaReferenceTableGenerator(info).get_ART().get_ART())
+        self.assertEqual(arts[0], arts[1])
+        self.assertEqual(
+            [e["name"] for e in arts[1]["ART"]["tables"]], list(components)
+        )
+
+    def test_thread_safe_opt_out(self):
+        for thread_safe in [True, False]:
+            plug_in = SlowPlugIn(thread_safe=thread_safe)
+            parallel_map(
+                lambda w: get_best_estimate(
+                    [plug_in], make_query(action_name=None, width=w), False
+                ),
+                range(8),
+                8,
+            )
+            if thread_safe:
+                self.assertGreater(plug_in.max_running, 1)
+            else:
+                self.assertEqual(plug_in.max_running, 1)
+
+    def test_messages_per_call(self):
+        """Each estimation has the messages logged by its own plug-in call"""
+        plug_in = SlowPlugIn()
+        for jobs in [1, 8]:
+            estimations = parallel_map(
+                lambda w: get_best_estimate(
+                    [plug_in], make_query(action_name=None, width=w), False
+                ),
+                range(8),
+                jobs,
+            )
+            self.assertEqual(
+                [e.messages for e in estimations],
+                [
+                    [f"Estimating width {w}", "Multiplying by n_instances 1"]
+                    for w in range(8)
+                ],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,24 @@
+import os
+import tempfile
 import unittest
+import accelergy.parsing_utils
+import accelergy.version
 from accelergy.parsing_utils import *
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 class TestParsingUtils(unittest.TestCase):
+    def setUp(self):
+        # Other tests may leave the version of an older input file set
+        self.input_version = accelergy.version.INPUT_VERSION
+        accelergy.version.INPUT_VERSION = 0.4
+
+    def tearDown(self):
+        accelergy.version.INPUT_VERSION = self.input_version
+
     def test_InterpretCopmonentList_plain_name(self):
         """ If plain name can be correctly detected """
         name = 'design.mac'
@@ -55,6 +72,108 @@ class TestParsingUtils(unittest.TestCase):
         name = 'design.PE[0].buffer[0].mux'
         self.assertEqual(get_ranges_or_indices_in_name(name),[0,0])
 
+    def test_ComponentName(self):
+        """ Test that names are parsed once into their base name, ranges, and multiplicity """
+        name = ComponentName.get('design.PE[0..2].buffer[1].mux[4..7]')
+        self.assertIs(ComponentName.get('design.PE[0..2].buffer[1].mux[4..7]'), name)
+        self.assertEqual(name.base_name, 'design.PE.buffer.mux')
+        self.assertEqual(name.ranges, ((0, 2), 1, (4, 7)))
+        self.assertEqual(name.n_identical, 12)
+        self.assertEqual(ComponentName.get('design.mac').base_name, 'design.mac')
+        self.assertEqual(ComponentName.get('design.mac').n_identical, 1)
+        for unbalanced in ['design.PE[0..2', 'design.PE]0..2[', 'design.PE[0[1]]']:
+            with self.assertRaisesRegex(ValueError, 'bracket that is not closed'):
+                remove_brackets(unbalanced)
+
+    def test_CompNameWithinRange(self):
+        """ Test that names are checked against the ranges of a reference name """
+        self.assertTrue(comp_name_within_range('PE[3].buf[0..1]', 'PE[0..15].buf[0..3]'))
+        self.assertFalse(comp_name_within_range('PE[3].buf[2..4]', 'PE[0..15].buf[0..3]'))
+        self.assertFalse(comp_name_within_range('PE[16].buf[0]', 'PE[0..15].buf[0..3]'))
+
+    def test_ParseExpression_compiles_once(self):
+        """ Test that expressions are compiled once and evaluated with new bindings """
+        expression = 'depth * width + 0'
+        self.assertEqual(parse_expression_for_arithmetic(
+            expression, {'depth': 2, 'width': 3}, 'test'), 6)
+        code = COMPILED_EXPRESSIONS[expression]
+        self.assertEqual(parse_expression_for_arithmetic(
+            expression, {'depth': 4, 'width': 3}, 'test'), 12)
+        self.assertIs(COMPILED_EXPRESSIONS[expression], code)
+        self.assertEqual(parse_expression_for_arithmetic(
+            ' \tlog2(depth)', {'depth': 4}, 'test'), 2)
+        with self.assertRaises(ArithmeticError):
+            parse_expression_for_arithmetic(
+                'depth *', {'depth': 4}, 'test', strings_allowed=False)
+
+    def test_ParseExpression_loaded_functions(self):
+        """ Test that functions loaded from ACCELERGY_MATH_FUNCTIONS can be used """
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'funcs.py')
+            with open(path, 'w') as f:
+                f.write('def triple_for_test(x):\n    return 3 * x\n')
+            env = os.environ.get('ACCELERGY_MATH_FUNCTIONS')
+            os.environ['ACCELERGY_MATH_FUNCTIONS'] = path
+            try:
+                self.assertEqual(parse_expression_for_arithmetic(
+                    'triple_for_test(x)', {'x': 2}, 'test'), 6)
+            finally:
+                if env is None:
+                    del os.environ['ACCELERGY_MATH_FUNCTIONS']
+                else:
+                    os.environ['ACCELERGY_MATH_FUNCTIONS'] = env
+        self.assertIn('triple_for_test', accelergy.parsing_utils.FUNCTION_BINDINGS)
+
+    def test_ParseSequentially_sees_earlier_attributes(self):
+        """ Test that attributes see earlier attributes over the bindings, and later ones do not """
+        parsed = parse_expressions_sequentially_replacing_bindings(
+            {'depth': 'depth * 2', 'size': 'depth * width', 'width': 'width + 1'},
+            {'depth': 8, 'width': 4}, 'test', propagate_keys=False)
+        self.assertEqual(parsed, {'depth': 16, 'size': 64, 'width': 5})
+        self.assertEqual(list(parsed), ['depth', 'size', 'width'])
+
+    def test_ParseSequentially_forward_references(self):
+        """ Test that attributes can not reference later attributes that are not bound """
+        with self.assertRaisesRegex(ArithmeticError, '"size" references width, depth, which'):
+            parse_expressions_sequentially_replacing_bindings(
+                {'size': 'depth * width', 'width': 'n_bits // depth', 'depth': '2 ** 4'},
+                {'n_bits': 128}, 'test', strings_allowed=False, propagate_keys=False)
+        # A later attribute that is bound is the binding
+        parsed = parse_expressions_sequentially_replacing_bindings(
+            {'a': 'b + x', 'x': '100', 'b': 'x * 2'},
+            {'x': 1, 'b': 10}, 'test', propagate_keys=False)
+        self.assertEqual(parsed, {'a': 11, 'x': 100, 'b': 200})
+
+    def test_ParseSequentially_legacy_strings(self):
+        """ Test that inputs before version 0.4 treat names that are not defined yet as strings """
+        accelergy.version.INPUT_VERSION = 0.3
+        parsed = parse_expressions_sequentially_replacing_bindings(
+            {'a': 'b*2', 'b': 3}, {}, 'test', propagate_keys=False)
+        self.assertEqual(parsed, {'a': 'b*2', 'b': 3})
+
+    def test_ParseSequentially_cycle(self):
+        """ Test that attributes referencing each other are reported """
+        with self.assertRaisesRegex(ArithmeticError, 'cycle: a -> b -> a'):
+            parse_expressions_sequentially_replacing_bindings(
+                {'c': '1', 'a': 'b + 1', 'b': 'a + 1'}, {}, 'test',
+                strings_allowed=False, propagate_keys=False)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_ParseExpression_arrays(self):
+        """ Test that expressions of arrays are evaluated elementwise as for each element """
+        depths = [64, 100, 1024, 65536]
+        for expression in ['max(1, ceil(depth / n_banks))', 'ceil(log2(depth)) * width',
+                           'round(sqrt(depth))', 'min(depth, 1000)', 'factorial(depth % 5)',
+                           'width + 1']:
+            bindings = {'depth': numpy.array(depths), 'width': 8, 'n_banks': 3}
+            swept = parse_expression_for_arithmetic(expression, bindings, 'test')
+            for i, depth in enumerate(depths):
+                bindings['depth'] = depth
+                expected = parse_expression_for_arithmetic(expression, bindings, 'test')
+                value = swept.tolist()[i] if isinstance(swept, numpy.ndarray) else swept
+                self.assertEqual(value, expected)
+                self.assertIs(type(value), type(expected))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,78 @@
+import unittest
+
+from accelergy.plug_in_interface.estimator import Estimator, actionDynamicEnergy
+from accelergy.plug_in_interface.estimator_wrapper import EstimatorWrapper
+from accelergy.plug_in_interface.plug_in_index import PlugInIndex
+from accelergy.plug_in_interface.query_plug_ins import get_best_estimate
+from plug_in_helpers import Adder, FakePlugIn, make_query
+
+
+class CountingEstimator(Estimator):
+    name = ["regfile", "register"]
+    percent_accuracy_0_to_100 = 80
+    n_inits = 0
+
+    def __init__(self, width: int):
+        super().__init__()
+        CountingEstimator.n_inits += 1
+        self.width = width
+
+    @actionDynamicEnergy
+    def read(self):
+        return self.width * 1e-12
+
+    def get_area(self):
+        return self.width * 1e-12
+
+    def leak(self, global_cycle_seconds: float):
+        return 0
+
+
+class TestPlugInIndex(unittest.TestCase):
+    def setUp(self):
+        self.anything = FakePlugIn("anything", 1)
+        self.regfile = EstimatorWrapper(CountingEstimator, "CountingEstimator")
+        self.adder = EstimatorWrapper(Adder, "Adder")
+        self.index = PlugInIndex([self.adder, self.anything, self.regfile])
+
+    def test_candidates(self):
+        """Python plug-ins are only candidates for their classes and actions"""
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(list(self.index), [self.adder, self.anything, self.regfile])
+        self.assertEqual(
+            self.index.get_candidates("regfile", "read"), [self.anything, self.regfile]
+        )
+        self.assertEqual(
+            self.index.get_candidates("register"), [self.anything, self.regfile]
+        )
+        self.assertEqual(
+            self.index.get_candidates("regfile", "leak"), [self.anything, self.regfile]
+        )
+        self.assertEqual(self.index.get_candidates("regfile", "add"), [self.anything])
+        self.assertEqual(self.index.get_candidates("SRAM"), [self.anything])
+
+    def test_irrelevant_plug_ins_are_not_queried(self):
+        CountingEstimator.n_inits = 0
+        e = get_best_estimate(self.index, make_query("regfile", "read", width=8), True)
+        self.assertEqual(e.get_value(), 8e-12)
+        self.assertEqual(e.estimator_name, "CountingEstimator")
+        get_best_estimate(self.index, make_query("adder", None, width=8), False)
+        self.assertEqual(CountingEstimator.n_inits, 1)
+        self.assertEqual(self.anything.n_accuracy_calls, 2)
+
+    def test_same_choice_as_unindexed(self):
+        """Indexing does not change which plug-in is chosen"""
+        for query, is_energy in [
+            (make_query("regfile", "read", width=8), True),
+            (make_query("adder", "add", width=8), True),
+            (make_query("register", None, width=8), False),
+            (make_query("SRAM", "read", width=8), True),
+        ]:
+            indexed = get_best_estimate(self.index, query, is_energy)
+            unindexed = get_best_estimate(list(self.index), query, is_energy)
+            self.assertEqual(indexed.estimator_name, unindexed.estimator_name)
+            self.assertEqual(indexed.get_value(), unindexed.get_value())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from accelergy.plug_in_interface.estimation_cache import get_plug_in_source_hash
+from accelergy.plug_in_interface.estimator_wrapper import (
+    EstimatorWrapper,
+    LazyEstimatorWrapper,
+)
+from accelergy.plug_in_interface.plug_in_manifest import PlugInManifest
+from accelergy.plug_in_interface.query_plug_ins import get_best_estimate
+from accelergy.plug_in_path_to_obj import plug_in_path_to_obj
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUG_IN_PATH = os.path.join(TEST_DIR, "..", "plugin_choices", "plugins", "plugins.py")
+
+QUERY = {
+    "class_name": "component",
+    "attributes": {"technology": "45nm", "global_cycle_seconds": 1e-9},
+    "action_name": "action_a",
+    "arguments": {},
+}
+
+
+class TestPlugInManifest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.plug_in_dir = tempfile.mkdtemp()
+        self.plug_in_path = os.path.join(self.plug_in_dir, "plugins.py")
+        shutil.copy(PLUG_IN_PATH, self.plug_in_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+        shutil.rmtree(self.plug_in_dir)
+
+    def load(self):
+        manifest = PlugInManifest(self.cache_dir)
+        plug_ins = plug_in_path_to_obj([], [self.plug_in_dir], manifest=manifest)
+        manifest.save()
+        return plug_ins
+
+    def test_unchanged_plug_ins_are_not_imported(self):
+        discovered = self.load()
+        self.assertTrue(all(isinstance(p, EstimatorWrapper) for p in discovered))
+        lazy = self.load()
+        self.assertTrue(all(isinstance(p, LazyEstimatorWrapper) for p in lazy))
+        for d, l in zip(discovered, lazy):
+            self.assertEqual(d.get_name(), l.get_name())
+            self.assertEqual(d.get_class_names(), l.get_class_names())
+            self.assertEqual(d.get_action_names(), l.get_action_names())
+            self.assertEqual(d.get_max_accuracy(), l.get_max_accuracy())
+            self.assertEqual(get_plug_in_source_hash(d), get_plug_in_source_hash(l))
+        self.assertIsNone(lazy[0].module._module)
+
+        estimation = get_best_estimate(lazy, QUERY, True)
+        expected = get_best_estimate(discovered, QUERY, True)
+        self.assertEqual(estimation.estimator_name, expected.estimator_name)
+        self.assertEqual(estimation.get_value(), expected.get_value())
+        self.assertIsNotNone(lazy[0].module._module)
+        # All estimators of a module share the imported module
+        self.assertEqual(len({id(p.module) for p in lazy}), 1)
+
+    def test_changed_file_is_imported(self):
+        self.load()
+        with open(self.plug_in_path, "a") as f:
+            f.write("\n# Changed\n")
+        self.assertTrue(
+            all(isinstance(p, EstimatorWrapper) for p in self.load()),
+        )
+        self.assertTrue(
+            all(isinstance(p, LazyEstimatorWrapper) for p in self.load()),
+        )
+
+    def test_touched_file_is_not_imported(self):
+        self.load()
+        stat = os.stat(self.plug_in_path)
+        os.utime(self.plug_in_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertTrue(
+            all(isinstance(p, LazyEstimatorWrapper) for p in self.load()),
+        )
+
+    def test_new_files_are_found(self):
+        n_plug_ins = len(self.load())
+        shutil.copy(PLUG_IN_PATH, os.path.join(self.plug_in_dir, "more_plugins.py"))
+        self.assertEqual(len(self.load()), n_plug_ins * 2)
+
+    def test_corrupt_manifest(self):
+        self.load()
+        with open(os.path.join(self.cache_dir, "plug_in_manifest.json"), "w") as f:
+            f.write("{")
+        self.assertTrue(all(isinstance(p, EstimatorWrapper) for p in self.load()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import logging
+import unittest
+from unittest import mock
+
+from accelergy.plug_in_interface.interface import AccuracyEstimation
+import accelergy.plug_in_interface.query_plug_ins as query_plug_ins
+from accelergy.plug_in_interface.query_plug_ins import (
+    DECLINED_QUERIES,
+    get_best_estimate,
+)
+from accelergy.system_state import SystemState
+from plug_in_helpers import FakePlugIn, make_query
+
+
+class ShapePlugIn(FakePlugIn):
+    """Declines queries that do not provide a depth attribute."""
+
+    support_depends_on_values = False
+
+    def primitive_action_supported(self, query):
+        self.n_accuracy_calls += 1
+        if query.class_attrs.get("depth") is None:
+            self.logger.error("Missing depth")
+            return AccuracyEstimation(0)
+        return AccuracyEstimation(self.accuracy)
+
+
+QUERY = make_query(width=8)
+
+
+class TestPlugInSelection(unittest.TestCase):
+    def setUp(self):
+        self.level = logging.getLogger("").level
+        logging.getLogger("").setLevel(logging.INFO)
+        DECLINED_QUERIES.clear()
+
+    def tearDown(self):
+        logging.getLogger("").setLevel(self.level)
+
+    def test_early_exit(self):
+        """Plug-ins that can not beat a successful estimate are not queried"""
+        low = FakePlugIn("low", 50, 50)
+        high = FakePlugIn("high", 90, 90)
+        e = get_best_estimate([low, high], QUERY, True)
+        self.assertEqual(e.estimator_name, "high")
+        self.assertEqual(low.n_accuracy_calls, 0)
+
+    def test_bound_is_not_reached(self):
+        """A plug-in below its bound does not stop plug-ins that may beat it"""
+        optimistic = FakePlugIn("optimistic", 40, 90)
+        middle = FakePlugIn("middle", 60, 60)
+        low = FakePlugIn("low", 50, 50)
+        e = get_best_estimate([low, optimistic, middle], QUERY, True)
+        self.assertEqual(e.estimator_name, "middle")
+        self.assertEqual(optimistic.n_estimate_calls, 0)
+        self.assertEqual(low.n_accuracy_calls, 0)
+
+    def test_failed_estimate_falls_through(self):
+        high = FakePlugIn("high", 90, 90, fails=True)
+        low = FakePlugIn("low", 50, 50)
+        e = get_best_estimate([high, low], QUERY, True)
+        self.assertEqual(e.estimator_name, "low")
+        self.assertEqual(high.n_estimate_calls, 1)
+
+    def test_unbounded_plug_ins_are_always_queried(self):
+        high = FakePlugIn("high", 90, 90)
+        unbounded = FakePlugIn("unbounded", 1)
+        e = get_best_estimate([high, unbounded], QUERY, True)
+        self.assertEqual(e.estimator_name, "high")
+        self.assertEqual(unbounded.n_accuracy_calls, 1)
+
+    def test_ties_use_plug_in_order(self):
+        for order in [("a", "b"), ("b", "a")]:
+            plug_ins = [FakePlugIn(name, 80, 80) for name in order]
+            e = get_best_estimate(plug_ins, QUERY, False)
+            self.assertEqual(e.estimator_name, order[0])
+            self.assertEqual(plug_ins[1].n_accuracy_calls, 0)
+
+    def test_verbose_queries_all_accuracies(self):
+        logging.getLogger("").setLevel(logging.DEBUG)
+        low = FakePlugIn("low", 50, 50)
+        high = FakePlugIn("high", 90, 90)
+        e = get_best_estimate([low, high], QUERY, True)
+        self.assertEqual(e.estimator_name, "high")
+        self.assertEqual(low.n_accuracy_calls, 1)
+        self.assertEqual(low.n_estimate_calls, 0)
+
+    def test_declines_are_remembered(self):
+        shape = ShapePlugIn("shape", 90, 90)
+        fallback = FakePlugIn("fallback", 50, 50, fails=True)
+        other = FakePlugIn("other", 10)
+        for width in [8, 16, 32]:
+            query = dict(QUERY, attributes={"width": width})
+            self.assertEqual(
+                get_best_estimate([shape, fallback, other], query, True).estimator_name,
+                "other",
+            )
+        self.assertEqual(shape.n_accuracy_calls, 1)
+        # Support may depend on values, and failed estimates are not remembered
+        self.assertEqual(fallback.n_accuracy_calls, 3)
+        self.assertEqual(fallback.n_estimate_calls, 3)
+
+        query = dict(QUERY, attributes={"width": 8, "depth": 4})
+        e = get_best_estimate([shape], query, True)
+        self.assertEqual(e.estimator_name, "shape")
+        self.assertEqual(shape.n_accuracy_calls, 2)
+
+    def test_remembered_declines_keep_messages(self):
+        logging.getLogger("").setLevel(logging.DEBUG)
+        shape = ShapePlugIn("shape", 90, 90)
+        query = dict(QUERY, attributes={"width": 4})
+        for _ in range(2):
+            with self.assertLogs("Accelergy", logging.DEBUG) as logs:
+                get_best_estimate([shape, FakePlugIn("other", 10)], query, True)
+            self.assertTrue(any("Missing depth" in l for l in logs.output))
+        self.assertEqual(shape.n_accuracy_calls, 1)
+
+    def test_remembered_declines_are_cleared(self):
+        shape = ShapePlugIn("shape", 90, 90)
+        with mock.patch.object(query_plug_ins, "DECLINED_QUERIES_MAX_SIZE", 2):
+            for i in range(4):
+                query = dict(QUERY, attributes={f"width{i}": 8})
+                get_best_estimate([shape, FakePlugIn("other", 10)], query, True)
+                self.assertLessEqual(len(DECLINED_QUERIES), 2)
+        self.assertTrue(any(key[0] is shape for key in DECLINED_QUERIES))
+        # Adding plug-ins releases the declines of the previous plug-ins
+        SystemState().add_plug_ins([])
+        self.assertEqual(len(DECLINED_QUERIES), 0)
+
+    def test_log_text_is_built_when_emitted(self):
+        logging.getLogger("").setLevel(logging.WARNING)
+        plug_ins = [FakePlugIn("high", 90, 90, fails=True), FakePlugIn("low", 50)]
+        with mock.patch(
+            "accelergy.plug_in_interface.query_plug_ins.indent_list_text_block"
+        ) as indent:
+            get_best_estimate(plug_ins, QUERY, True)
+        indent.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
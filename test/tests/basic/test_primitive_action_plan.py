@@ -0,0 +1,137 @@
+import logging
+import unittest
+
+from accelergy.arch_dict_2_obj import ArchComp
+from accelergy.component_class import ComponentClass
+from accelergy.compound_component import CompoundComponent
+from accelergy.ERT_generator import EnergyReferenceTableGenerator
+from accelergy.plug_in_interface.estimator_wrapper import EstimatorWrapper
+from accelergy.plug_in_interface.plug_in_index import PlugInIndex
+from accelergy.primitive_action_plan import PrimitiveActionPlan
+from plug_in_helpers import Adder, make_query
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def make_plan():
+    plan = PrimitiveActionPlan()
+    plan.add_row(
+        "a",
+        [
+            (make_query("adder", "add", width=8), 8, "x"),
+            (make_query("adder", "add", width=16), 1, "y"),
+        ],
+    )
+    plan.add_row("b", [])
+    plan.add_row("c", [(make_query("adder", "add", width=16), 0.5, "z")])
+    return plan
+
+
+def make_cc(name, width):
+    cc_class = ComponentClass(
+        {
+            "name": "pe",
+            "attributes": {"width": 8},
+            "subcomponents": [
+                {
+                    "name": "adder[0..3]",
+                    "class": "adder",
+                    "attributes": {"width": "width"},
+                    "area_scale": None,
+                    "energy_scale": None,
+                },
+                {
+                    "name": "wide_adder",
+                    "class": "adder",
+                    "attributes": {"width": "width * 2"},
+                    "area_scale": None,
+                    "energy_scale": None,
+                },
+            ],
+            "actions": [
+                {
+                    "name": "compute",
+                    "subcomponents": [
+                        {
+                            "name": "adder[0..3]",
+                            "actions": [{"name": "add", "energy_scale": 2}],
+                        },
+                        {"name": "wide_adder", "actions": [{"name": "add"}]},
+                    ],
+                },
+                {"name": "idle", "subcomponents": []},
+            ],
+        }
+    )
+    pc_class = ComponentClass(
+        {"name": "adder", "attributes": {"width": 1}, "actions": [{"name": "add"}]}
+    )
+    attributes = {"technology": "45nm", "global_cycle_seconds": 1e-9, "width": width}
+    return CompoundComponent(
+        {
+            "component": ArchComp(
+                {"name": name, "class": "pe", "attributes": attributes}
+            ),
+            "pc_classes": {"adder": pc_class},
+            "cc_classes": {"pe": cc_class},
+        }
+    )
+
+
+class TestPrimitiveActionPlan(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_rows(self):
+        plan = make_plan()
+        self.assertEqual(plan.shape, (3, 2))
+        self.assertEqual((plan.indptr, plan.indices), ([0, 2, 2, 3], [0, 1, 1]))
+        self.assertEqual(plan.get_row(2), [(1, 0.5, "z")])
+        self.assertEqual(plan.get_column_values(["x", "y", "z"]), ["x", "y"])
+        self.assertEqual(plan.multiply([1, 10]), [18, 0, 5])
+        self.assertEqual(plan.multiply([2, 0]), [16, 0, 0])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_multiply_array(self):
+        plan = make_plan()
+        energies = numpy.array([1.0, 10.0])
+        self.assertEqual(plan.multiply(energies).tolist(), plan.multiply([1, 10]))
+
+    def test_compound_actions(self):
+        ccs = {name: make_cc(name, width) for name, width in [("pe0", 8), ("pe1", 8)]}
+        generator = EnergyReferenceTableGenerator(
+            {
+                "pcs": {},
+                "ccs": ccs,
+                "parser_version": "0.4",
+                "precision": 6,
+                "plug_ins": PlugInIndex([EstimatorWrapper(Adder, "Adder")]),
+            }
+        )
+        plan = generator.get_primitive_action_plan()
+        # Both components use the same two primitive actions
+        self.assertEqual(plan.shape, (4, 2))
+        self.assertEqual(plan.multiply([8, 16]), [80, 0, 80, 0])
+        entry = generator.get_ERT().get_ERT_entry("pe1")
+        self.assertEqual(entry.get_ERT_entry_dict_rep()["actions"][0]["energy"], 80)
+        # The breakdown reports each primitive action
+        breakdown, _ = entry.get_ERT_summary_verbose_dict_rep()[
+            "primitive_estimation(s)"
+        ]
+        self.assertEqual(
+            [
+                (e["subcomponent_name"], e["energy"], e["interpreted_energy"])
+                for e in breakdown["subaction_estimations"]
+            ],
+            [("adder[0..3]", 8, 64), ("wide_adder", 16, 16)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
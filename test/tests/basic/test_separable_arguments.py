@@ -0,0 +1,143 @@
+import logging
+import unittest
+
+from accelergy.arch_dict_2_obj import ArchComp
+from accelergy.component_class import ComponentClass
+from accelergy.ERT_generator import ERT_dict_to_obj, EnergyReferenceTableGenerator
+from accelergy.plug_in_interface.estimator import (
+    Estimator,
+    actionDynamicEnergy,
+    separableArguments,
+)
+from accelergy.plug_in_interface.estimator_wrapper import (
+    EstimatorWrapper,
+    LazyEstimatorWrapper,
+)
+from accelergy.plug_in_interface.plug_in_index import PlugInIndex
+from accelergy.primitive_component import PrimitiveComponent
+
+
+class AdditiveSRAM(Estimator):
+    name = "sram"
+    percent_accuracy_0_to_100 = 90
+    calls = []
+
+    def __init__(self, width: int):
+        super().__init__()
+        self.width = width
+
+    @actionDynamicEnergy
+    @separableArguments("address_delta", "data_delta")
+    def read(self, address_delta: int, data_delta: int, bank: int = 0) -> float:
+        type(self).calls.append((address_delta, data_delta, bank))
+        return (self.width + 3 * address_delta + 5 * data_delta + 100 * bank) * 1e-12
+
+    def get_area(self) -> float:
+        return 1e-12
+
+    def leak(self, global_cycle_seconds: float) -> float:
+        return 0
+
+
+class SRAM(AdditiveSRAM):
+    calls = []
+
+    @actionDynamicEnergy
+    def read(self, address_delta: int, data_delta: int, bank: int = 0) -> float:
+        return super().read(address_delta, data_delta, bank)
+
+
+def make_pc(arguments):
+    component_class = ComponentClass(
+        {
+            "name": "sram",
+            "attributes": {},
+            "actions": [{"name": "read", "arguments": arguments}],
+        }
+    )
+    attributes = {"width": 8, "technology": "45nm", "global_cycle_seconds": 1e-9}
+    arch_component = ArchComp(
+        {"name": "buf", "class": "sram", "attributes": attributes}
+    )
+    return PrimitiveComponent(
+        {"component": arch_component, "pc_class": component_class}
+    )
+
+
+def generate_ERT(estimator_cls, pc, compact_ERT=False):
+    estimator_cls.calls.clear()
+    return EnergyReferenceTableGenerator(
+        {
+            "pcs": {pc.get_name(): pc},
+            "ccs": {},
+            "parser_version": "0.4",
+            "precision": 6,
+            "plug_ins": PlugInIndex([EstimatorWrapper(estimator_cls, "SRAM")]),
+            "compact_ERT": compact_ERT,
+        }
+    ).get_ERT()
+
+
+def get_energies(ert):
+    return {
+        tuple(sorted(entry["arguments"].items())): entry["energy"]
+        for table in ert.get_ERT()["ERT"]["tables"]
+        for entry in table["actions"]
+    }
+
+
+class TestSeparableArguments(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_declared_arguments(self):
+        wrapper = EstimatorWrapper(AdditiveSRAM, "AdditiveSRAM")
+        self.assertEqual(
+            wrapper.get_separable_arguments("read"), ("address_delta", "data_delta")
+        )
+        self.assertEqual(wrapper.get_separable_arguments("leak"), ())
+        self.assertEqual(
+            EstimatorWrapper(SRAM, "SRAM").get_separable_arguments("read"), ()
+        )
+        lazy = LazyEstimatorWrapper(None, "AdditiveSRAM", wrapper.get_description())
+        self.assertEqual(
+            lazy.get_separable_arguments("read"), ("address_delta", "data_delta")
+        )
+
+    def test_estimated_along_each_axis(self):
+        arguments = {"address_delta": "0..15", "data_delta": "0..7", "bank": "0..1"}
+        separable = generate_ERT(AdditiveSRAM, make_pc(arguments))
+        # Each bank is estimated at the base point and along both axes
+        self.assertEqual(len(AdditiveSRAM.calls), 2 * (1 + 15 + 7))
+        full = generate_ERT(SRAM, make_pc(arguments))
+        self.assertEqual(len(SRAM.calls), 16 * 8 * 2)
+        self.assertEqual(separable.get_ERT(), full.get_ERT())
+
+    def test_compact_tables(self):
+        arguments = {"address_delta": "0..3", "data_delta": "0..2"}
+        ert = generate_ERT(AdditiveSRAM, make_pc(arguments), compact_ERT=True)
+        (table,) = ert.get_ERT()["ERT"]["tables"][0]["actions"]
+        self.assertEqual(table["arguments"]["address_delta"], 0)
+        self.assertEqual(table["energy"], 8)
+        self.assertEqual(
+            table["argument_energies"]["address_delta"], {0: 0, 1: 3, 2: 6, 3: 9}
+        )
+        self.assertEqual(table["argument_energies"]["data_delta"], {0: 0, 1: 5, 2: 10})
+        # Compact tables are read back as an entry for every combination
+        reloaded = ERT_dict_to_obj(
+            {
+                "ERT_dict": {"buf": {"read": [table]}},
+                "parser_version": "0.4",
+                "precision": 6,
+            }
+        )
+        full = generate_ERT(AdditiveSRAM, make_pc(arguments))
+        self.assertEqual(get_energies(reloaded), get_energies(full))
+        self.assertEqual(len(get_energies(reloaded)), 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import accelergy.version as version
+from accelergy.component_class import ComponentClass
+from accelergy.parsing_utils import interpret_component_list
+from accelergy.plug_in_interface.estimator import Estimator, actionDynamicEnergy
+from accelergy.plug_in_interface.estimator_wrapper import EstimatorWrapper
+from accelergy.raw_inputs_2_dicts import RawInputs2Dicts
+from accelergy.sweep import (
+    Sweep,
+    get_sweep_points,
+    parse_sweep_values,
+    write_sweep_csv,
+)
+from accelergy.system_state import SystemState
+
+ARCH = """
+variables:
+  version: 0.4
+  technology: "45nm"
+  global_cycle_seconds: 1e-9
+  depth: 1024
+  n_PEs: 2
+
+architecture:
+  version: 0.4
+  subtree:
+  - name: system
+    attributes: {width: 16}
+    local:
+    - name: buffer
+      class: buffer
+      attributes: {depth: depth}
+    subtree:
+    - name: PE[0..n_PEs-1]
+      local:
+      - name: scratchpad
+        class: buffer
+        attributes: {depth: 16}
+"""
+
+COMPONENTS = """
+compound_components:
+  version: 0.4
+  classes:
+  - name: buffer
+    attributes: {technology: must_specify, width: 16, depth: 1024}
+    subcomponents:
+    - name: storage
+      class: sweep_sram
+      attributes: {width: width, depth: depth}
+    actions:
+    - name: read
+      subcomponents:
+      - {name: storage, actions: [{name: read}]}
+"""
+
+
+class SweepSRAM(Estimator):
+    name = "sweep_sram"
+    percent_accuracy_0_to_100 = 90
+    n_initialized = 0
+
+    def __init__(self, width: int, depth: int):
+        super().__init__()
+        type(self).n_initialized += 1
+        self.width, self.depth = width, depth
+
+    @actionDynamicEnergy
+    def read(self) -> float:
+        return self.width * self.depth * 1e-15
+
+    def get_area(self) -> float:
+        return self.width * self.depth * 1e-12
+
+    def leak(self, global_cycle_seconds: float) -> float:
+        return 0
+
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        self.dir.cleanup()
+
+    def test_parse_sweep_values(self):
+        self.assertEqual(
+            parse_sweep_values("depth=64:1024:x4"), ("depth", [64, 256, 1024])
+        )
+        self.assertEqual(parse_sweep_values("depth=64:1000:x4"), ("depth", [64, 256]))
+        self.assertEqual(parse_sweep_values("n=1:7:3"), ("n", [1, 4, 7]))
+        self.assertEqual(parse_sweep_values("n=1:3"), ("n", [1, 2, 3]))
+        self.assertEqual(parse_sweep_values("v=0.5:1.5:0.5"), ("v", [0.5, 1.0, 1.5]))
+        self.assertEqual(
+            parse_sweep_values("technology=45nm, 32nm"),
+            ("technology", ["45nm", "32nm"]),
+        )
+        for spec in ["depth", "depth=64:x2", "depth=64:1:1", "depth=1:64:x1"]:
+            with self.assertRaises(ValueError):
+                parse_sweep_values(spec)
+
+    def test_sweep_points(self):
+        self.assertEqual(
+            get_sweep_points({"a": [1, 2], "b": ["x", "y"]}),
+            [
+                {"a": 1, "b": "x"},
+                {"a": 1, "b": "y"},
+                {"a": 2, "b": "x"},
+                {"a": 2, "b": "y"},
+            ],
+        )
+
+    def make_sweep(self, jobs):
+        paths = []
+        for name, content in [("arch.yaml", ARCH), ("components.yaml", COMPONENTS)]:
+            paths.append(os.path.join(self.dir.name, name))
+            with open(paths[-1], "w") as f:
+                f.write(content)
+        raw_dicts = RawInputs2Dicts(
+            {
+                "path_arglist": paths,
+                "parser_version": version.__version__,
+                "keep_architecture_inputs": True,
+            }
+        )
+        system_state = SystemState()
+        for cc_info in raw_dicts.get_cc_classses().values():
+            system_state.add_cc_class(ComponentClass(cc_info))
+        system_state.add_plug_ins([EstimatorWrapper(SweepSRAM, "SweepSRAM")])
+        return Sweep(
+            {
+                "raw_dicts": raw_dicts,
+                "system_state": system_state,
+                "parser_version": version.__version__,
+                "precision": 6,
+                "jobs": jobs,
+            }
+        )
+
+    def test_parse_changed_components(self):
+        """Points parse again only the components that depend on the swept values"""
+        raw_dicts = self.make_sweep(1).raw_dicts
+        # Components in parsing order: the scratchpad of the PE subtree, then the buffer
+        self.assertEqual(raw_dicts.get_changed_components({"depth"}), [False, True])
+        self.assertEqual(raw_dicts.get_changed_components({"n_PEs"}), [True, False])
+        self.assertEqual(raw_dicts.get_changed_components({"width"}), [True, True])
+        self.assertEqual(raw_dicts.get_changed_components({"other"}), [False, False])
+
+        with mock.patch(
+            "accelergy.raw_inputs_2_dicts.interpret_component_list",
+            wraps=interpret_component_list,
+        ) as interpret:
+            components = raw_dicts.with_variables(
+                {"depth": 64}
+            ).get_flatten_arch_spec_dict()["components"]
+        # The PE subtree and the buffer
+        self.assertEqual(interpret.call_count, 2)
+        self.assertEqual(
+            {name: c["attributes"]["depth"] for name, c in components.items()},
+            {"system.PE[0..1].scratchpad": 16, "system.buffer": 64},
+        )
+        components = raw_dicts.with_variables(
+            {"n_PEs": 4}
+        ).get_flatten_arch_spec_dict()["components"]
+        self.assertEqual(
+            list(components), ["system.PE[0..3].scratchpad", "system.buffer"]
+        )
+        self.assertEqual(components["system.buffer"]["attributes"]["depth"], 1024)
+
+    def test_sweep(self):
+        points = get_sweep_points({"depth": [1024, 4096], "n_PEs": [2, 4]})
+        for jobs in [1, 3]:
+            SweepSRAM.n_initialized = 0
+            sweep = self.make_sweep(jobs)
+            rows = sweep.run(points)
+            self.assertEqual(
+                [(r["point"], r["component"], r["area"]) for r in rows],
+                [
+                    (i, name, area)
+                    for i, depth in [(0, 1024), (1, 1024), (2, 4096), (3, 4096)]
+                    for name, area in [
+                        (f"system.PE[0..{3 if i % 2 else 1}].scratchpad", 256),
+                        ("system.buffer", 16 * depth),
+                    ]
+                ],
+            )
+            self.assertEqual(rows[-1]["energy.read"], 65.536)
+            self.assertEqual((rows[-1]["depth"], rows[-1]["n_PEs"]), (4096, 4))
+            # Points share the expansions of unchanged components and the estimations
+            self.assertEqual(len(sweep.system_state.cc_expansions), 3)
+            if jobs == 1:
+                self.assertEqual(SweepSRAM.n_initialized, 3)
+
+        path = os.path.join(self.dir.name, "sweep.csv")
+        write_sweep_csv(path, rows)
+        with open(path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], "point,depth,n_PEs,component,area,energy.read")
+        self.assertEqual(lines[-1], "3,4096,4,system.buffer,65536.0,65.536")
+
+    def test_points_copy_shared_expansions(self):
+        """Points do not share the arguments that generating the ERT adds keys to"""
+        sweep = self.make_sweep(1)
+        first, second = (sweep.evaluate({"depth": 1024}) for _ in range(2))
+        (first_read,) = first.ccs["system.buffer"].get_actions()
+        (second_read,) = second.ccs["system.buffer"].get_actions()
+        self.assertIsNot(first_read.get_arguments(), second_read.get_arguments())
+        ((_, first_storage_read),) = first_read.get_primitive_list()
+        ((_, second_storage_read),) = second_read.get_primitive_list()
+        self.assertIsNot(first_storage_read, second_storage_read)
+        self.assertIsNot(
+            first_storage_read.get_arguments(), second_storage_read.get_arguments()
+        )
+        self.assertEqual(
+            first_storage_read.get_arguments(), second_storage_read.get_arguments()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()